@@ -31,6 +31,11 @@ from .gcode_utils import (
 from .model import OpType, Operation
 
 
+# O-Wort-Subroutinen im erzeugten Code: "o<100> sub" ... "o<100> endsub".
+_SUB_START_RE = re.compile(r"^o\s*<?\s*(\d+)\s*>?\s+sub\b", re.IGNORECASE)
+_SUB_END_RE = re.compile(r"^o\s*<?\s*(\d+)\s*>?\s+endsub\b", re.IGNORECASE)
+
+
 def gcode_from_path(path, feed: float, safe_z: float) -> List[str]:
     lines: List[str] = []
     if not path:
@@ -230,13 +235,15 @@ def generate_program_gcode(operations: List[Operation], program_settings: Dict[s
         i = 0
         while i < len(block_lines):
             line = block_lines[i].strip()
-            m = re.match(r"^o\s*<?\s*(\d+)\s*>?\s+sub\b", line, flags=re.IGNORECASE)
+            m = _SUB_START_RE.match(line)
             if m:
+                sub_id = m.group(1)
                 sub_block = [block_lines[i]]
                 i += 1
                 while i < len(block_lines):
                     sub_block.append(block_lines[i])
-                    if re.match(rf"^o\s*<?\s*{re.escape(m.group(1))}\s*>?\s+endsub\b", block_lines[i].strip(), flags=re.IGNORECASE):
+                    end = _SUB_END_RE.match(block_lines[i].strip())
+                    if end is not None and end.group(1) == sub_id:
                         i += 1
                         break
                     i += 1
@@ -301,22 +308,25 @@ def generate_program_gcode(operations: List[Operation], program_settings: Dict[s
         all_subs.append(step_line_pause_sub_definition())
     if settings.get("needs_step_x_pause_sub"):
         all_subs.append(step_x_pause_sub_definition())
-    if any(op.op_type == OpType.GROOVE for op in operations):
-        all_subs.append(groove_sub_definition())
-
-    main_flow_lines: List[str] = []
-    if handler_header_lines:
-        has_tool = any(get_tool_number(op.params) > 0 for op in operations if op.op_type not in (OpType.PROGRAM_HEADER, OpType.CONTOUR))
-        if not has_tool:
-            main_flow_lines.extend(handler_header_lines)
+    # Ein Durchlauf: Einstechen vorhanden? Erstes Werkzeug im Ablauf?
+    has_groove = False
     first_tool = 0
     for op in operations:
-        if op.op_type in (OpType.PROGRAM_HEADER, OpType.CONTOUR):
-            continue
-        tval = get_tool_number(op.params)
-        if tval > 0:
-            first_tool = tval
+        op_type = op.op_type
+        if op_type == OpType.GROOVE:
+            has_groove = True
+        if first_tool == 0 and op_type not in (OpType.PROGRAM_HEADER, OpType.CONTOUR):
+            tval = get_tool_number(op.params)
+            if tval > 0:
+                first_tool = tval
+        if has_groove and first_tool > 0:
             break
+    if has_groove:
+        all_subs.append(groove_sub_definition())
+
+    main_flow_lines: List[str] = []
+    if handler_header_lines and first_tool == 0:
+        main_flow_lines.extend(handler_header_lines)
     if first_tool > 0 and int(float(settings.get("_current_tool", 0))) == 0:
         pre_tool_lines: List[str] = []
         append_tool_and_spindle(pre_tool_lines, first_tool, None, settings)
@@ -348,19 +358,18 @@ def generate_program_gcode(operations: List[Operation], program_settings: Dict[s
                     op.path = []
         main_flow_lines.append("")
         op_title = sanitize_comment_text(op.params.get("title", op.op_type))
-        tool_val = get_tool_number(op.params)
+        tool_val = op_tool
         tools = settings.get("tools", {})
         tool_desc = ""
         if tool_val > 0 and tool_val in tools:
             tool_desc = f" | T{tool_val}: {sanitize_comment_text(tools[tool_val].get('comment', ''))}"
         op_lines = _extract_sub_blocks(gcode_for_operation(op, settings))
-        if op_lines and any(not line.startswith("(") for line in op_lines):
-            main_flow_lines.append(f"(Step {step_num}: {op_title}{tool_desc})")
-            main_flow_lines.extend(op_lines)
-        elif op_lines and op.op_type != OpType.CONTOUR:
+        # Enthält der Schritt mehr als Kommentare? (einmal prüfen, zweimal nutzen)
+        has_motion = any(not line.startswith("(") for line in op_lines)
+        if op_lines and (has_motion or op.op_type != OpType.CONTOUR):
             main_flow_lines.append(f"(Step {step_num}: {op_title}{tool_desc})")
             main_flow_lines.extend(op_lines)
-        if op_lines and any(not line.startswith("(") for line in op_lines) and op.op_type not in (OpType.CONTOUR, OpType.PROGRAM_HEADER):
+        if has_motion and op.op_type not in (OpType.CONTOUR, OpType.PROGRAM_HEADER):
             emit_safe_retract_for_op(main_flow_lines, settings, op.op_type, current_pos=estimate_operation_end_pos(op))
 
     lines: List[str] = []
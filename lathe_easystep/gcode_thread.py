@@ -6,6 +6,7 @@ from .model import Operation
 
 
 THREAD_ORIENTATION_LABELS: Tuple[str, str] = ("Aussen", "Innen")
+_THREAD_ORIENT_MAX = len(THREAD_ORIENTATION_LABELS) - 1
 
 
 def generate_thread_gcode(
@@ -61,7 +62,11 @@ def generate_thread_gcode(
     orientation_raw = op.params.get("orientation", 0)
     orientation_idx = 0
     if isinstance(orientation_raw, (int, float)):
-        orientation_idx = max(0, min(int(orientation_raw), len(THREAD_ORIENTATION_LABELS) - 1))
+        orientation_idx = int(orientation_raw)
+        if orientation_idx < 0:
+            orientation_idx = 0
+        elif orientation_idx > _THREAD_ORIENT_MAX:
+            orientation_idx = _THREAD_ORIENT_MAX
     internal = orientation_idx == 1
     orientation_label = THREAD_ORIENTATION_LABELS[orientation_idx]
     standard_data = op.params.get("standard")
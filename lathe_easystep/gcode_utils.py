@@ -90,18 +90,22 @@ REQUIRED_KEYS = {
 }
 
 
+_UMLAUT_TRANSLIT = str.maketrans({
+    "ä": "ae",
+    "Ä": "Ae",
+    "ö": "oe",
+    "Ö": "Oe",
+    "ü": "ue",
+    "Ü": "Ue",
+    "ß": "ss",
+})
+
+
 def sanitize_gcode_text(text: str) -> str:
-    translit = {
-        "ä": "ae",
-        "Ä": "Ae",
-        "ö": "oe",
-        "Ö": "Oe",
-        "ü": "ue",
-        "Ü": "Ue",
-        "ß": "ss",
-    }
-    for src, repl in translit.items():
-        text = text.replace(src, repl)
+    # Der Normalfall (reines ASCII) braucht weder Umschrift noch Ersatz.
+    if text.isascii():
+        return text
+    text = text.translate(_UMLAUT_TRANSLIT)
     try:
         text.encode("ascii")
         return text
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import copy
 from dataclasses import dataclass, field
 from typing import Callable, Dict, List
 
@@ -24,7 +25,15 @@ class Operation:
     path: list = field(default_factory=list)
 
 
+_DEFAULT_GEOMETRY_BUILDERS: Dict[str, Callable] | None = None
+
+
 def _default_geometry_builders() -> Dict[str, Callable]:
+    # preview_geometry importiert dieses Modul; daher erst beim ersten Aufruf
+    # laden und die Tabelle dann behalten.
+    global _DEFAULT_GEOMETRY_BUILDERS
+    if _DEFAULT_GEOMETRY_BUILDERS is not None:
+        return _DEFAULT_GEOMETRY_BUILDERS
     from .preview_geometry import (
         build_abspanen_path,
         build_contour_path,
@@ -35,7 +44,7 @@ def _default_geometry_builders() -> Dict[str, Callable]:
         build_thread_path,
     )
 
-    return {
+    _DEFAULT_GEOMETRY_BUILDERS = {
         OpType.FACE: build_face_path,
         OpType.CONTOUR: build_contour_path,
         OpType.THREAD: build_thread_path,
@@ -44,6 +53,7 @@ def _default_geometry_builders() -> Dict[str, Callable]:
         OpType.KEYWAY: build_keyway_path,
         OpType.ABSPANEN: build_abspanen_path,
     }
+    return _DEFAULT_GEOMETRY_BUILDERS
 
 
 class ProgramModel:
@@ -54,27 +64,60 @@ class ProgramModel:
         gcode_generator: Callable[[List[Operation], Dict[str, object]], List[str]] | None = None,
     ):
         self.operations: List[Operation] = []
+        # Wird bei jeder Strukturänderung (hinzufügen, entfernen, verschieben)
+        # erhöht; abgeleitete Caches vergleichen nur diese Zahl.
+        self.revision: int = 0
         self.spindle_speed_max: float = 0.0
         self.program_settings: Dict[str, object] = {"emit_line_numbers": False}
         self._geometry_builders = geometry_builders
         self._gcode_generator = gcode_generator
+        # Parameterzahl je Builder, einmal per Introspektion ermittelt.
+        self._builder_argc: Dict[Callable, int] = {}
 
     def add_operation(self, op: Operation):
         self.operations.append(op)
+        self.revision += 1
+
+    def insert_operation(self, index: int, op: Operation):
+        self.operations.insert(index, op)
+        self.revision += 1
 
     def remove_operation(self, index: int):
         if 0 <= index < len(self.operations):
             del self.operations[index]
+            self.revision += 1
+
+    def clear_operations(self):
+        self.operations.clear()
+        self.revision += 1
 
     def move_up(self, index: int):
         if 1 <= index < len(self.operations):
             self.operations[index - 1], self.operations[index] = \
                 self.operations[index], self.operations[index - 1]
+            self.revision += 1
 
     def move_down(self, index: int):
         if 0 <= index < len(self.operations) - 1:
             self.operations[index + 1], self.operations[index] = \
                 self.operations[index], self.operations[index + 1]
+            self.revision += 1
+
+    def snapshot(self) -> "ProgramModel":
+        """Abgekoppelte Kopie, z. B. für die G-Code-Erzeugung im Hintergrund.
+
+        Operationen und Einstellungen werden tief kopiert; spätere Eingaben im
+        Formular ändern das Ergebnis einer laufenden Erzeugung nicht.
+        """
+        clone = ProgramModel(
+            geometry_builders=self._geometry_builders,
+            gcode_generator=self._gcode_generator,
+        )
+        clone.operations = copy.deepcopy(self.operations)
+        clone.revision = self.revision
+        clone.spindle_speed_max = self.spindle_speed_max
+        clone.program_settings = copy.deepcopy(self.program_settings)
+        return clone
 
     def update_geometry(self, op: Operation):
         builders = self._geometry_builders or _default_geometry_builders()
@@ -83,10 +126,13 @@ class ProgramModel:
             op.path = []
             return
 
-        try:
-            argc = builder.__code__.co_argcount
-        except Exception:
-            argc = 1
+        argc = self._builder_argc.get(builder)
+        if argc is None:
+            try:
+                argc = builder.__code__.co_argcount
+            except Exception:
+                argc = 1
+            self._builder_argc[builder] = argc
 
         if argc >= 2:
             op.path = builder(op.params, self.program_settings)
@@ -24,13 +24,31 @@ def step_data_to_operation(data: Dict[str, object]) -> Operation | None:
     params_raw = data.get("params") or {}
     if not isinstance(params_raw, dict):
         params_raw = {}
-    params = {str(key): value for key, value in params_raw.items()}
+    # JSON liefert immer str-Schlüssel: dann reicht eine flache Kopie (C-Schleife)
+    params = (
+        dict(params_raw)
+        if all(type(key) is str for key in params_raw)
+        else {str(key): value for key, value in params_raw.items()}
+    )
 
     if isinstance(data.get("primitives"), list) and data.get("primitives"):
         prim = data.get("primitives") or []
         return Operation(op_type, params, list(prim))
 
-    path_data = data.get("path") or []
+    return Operation(op_type, params, _parse_path(data.get("path") or []))
+
+
+def _parse_path(path_data) -> List[Tuple[float, float]]:
+    """[[x, z], ...] aus der Step-Datei -> Punktliste.
+
+    Gespeicherte Pfade sind praktisch immer sauber: dann reicht eine
+    Comprehension ohne try pro Punkt. Erst bei einem fehlerhaften Eintrag
+    wird Eintrag für Eintrag gelesen und Ungültiges übersprungen.
+    """
+    try:
+        return [(float(e[0]), float(e[1])) for e in path_data if isinstance(e, (list, tuple))]
+    except Exception:
+        pass
     path: List[Tuple[float, float]] = []
     for entry in path_data:
         if isinstance(entry, (list, tuple)) and len(entry) >= 2:
@@ -40,7 +58,7 @@ def step_data_to_operation(data: Dict[str, object]) -> Operation | None:
             except Exception:
                 continue
             path.append((x, z))
-    return Operation(op_type, params, path)
+    return path
 
 
 def build_program_data(
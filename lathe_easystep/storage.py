@@ -1,8 +1,19 @@
 from __future__ import annotations
 
+import builtins
+import json
+import math
 import os
 import re
-from typing import Dict, List, Tuple
+import stat
+import tempfile
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Tuple
+
+try:  # optional: deutlich schnelleres (De-)Serialisieren großer Pfade
+    import orjson
+except ImportError:
+    orjson = None
 
 from .model import OpType, Operation
 
@@ -10,6 +21,8 @@ STEP_FILE_PATH_KEY = "__step_file_path"
 PROGRAM_FILE_PATH_KEY = "__program_file_path"
 GCODE_FILE_PATH_KEY = "__gcode_file_path"
 
+_STEM_UNSAFE_RE = re.compile(r"[^A-Za-z0-9_.-]+")
+
 
 def normalized_file_path(file_path: str | None) -> str | None:
     if not file_path:
@@ -34,12 +47,107 @@ def step_filename_stem(op: Operation, index_hint: int | None = None) -> str:
     base = str(params.get("name") or params.get("contour_name") or op.op_type or "step").strip()
     if not base:
         base = "step"
-    base = re.sub(r"[^A-Za-z0-9_.-]+", "_", base).strip("._") or "step"
+    base = _STEM_UNSAFE_RE.sub("_", base).strip("._") or "step"
     if index_hint is not None:
         return f"{index_hint:02d}_{base}"
     return base
 
 
+# umask einmal beim Import lesen (os.umask setzt ihn dabei kurz, nicht thread-sicher)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _replaced_file_mode(file_path: str) -> int:
+    """Rechte für die neue Datei: die der bisherigen, sonst 0666 minus umask."""
+    try:
+        return stat.S_IMODE(os.stat(file_path).st_mode)
+    except OSError:
+        return 0o666 & ~_UMASK
+
+
+@contextmanager
+def atomic_open(file_path: str, mode: str = "w", **kwargs) -> Iterator[object]:
+    """Datei über eine eigene Temp-Datei schreiben und erst am Ende per os.replace übernehmen.
+
+    Die Temp-Datei (mkstemp im Zielordner) ist je Aufruf eindeutig, so kommen
+    sich z.B. ein GcodeJob im Thread-Pool und ein synchrones Speichern auf
+    dasselbe Ziel nicht in die Quere. Vor dem Umbenennen wird sie per fsync
+    auf die Platte gebracht; bricht das Schreiben ab (Fehler, Absturz,
+    Stromausfall), bleibt die bisherige Datei unverändert. Bei Fehlern wird
+    die Temp-Datei wieder entfernt.
+    """
+    directory = os.path.dirname(os.path.abspath(file_path))
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{os.path.basename(file_path)}.", suffix=".tmp", dir=directory)
+    try:
+        try:
+            handle = os.fdopen(fd, mode, **kwargs)
+        except BaseException:
+            os.close(fd)
+            raise
+        with handle:
+            yield handle
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.chmod(tmp_path, _replaced_file_mode(file_path))
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def write_gcode_lines(file_path: str, lines: List[str]) -> None:
+    """G-Code-Zeilen atomar schreiben (ohne abschließenden Zeilenumbruch)."""
+    with atomic_open(file_path, "w", encoding="utf-8") as handle:
+        handle.write("\n".join(lines))
+
+
+def _has_non_finite(value: object) -> bool:
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite(v) for v in value)
+    return False
+
+
+def write_step_file(file_path: str, data: Dict[str, object]) -> None:
+    """Step-Daten als eingerücktes JSON schreiben (orjson, sonst json).
+
+    orjson schreibt NaN/Infinity als null; solche Daten gehen deshalb über
+    json, das die Literale NaN/Infinity erhält (read_step_file liest sie).
+    """
+    if orjson is not None and not _has_non_finite(data):
+        try:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except (TypeError, orjson.JSONEncodeError):
+            payload = None  # z.B. int > 64 Bit: json kann es
+        if payload is not None:
+            with atomic_open(file_path, "wb") as handle:
+                handle.write(payload)
+            return
+    with atomic_open(file_path, "w", encoding="utf-8") as handle:
+        json.dump(data, handle, indent=2)
+
+
+def read_step_file(file_path: str) -> object:
+    """Step-Datei lesen; liefert das geparste JSON."""
+    if orjson is not None:
+        with builtins.open(file_path, "rb") as handle:
+            raw = handle.read()
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson kennt NaN/Infinity nicht, json.dump schreibt sie aber
+            return json.loads(raw)
+    with builtins.open(file_path, "r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
 def program_file_meta(
     operations: List[Operation],
     current_program_path: str | None,
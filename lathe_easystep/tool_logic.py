@@ -6,6 +6,10 @@ import re
 
 from qtpy import QtCore, QtGui
 
+# Einmal kompiliert statt bei jedem Aufruf über den re-Cache.
+_FILENAME_STRIP_RE = re.compile(r"[^A-Za-z0-9_\-]")
+_INSERT_TOKEN_RE = re.compile(r"\b([A-Z][A-Z0-9]{2,})\b")
+
 
 def tool_combo_label(_handler, tool, max_comment: int = 32) -> str:
     comment = (tool.comment or "").strip() or "kein Kommentar"
@@ -117,7 +121,7 @@ def radius_warning_details(handler):
 def build_program_filepath(_handler, name_raw):
     base = (name_raw or "").strip() or "conv_lathe"
     base = base.replace(" ", "_")
-    base = re.sub(r"[^A-Za-z0-9_\-]", "", base) or "conv_lathe"
+    base = _FILENAME_STRIP_RE.sub("", base) or "conv_lathe"
     filename = base if base.lower().endswith(".ngc") else f"{base}.ngc"
     return os.path.expanduser(os.path.join("~/linuxcnc/nc_files", filename))
 
@@ -129,8 +133,7 @@ def infer_insert_shape_key(handler, tool) -> str:
     comment = (tool.comment or "").upper()
     if not comment:
         return ""
-    token_pattern = re.compile(r"\b([A-Z][A-Z0-9]{2,})\b")
-    for match in token_pattern.finditer(comment):
+    for match in _INSERT_TOKEN_RE.finditer(comment):
         token = match.group(1)
         if token and token[0] in handler._INSERT_SHAPE_KEYS:
             return token[0]
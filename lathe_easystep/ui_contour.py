@@ -5,59 +5,125 @@ from qtpy import QtCore, QtGui, QtWidgets
 from .contour_logic import validate_contour_segments_for_profile
 from .model import OpType
 from .preview_geometry import build_contour_path
+from .ui_widgets import signals_blocked
 
+# Entwickler-Schalter: Kontur-/Abspan-Zustand bei jedem Parting-Refresh loggen,
+# auch ohne _verbose_widget_logs.
+_DEBUG_CONTOUR = False
 
-def available_contour_names(handler):
+
+def _contour_debug_enabled(handler) -> bool:
+    return _DEBUG_CONTOUR or bool(getattr(handler, "_verbose_widget_logs", False))
+
+
+def contour_operations(handler):
+    """Kontur-Operationen in Programmreihenfolge.
+
+    Die Teilmenge wird gecacht; Schlüssel ist model.revision (jede
+    Strukturänderung über ProgramModel), dazu Listen-Identität und Länge
+    für direkte Listenzugriffe. _refresh_operation_list verwirft zusätzlich.
+    Namen werden bewusst nicht gecacht, sie ändern sich beim Editieren.
+    """
+    return _contour_cache(handler)[2]
+
+
+def contour_sequence_index(handler, target) -> int | None:
+    """Reihenindex von target unter den Konturen (None = keine Kontur)."""
+    return _contour_cache(handler)[3].get(id(target))
+
+
+def _contour_cache(handler):
+    model = handler.model
+    ops = model.operations
+    key = (getattr(model, "revision", None), id(ops), len(ops))
+    cache = getattr(handler, "_contour_ops_cache", None)
+    if cache is None or cache[0] != key:
+        indexed = [(idx, op) for idx, op in enumerate(ops) if op is not None and op.op_type == OpType.CONTOUR]
+        contours = [op for _idx, op in indexed]
+        cache = (key, indexed, contours, {id(op): seq for seq, op in enumerate(contours)})
+        handler._contour_ops_cache = cache
+    return cache
+
+
+def iter_contour_ops(handler):
+    """(Index in model.operations, Operation, aufgelöster Name) je Kontur.
+
+    Einmal pro Parting-Refresh erzeugen und an die Helfer weiterreichen,
+    statt dass jeder Helfer die Konturen erneut durchläuft.
+    """
+    return [
+        (op_idx, op, handler._contour_name_or_fallback(op, contour_idx))
+        for contour_idx, (op_idx, op) in enumerate(_contour_cache(handler)[1])
+    ]
+
+
+def available_contour_names(handler, contours=None):
     names = []
-    contour_idx = 0
-    for op in handler.model.operations:
-        if op is None or op.op_type != OpType.CONTOUR:
-            continue
-        name = handler._contour_name_or_fallback(op, contour_idx)
+    for _op_idx, _op, name in contours if contours is not None else iter_contour_ops(handler):
         if name and name not in names:
             names.append(name)
-        contour_idx += 1
-    if getattr(handler, "contour_name", None):
-        live_name = handler.contour_name.text().strip()
-        if not live_name and getattr(handler, "contour_segments", None) and handler.contour_segments.rowCount() > 0:
-            live_name = handler._fallback_contour_name(handler._contour_count())
-            try:
-                handler.contour_name.blockSignals(True)
-                handler.contour_name.setText(live_name)
-            finally:
-                handler.contour_name.blockSignals(False)
-        if live_name and live_name not in names:
-            names.append(live_name)
+    live_name = _live_contour_name(handler)
+    if live_name and live_name not in names:
+        names.append(live_name)
     return names
 
 
+def contour_name_available(handler, name: str) -> bool:
+    """Wie ``name in available_contour_names()``, bricht aber beim ersten Treffer ab."""
+    if not name:
+        return False
+    for contour_idx, (_op_idx, op) in enumerate(_contour_cache(handler)[1]):
+        if handler._contour_name_or_fallback(op, contour_idx) == name:
+            return True
+    return _live_contour_name(handler) == name
+
+
+def _live_contour_name(handler) -> str:
+    """Name der Kontur im Kontur-Tab; leer mit Segmenten -> Fallback-Name eintragen."""
+    if not getattr(handler, "contour_name", None):
+        return ""
+    live_name = handler.contour_name.text().strip()
+    if not live_name and getattr(handler, "contour_segments", None) and handler.contour_segments.rowCount() > 0:
+        live_name = handler._fallback_contour_name(handler._contour_count())
+        try:
+            handler.contour_name.blockSignals(True)
+            handler.contour_name.setText(live_name)
+        finally:
+            handler.contour_name.blockSignals(False)
+    return live_name
+
+
+def parting_contour_combo(handler):
+    """Abspan-Kontur-Combo; wird bei Bedarf einmal nachgesucht und gebunden."""
+    combo = getattr(handler, "parting_contour", None)
+    if combo is None:
+        combo = handler.parting_contour = handler._get_widget_by_name("parting_contour")
+    return combo
+
+
 def current_parting_contour_name(handler) -> str:
-    if getattr(handler, "parting_contour", None) is None:
-        handler.parting_contour = handler._get_widget_by_name("parting_contour")
-    if getattr(handler, "parting_contour", None) is None:
+    combo = parting_contour_combo(handler)
+    if combo is None:
         return ""
-    return handler.parting_contour.currentText().strip()
+    return combo.currentText().strip()
 
 
-def debug_contour_state(handler, context: str = "") -> None:
-    if not getattr(handler, "_verbose_widget_logs", False):
+def debug_contour_state(handler, context: str = "", contours=None) -> None:
+    if not _contour_debug_enabled(handler):
         return
     prefix = f"[LatheEasyStep][debug] parting contour ({context})" if context else "[LatheEasyStep][debug] parting contour"
     try:
+        if contours is None:
+            contours = iter_contour_ops(handler)
         op_infos = []
-        contour_idx = 0
-        for idx, op in enumerate(handler.model.operations):
-            if op.op_type != OpType.CONTOUR:
-                continue
-            name = handler._contour_name_or_fallback(op, contour_idx)
+        for contour_idx, (op_idx, op, name) in enumerate(contours):
             segs = op.params.get("segments") if isinstance(op.params, dict) else None
             seg_count = len(segs) if isinstance(segs, list) else "n/a"
             path_len = len(op.path) if getattr(op, "path", None) else 0
-            op_infos.append(f"op#{idx} contour_idx={contour_idx} name='{name}' segments={seg_count} path_len={path_len}")
-            contour_idx += 1
+            op_infos.append(f"op#{op_idx} contour_idx={contour_idx} name='{name}' segments={seg_count} path_len={path_len}")
         live_name = handler.contour_name.text().strip() if getattr(handler, "contour_name", None) else ""
         live_rows = handler.contour_segments.rowCount() if getattr(handler, "contour_segments", None) else 0
-        available = handler._available_contour_names()
+        available = handler._available_contour_names(contours)
         handler._log(prefix, level="info")
         handler._log(f"  ops: {op_infos if op_infos else 'keine Kontur-Operationen'}", level="warning")
         handler._log(f"  live contour widget name='{live_name}' rows={live_rows}", level="info")
@@ -69,16 +135,11 @@ def debug_contour_state(handler, context: str = "") -> None:
         handler._log(f"[LatheEasyStep][debug] parting contour debug failed: {exc}", level="debug")
 
 
-def resolve_contour_path(handler, contour_name: str):
+def resolve_contour_path(handler, contour_name: str, contours=None):
     if not contour_name:
         return []
-    contour_idx = 0
-    for op in handler.model.operations:
-        if op.op_type != OpType.CONTOUR:
-            continue
-        name = handler._contour_name_or_fallback(op, contour_idx)
+    for _op_idx, op, name in contours if contours is not None else iter_contour_ops(handler):
         if name != contour_name:
-            contour_idx += 1
             continue
         if not op.path:
             handler.model.update_geometry(op)
@@ -86,52 +147,87 @@ def resolve_contour_path(handler, contour_name: str):
             return list(op.path or [])
         except Exception:
             return []
-        finally:
-            contour_idx += 1
     if getattr(handler, "contour_name", None) and getattr(handler, "contour_segments", None) and handler.contour_name.text().strip() == contour_name:
         try:
-            return build_contour_path(
-                {
-                    "start_x": handler.contour_start_x.value() if getattr(handler, "contour_start_x", None) else 0.0,
-                    "start_z": handler.contour_start_z.value() if getattr(handler, "contour_start_z", None) else 0.0,
-                    "coord_mode": handler.contour_coord_mode.currentIndex() if getattr(handler, "contour_coord_mode", None) else 0,
-                    "segments": handler._collect_contour_segments(),
-                }
-            )
+            return live_contour_path(handler, live_contour_params(handler))
         except Exception:
             return []
     return []
 
 
+def live_contour_params(handler):
+    """Parameter der gerade im Kontur-Tab bearbeiteten Kontur."""
+    return {
+        "start_x": handler.contour_start_x.value() if getattr(handler, "contour_start_x", None) else 0.0,
+        "start_z": handler.contour_start_z.value() if getattr(handler, "contour_start_z", None) else 0.0,
+        "coord_mode": handler.contour_coord_mode.currentIndex() if getattr(handler, "contour_coord_mode", None) else 0,
+        "segments": handler._collect_contour_segments(),
+    }
+
+
+def live_contour_path(handler, params, builder=None):
+    """build_contour_path für die Live-Kontur, gemerkt über alle Eingaben.
+
+    Abspan-Quelle und Vorschau-Entwurf teilen sich den Eintrag, solange sich
+    Startpunkt, Koordinatenmodus oder Segmente nicht ändern.
+    """
+    key = _live_contour_key(params)
+    cached = getattr(handler, "_contour_path_cache", None)
+    if key is not None and cached is not None and cached[0] == key:
+        return list(cached[1])
+    path = (builder or build_contour_path)(params)
+    if key is not None:
+        handler._contour_path_cache = (key, list(path or []))
+    return path
+
+
+def _live_contour_key(params):
+    """Hashbarer Schlüssel über alle Eingaben der Live-Kontur (None = nicht cachebar).
+
+    Der Schlüssel enthält die kompletten Segmentdaten, daher braucht der
+    Memo-Eintrag keine explizite Invalidierung bei Tabellen-Edits.
+    """
+    try:
+        segments = tuple(tuple(sorted(seg.items())) for seg in params["segments"])
+        key = (params["start_x"], params["start_z"], params["coord_mode"], segments)
+        hash(key)
+    except (TypeError, AttributeError):
+        return None
+    return key
+
+
 def update_parting_contour_choices(handler) -> None:
-    if getattr(handler, "parting_contour", None) is None:
-        handler.parting_contour = handler._get_widget_by_name("parting_contour")
-    if getattr(handler, "parting_contour", None) is None:
+    combo = parting_contour_combo(handler)
+    if combo is None:
         handler._log("[LatheEasyStep][debug] parting_contour widget not found -> skip refresh", level="debug")
         return
-    names = handler._available_contour_names()
-    current = handler.parting_contour.currentText().strip()
-    existing = [handler.parting_contour.itemText(i).strip() for i in range(handler.parting_contour.count())]
-    if getattr(handler, "_startup_in_progress", False) and getattr(handler, "_parting_choices_initialized", False):
-        if existing == names:
-            handler._update_parting_ready_state()
-            return
-    if existing == names and (not current or current == handler._current_parting_contour_name()):
+    contours = handler._iter_contour_ops()
+    names = handler._available_contour_names(contours)
+    current = combo.currentText().strip()
+    existing = [combo.itemText(i).strip() for i in range(combo.count())]
+    if existing == names:
+        # Liste unverändert (Normalfall): Combo nicht neu aufbauen.
         handler._update_parting_ready_state()
         return
-    handler._debug_contour_state("before refresh")
-    handler.parting_contour.blockSignals(True)
-    handler.parting_contour.clear()
-    for name in names:
-        handler.parting_contour.addItem(name)
-    if current:
-        handler.parting_contour.setCurrentText(current)
-    elif names:
-        handler.parting_contour.setCurrentIndex(0)
-    handler.parting_contour.blockSignals(False)
+    debug = _contour_debug_enabled(handler)
+    if debug:
+        handler._debug_contour_state("before refresh", contours)
+    combo.setUpdatesEnabled(False)
+    combo.blockSignals(True)
+    try:
+        combo.clear()
+        combo.addItems(names)
+        if current:
+            combo.setCurrentText(current)
+        elif names:
+            combo.setCurrentIndex(0)
+    finally:
+        combo.blockSignals(False)
+        combo.setUpdatesEnabled(True)
     handler._parting_choices_initialized = True
     handler._update_parting_ready_state()
-    handler._debug_contour_state("after refresh")
+    if debug:
+        handler._debug_contour_state("after refresh", contours)
 
 
 def update_parting_ready_state(handler, *args, **kwargs) -> None:
@@ -140,21 +236,17 @@ def update_parting_ready_state(handler, *args, **kwargs) -> None:
     if handler._current_op_type() != OpType.ABSPANEN:
         handler.btn_add.setEnabled(True)
         return
-    if getattr(handler, "parting_contour", None) is None:
-        handler.parting_contour = handler._get_widget_by_name("parting_contour")
-    if getattr(handler, "parting_contour", None) is None:
+    if parting_contour_combo(handler) is None:
         handler.btn_add.setEnabled(False)
         return
-    available = handler._available_contour_names()
-    name = handler._current_parting_contour_name()
-    ready = bool(name) and name in available
-    handler.btn_add.setEnabled(ready)
+    ready = contour_name_available(handler, handler._current_parting_contour_name())
+    if handler.btn_add.isEnabled() != ready:
+        handler.btn_add.setEnabled(ready)
 
 
 def update_parting_mode_visibility(handler) -> None:
     mode_idx = handler.parting_mode.currentIndex() if handler.parting_mode else 0
-    show_roughing = mode_idx == 0
-    for widget in (
+    roughing = tuple(widget for widget in (
         handler.label_parting_depth,
         handler.parting_depth_per_pass,
         handler.label_parting_pause,
@@ -169,12 +261,22 @@ def update_parting_mode_visibility(handler) -> None:
         getattr(handler, "parting_finish_allow_x", None),
         getattr(handler, "label_parting_finish_allow_z", None),
         getattr(handler, "parting_finish_allow_z", None),
-    ):
-        if widget is not None:
-            widget.setVisible(show_roughing)
-    for hidden_widget in (getattr(handler, "label_parting_slice_step", None), getattr(handler, "parting_slice_step", None)):
-        if hidden_widget is not None:
-            hidden_widget.setVisible(False)
+    ) if widget is not None)
+    hidden = tuple(widget for widget in (
+        getattr(handler, "label_parting_slice_step", None),
+        getattr(handler, "parting_slice_step", None),
+    ) if widget is not None)
+    # Gleicher Modus an denselben Widgets: nichts umzuschalten (Tab-Wechsel,
+    # Laden einer Operation). Neu gebundene Widgets ändern den Schlüssel.
+    state = (mode_idx, roughing, hidden)
+    if state == getattr(handler, "_parting_mode_state", None):
+        return
+    handler._parting_mode_state = state
+    show_roughing = mode_idx == 0
+    for widget in roughing:
+        widget.setVisible(show_roughing)
+    for hidden_widget in hidden:
+        hidden_widget.setVisible(False)
 
 
 def init_contour_table(handler) -> None:
@@ -211,7 +313,31 @@ def init_contour_table(handler) -> None:
         pass
 
 
+_CONTOUR_CELL_STYLE = None
+
+
+def _contour_cell_style():
+    """(Vordergrund, Hintergrund, Flags) neuer Segmentzellen, einmal angelegt.
+
+    QBrush ist ein Werttyp; setForeground/setBackground kopieren ihn, die
+    Zellen können sich die Instanzen also teilen.
+    """
+    global _CONTOUR_CELL_STYLE
+    if _CONTOUR_CELL_STYLE is None:
+        _CONTOUR_CELL_STYLE = (
+            QtGui.QBrush(QtGui.QColor("#000000")),
+            QtGui.QBrush(QtGui.QColor("#ffffff")),
+            QtCore.Qt.ItemIsSelectable | QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsEditable,
+        )
+    return _CONTOUR_CELL_STYLE
+
+
 def handle_contour_add_segment(handler) -> None:
+    """Hängt eine Segmentzeile (Vorgabe: letzter Punkt, Kanten-Vorlage) an.
+
+    Die Zellen werden mit gesperrten Tabellensignalen gefüllt; Operation,
+    Vorschau und Kantenfelder werden danach genau einmal nachgezogen.
+    """
     handler._ensure_contour_widgets()
     table = handler.contour_segments
     if table is None:
@@ -221,59 +347,55 @@ def handle_contour_add_segment(handler) -> None:
     existing_segments = handler._collect_contour_segments()
     x0 = handler.contour_start_x.value() if handler.contour_start_x else 0.0
     z0 = handler.contour_start_z.value() if handler.contour_start_z else 0.0
-    last_x = float(existing_segments[-1].get("x", x0)) if existing_segments else x0
-    last_z = float(existing_segments[-1].get("z", z0)) if existing_segments else z0
-    default_x = last_x
-    default_z = last_z
-    table.insertRow(row)
+    default_x = float(existing_segments[-1].get("x", x0)) if existing_segments else x0
+    default_z = float(existing_segments[-1].get("z", z0)) if existing_segments else z0
+
+    fg_brush, bg_brush, cell_flags = _contour_cell_style()
 
     def _mk_item(text):
         it = QtWidgets.QTableWidgetItem(text)
-        try:
-            it.setFlags(QtCore.Qt.ItemIsSelectable | QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsEditable)
-        except Exception:
-            pass
-        try:
-            it.setForeground(QtGui.QBrush(QtGui.QColor("#000000")))
-            it.setBackground(QtGui.QBrush(QtGui.QColor("#ffffff")))
-        except Exception:
-            pass
+        it.setFlags(cell_flags)
+        it.setForeground(fg_brush)
+        it.setBackground(bg_brush)
         return it
 
-    table.setItem(row, 0, _mk_item("XZ"))
-    table.setItem(row, 1, _mk_item(f"{default_x:.3f}"))
-    table.setItem(row, 2, _mk_item(f"{default_z:.3f}"))
     edge_text = handler._contour_edge_template_text
     edge_size = handler._contour_edge_template_size if edge_text.lower().startswith(("f", "r")) else 0.0
-    edge_combo = QtWidgets.QComboBox()
-    edge_combo.addItems(["Keine", "Fase", "Radius"])
-    idx = edge_combo.findText(edge_text, QtCore.Qt.MatchContains)
-    edge_combo.setCurrentIndex(idx if idx >= 0 else 0)
-    edge_combo.currentIndexChanged.connect(handler._handle_contour_table_change)
-    table.setCellWidget(row, 3, edge_combo)
-    table.setItem(row, 4, _mk_item(f"{edge_size:.3f}"))
     arc_text = getattr(handler, "_contour_arc_template_text", "Auto")
-    arc_combo = QtWidgets.QComboBox()
-    arc_combo.addItems(["Auto", "Außen", "Innen"])
-    idx = arc_combo.findText(arc_text, QtCore.Qt.MatchFixedString)
-    arc_combo.setCurrentIndex(idx if idx >= 0 else 0)
-    arc_combo.setEnabled("Radius" in (edge_combo.currentText() if edge_combo else edge_text))
-    arc_combo.currentIndexChanged.connect(handler._handle_contour_table_change)
-    table.setCellWidget(row, 5, arc_combo)
-    table.setCurrentCell(row, 0)
+    with signals_blocked(table, suspend_updates=True):
+        table.insertRow(row)
+        table.setItem(row, 0, _mk_item("XZ"))
+        table.setItem(row, 1, _mk_item(f"{default_x:.3f}"))
+        table.setItem(row, 2, _mk_item(f"{default_z:.3f}"))
+        edge_combo = QtWidgets.QComboBox()
+        edge_combo.addItems(["Keine", "Fase", "Radius"])
+        idx = edge_combo.findText(edge_text, QtCore.Qt.MatchContains)
+        edge_combo.setCurrentIndex(idx if idx >= 0 else 0)
+        edge_combo.currentIndexChanged.connect(handler._handle_contour_table_change)
+        table.setCellWidget(row, 3, edge_combo)
+        table.setItem(row, 4, _mk_item(f"{edge_size:.3f}"))
+        arc_combo = QtWidgets.QComboBox()
+        arc_combo.addItems(["Auto", "Außen", "Innen"])
+        idx = arc_combo.findText(arc_text, QtCore.Qt.MatchFixedString)
+        arc_combo.setCurrentIndex(idx if idx >= 0 else 0)
+        arc_combo.setEnabled("Radius" in edge_combo.currentText())
+        arc_combo.currentIndexChanged.connect(handler._handle_contour_table_change)
+        table.setCellWidget(row, 5, arc_combo)
+        try:
+            table.setRowHeight(row, 22)
+        except Exception:
+            pass
+        table.setCurrentCell(row, 0)
     try:
-        table.setRowHeight(row, 22)
         table.show()
         table.raise_()
     except Exception:
         pass
-    try:
+    if handler._debug_enabled():
         cells = []
         for r in range(table.rowCount()):
             cells.append([table.item(r, c).text() if table.item(r, c) else "" for c in range(table.columnCount())])
         handler._log(f"[LatheEasyStep][debug] contour rows={table.rowCount()} data={cells}", level="debug")
-    except Exception:
-        pass
     handler._contour_row_user_selected = False
     handler._update_selected_operation()
     handler._update_contour_preview_temp()
@@ -292,6 +414,51 @@ def handle_contour_delete_segment(handler) -> None:
         handler._sync_contour_edge_controls()
 
 
+def _swap_contour_rows(table, first: int, second: int) -> None:
+    """Inhalt zweier Tabellenzeilen tauschen, ohne Zeilen einzufügen/zu löschen.
+
+    Items wechseln per takeItem/setItem die Zeile; die Combo-Zellwidgets
+    bleiben stehen und tauschen nur Auswahl und Freigabe (removeCellWidget
+    würde das Widget löschen).
+    """
+    for col in range(table.columnCount()):
+        w_first = table.cellWidget(first, col)
+        w_second = table.cellWidget(second, col)
+        if w_first is not None and w_second is not None and hasattr(w_first, "setCurrentIndex"):
+            idx_first, idx_second = w_first.currentIndex(), w_second.currentIndex()
+            on_first, on_second = w_first.isEnabled(), w_second.isEnabled()
+            for widget, idx, enabled in ((w_first, idx_second, on_second), (w_second, idx_first, on_first)):
+                blocked = widget.blockSignals(True)
+                try:
+                    widget.setCurrentIndex(idx)
+                finally:
+                    widget.blockSignals(blocked)
+                widget.setEnabled(enabled)
+            continue
+        item_first = table.takeItem(first, col)
+        item_second = table.takeItem(second, col)
+        if item_second is not None:
+            table.setItem(first, col, item_second)
+        if item_first is not None:
+            table.setItem(second, col, item_first)
+
+
+def _move_contour_row(handler, table, row: int, target: int) -> None:
+    """Zeile row mit target tauschen und target auswählen.
+
+    Tausch und Auswahl laufen mit gesperrten Tabellensignalen, damit
+    itemChanged/currentCellChanged keine Zwischen-Refreshes auslösen;
+    Operation, Vorschau und Kantenfelder werden danach einmal nachgezogen.
+    """
+    with signals_blocked(table, suspend_updates=True):
+        _swap_contour_rows(table, min(row, target), max(row, target))
+        table.setCurrentCell(target, 0)
+    handler._contour_row_user_selected = True
+    handler._update_selected_operation()
+    handler._update_contour_preview_temp()
+    handler._sync_contour_edge_controls()
+
+
 def handle_contour_move_up(handler) -> None:
     table = handler.contour_segments
     if table is None:
@@ -299,21 +466,7 @@ def handle_contour_move_up(handler) -> None:
     row = table.currentRow()
     if row <= 0:
         return
-    table.insertRow(row - 1)
-    for col in range(table.columnCount()):
-        item = table.takeItem(row + 1, col)
-        table.setItem(row - 1, col, item)
-        try:
-            w = table.cellWidget(row + 1, col)
-            if w is not None:
-                table.removeCellWidget(row + 1, col)
-                table.setCellWidget(row - 1, col, w)
-        except Exception:
-            pass
-    table.removeRow(row + 1)
-    table.setCurrentCell(row - 1, 0)
-    handler._update_selected_operation()
-    handler._update_contour_preview_temp()
+    _move_contour_row(handler, table, row, row - 1)
 
 
 def handle_contour_move_down(handler) -> None:
@@ -323,22 +476,7 @@ def handle_contour_move_down(handler) -> None:
     row = table.currentRow()
     if row < 0 or row >= table.rowCount() - 1:
         return
-    table.insertRow(row + 2)
-    for col in range(table.columnCount()):
-        item = table.takeItem(row, col)
-        table.setItem(row + 2, col, item)
-        try:
-            w = table.cellWidget(row, col)
-            if w is not None:
-                table.removeCellWidget(row, col)
-                table.setCellWidget(row + 2, col, w)
-        except Exception:
-            pass
-    table.removeRow(row)
-    table.setCurrentCell(row + 1, 0)
-    handler._update_selected_operation()
-    handler._update_contour_preview_temp()
-    handler._sync_contour_edge_controls()
+    _move_contour_row(handler, table, row, row + 1)
 
 
 def handle_contour_table_change(handler, *args, **kwargs) -> None:
@@ -413,17 +551,17 @@ def sync_contour_edge_controls(handler) -> None:
         idx = handler.contour_edge_type.findText(edge_txt, QtCore.Qt.MatchFixedString)
         if idx < 0:
             idx = 0
-        handler.contour_edge_type.blockSignals(True)
-        handler.contour_edge_type.setCurrentIndex(idx)
-        handler.contour_edge_type.blockSignals(False)
+        if handler.contour_edge_type.currentIndex() != idx:
+            with signals_blocked(handler.contour_edge_type):
+                handler.contour_edge_type.setCurrentIndex(idx)
     edge_txt_ctrl = handler.contour_edge_type.currentText() if handler.contour_edge_type else edge_txt
     enable_size = edge_txt_ctrl.lower().startswith("f") or edge_txt_ctrl.lower().startswith("r")
     if handler.label_contour_edge_size:
         handler.label_contour_edge_size.setVisible(True)
         handler.label_contour_edge_size.setEnabled(True)
     if handler.contour_edge_size:
-        handler.contour_edge_size.blockSignals(True)
-        handler.contour_edge_size.setVisible(True)
-        handler.contour_edge_size.setEnabled(enable_size)
-        handler.contour_edge_size.setValue(size_val)
-        handler.contour_edge_size.blockSignals(False)
+        with signals_blocked(handler.contour_edge_size):
+            handler.contour_edge_size.setVisible(True)
+            handler.contour_edge_size.setEnabled(enable_size)
+            if handler.contour_edge_size.value() != size_val:
+                handler.contour_edge_size.setValue(size_val)
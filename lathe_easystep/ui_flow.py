@@ -1,14 +1,27 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
+from types import MappingProxyType
 
 from qtvcp.core import Action
 from qtpy import QtCore, QtWidgets
 
 from .model import OpType
+from .storage import write_gcode_lines
 
 
 def build_gcode_lines(handler):
+    prepare_gcode_settings(handler)
+    return handler.model.generate_gcode()
+
+
+def prepare_gcode_settings(handler):
+    """Programmkopf und Werkzeuge aus dem Formular ins Modell übernehmen.
+
+    Liest Widgets und muss daher im GUI-Thread laufen; die eigentliche
+    Erzeugung (model.generate_gcode) braucht danach keine Widgets mehr.
+    """
     if not handler.tools:
         try:
             handler._auto_load_tool_table()
@@ -38,7 +51,6 @@ def build_gcode_lines(handler):
     footer_lines = handler._tool_change_position_lines(header)
     handler.model.program_settings["header_lines"] = header_lines
     handler.model.program_settings["footer_lines"] = footer_lines
-    return handler.model.generate_gcode()
 
 
 def handle_move_up(handler):
@@ -80,7 +92,7 @@ def handle_new_program(handler):
         return
     handler._creating_new_program = True
     try:
-        handler.model.operations.clear()
+        handler.model.clear_operations()
         handler._current_program_path = None
         handler._current_gcode_path = None
         handler._op_row_user_selected = False
@@ -94,6 +106,7 @@ def handle_generate_gcode(handler):
     if handler._generating_gcode:
         return
     handler._generating_gcode = True
+    started = False
     try:
         header = handler._collect_program_header()
         settings = QtCore.QSettings()
@@ -115,24 +128,22 @@ def handle_generate_gcode(handler):
         if not filepath:
             return
         handler._update_selected_operation(force=True)
-        handler._write_gcode_file(filepath)
-        handler._current_gcode_path = handler._normalized_file_path(filepath)
+        prepare_gcode_settings(handler)
         handler._remember_dialog_path(
             settings,
             filepath,
             "LatheEasyStep/GcodeLastDir",
             "LatheEasyStep/LastDialogDir",
         )
-        open_fn = getattr(Action, "CALLBACK_OPEN_PROGRAM", None)
-        if callable(open_fn):
-            open_fn(filepath)
-        else:
-            QtWidgets.QMessageBox.information(
-                handler.root_widget or None,
-                "LatheEasyStep",
-                f"Programm gespeichert unter:\n{filepath}\nAutomatisches Öffnen ist nicht verfügbar.",
-            )
-            handler._log(f"[LatheEasyStep] Hinweis: Programm geschrieben nach {filepath}, automatisches Öffnen nicht verfügbar", level="info")
+        job = GcodeJob(handler.model.snapshot(), handler._normalized_file_path(filepath) or filepath)
+        job.signals.finished.connect(lambda path: _gcode_job_done(handler, path, None))
+        job.signals.failed.connect(lambda message: _gcode_job_done(handler, None, message))
+        handler._gcode_job = job
+        QtCore.QThreadPool.globalInstance().start(job)
+        started = True
+        # erst nach erfolgreichem start(): _gcode_job_done stellt ihn zurück
+        # (die Job-Signale kommen queued, also nach diesem Aufruf an)
+        QtWidgets.QApplication.setOverrideCursor(QtCore.Qt.WaitCursor)
     except Exception as exc:
         QtWidgets.QMessageBox.critical(
             handler.root_widget or None,
@@ -140,57 +151,198 @@ def handle_generate_gcode(handler):
             f"Fehler beim Erzeugen des Programms:\n{exc}",
         )
     finally:
-        handler._generating_gcode = False
+        if not started:
+            handler._gcode_job = None
+            handler._generating_gcode = False
+
+
+class _GcodeJobSignals(QtCore.QObject):
+    """Meldet das Ende eines GcodeJob; lebt im GUI-Thread.
+
+    GcodeJob.run emittiert im Thread-Pool nur _finished_from_worker bzw.
+    _failed_from_worker; finished/failed werden über die eigenen (queued)
+    Slots im GUI-Thread ausgelöst.
+    """
+
+    finished = QtCore.Signal(str)
+    failed = QtCore.Signal(str)
+    _finished_from_worker = QtCore.Signal(str)
+    _failed_from_worker = QtCore.Signal(str)
+
+    def __init__(self):
+        super().__init__()
+        self._finished_from_worker.connect(self._relay_finished, QtCore.Qt.QueuedConnection)
+        self._failed_from_worker.connect(self._relay_failed, QtCore.Qt.QueuedConnection)
+
+    @QtCore.Slot(str)
+    def _relay_finished(self, path):
+        self.finished.emit(path)
+
+    @QtCore.Slot(str)
+    def _relay_failed(self, message):
+        self.failed.emit(message)
+
+
+class GcodeJob(QtCore.QRunnable):
+    """Erzeugt G-Code aus einem Modell-Snapshot und schreibt die Datei im Thread-Pool."""
+
+    def __init__(self, model, file_path: str):
+        super().__init__()
+        self.model = model
+        self.file_path = file_path
+        self.signals = _GcodeJobSignals()
+
+    def run(self):
+        try:
+            write_gcode_lines(self.file_path, self.model.generate_gcode())
+        except Exception as exc:
+            self.signals._failed_from_worker.emit(str(exc))
+            return
+        self.signals._finished_from_worker.emit(self.file_path)
+
+
+def _gcode_job_done(handler, filepath, error):
+    """Abschluss eines GcodeJob im GUI-Thread: Cursor, Flags, Öffnen/Meldung."""
+    handler._gcode_job = None
+    handler._generating_gcode = False
+    QtWidgets.QApplication.restoreOverrideCursor()
+    if error is not None:
+        QtWidgets.QMessageBox.critical(
+            handler.root_widget or None,
+            "LatheEasyStep",
+            f"Fehler beim Erzeugen des Programms:\n{error}",
+        )
+        return
+    handler._current_gcode_path = filepath
+    open_fn = getattr(Action, "CALLBACK_OPEN_PROGRAM", None)
+    if callable(open_fn):
+        open_fn(filepath)
+    else:
+        QtWidgets.QMessageBox.information(
+            handler.root_widget or None,
+            "LatheEasyStep",
+            f"Programm gespeichert unter:\n{filepath}\nAutomatisches Öffnen ist nicht verfügbar.",
+        )
+        handler._log(f"[LatheEasyStep] Hinweis: Programm geschrieben nach {filepath}, automatisches Öffnen nicht verfügbar", level="info")
+
+
+# Parameter, die _format_operation je Typ ausgibt; nur diese gehen in den
+# Cache-Schlüssel ein. Unbekannte Typen geben alle Parameter aus -> kein Cache.
+_DESCRIBE_PARAM_KEYS = {
+    OpType.PROGRAM_HEADER: ("wcs",),
+    OpType.FACE: ("mode", "z_start", "z_end", "coolant", "tool"),
+    OpType.CONTOUR: ("mode", "side", "tool"),
+    OpType.DRILL: ("mode", "z0", "depth", "tool"),
+    OpType.GROOVE: ("z", "width", "tool"),
+    OpType.THREAD: ("orientation", "pitch", "z0", "z1", "tool"),
+    OpType.ABSPANEN: ("contour_name", "slice_strategy", "tool"),
+    OpType.KEYWAY: ("slot_count", "start_z", "tool"),
+}
+_MISSING = object()
+_EMPTY_PARAMS = MappingProxyType({})
+
+
+def _operation_params(op):
+    """op.params als Mapping; fehlend/kein dict -> gemeinsames leeres Mapping."""
+    params = op.params
+    return params if isinstance(params, dict) else _EMPTY_PARAMS
+
+
+def _fnum(v, nd=1):
+    if type(v) is float:  # Formularwerte (Spinbox.value()) sind schon float
+        return f"{v:.{nd}f}"
+    try:
+        return f"{float(v):.{nd}f}"
+    except Exception:
+        return str(v)
 
 
 def describe_operation(handler, op, number=None):
-    def wrap(s):
-        return f"{int(number)}. {s}" if number is not None else s
+    """Listentext einer Operation; unveränderte Zeilen kommen aus dem Cache.
+
+    Der Schlüssel enthält Typ und repr jedes ausgegebenen Parameters, damit
+    z.B. 1 und 1.0, True oder 0.0 und -0.0 nicht denselben Text teilen.
+    """
     try:
         t = op.op_type
-        p = op.params or {}
+        p = _operation_params(op)
+        keys = _DESCRIBE_PARAM_KEYS.get(t)
+        if keys is None:
+            return _format_operation(op, number)
+        values = tuple((type(v), repr(v), v) for v in (p.get(k, _MISSING) for k in keys))
+        return _describe_cached(t, number, values)
+    except Exception:  # z.B. nicht hashbare Werte
+        return _format_operation(op, number)
+
+
+@lru_cache(maxsize=512)
+def _describe_cached(t, number, values):
+    p = {k: v for k, (_, _, v) in zip(_DESCRIBE_PARAM_KEYS[t], values) if v is not _MISSING}
+    text = _DESCRIBERS[t](p)
+    return f"{int(number)}. {text}" if number is not None else text
+
+
+# Planen-Modus als Index (Combo) -> Listentext
+_FACE_MODE_LABELS = {0: "schruppen", 1: "schlichten", 2: "schruppen + schlichten"}
+
+
+def _describe_program_header(p):
+    return f"Programmkopf ({str(p.get('wcs', 'G54')).upper()})"
+
+
+def _describe_face(p):
+    mode = p.get("mode", "schruppen")
+    if isinstance(mode, (int, float)):
+        mode = _FACE_MODE_LABELS.get(int(mode), "schruppen")
+    mode = "schruppen" if mode is None else str(mode)
+    coolant = " mit Kühlung" if p.get("coolant") else ""
+    return f"Planen {mode.title()} (Z {_fnum(p.get('z_start', 0.0))}→{_fnum(p.get('z_end', 0.0))}){coolant} ({p.get('tool', 'T01')})"
+
+
+def _describe_contour(p):
+    return f"Kontur {p.get('mode', 'schruppen')} ({p.get('side', 'außen')}) ({p.get('tool', 'T01')})"
+
+
+def _describe_drill(p):
+    return f"Bohren {p.get('mode', 'normal')} (Z {_fnum(p.get('z0', 0.0))}→{_fnum(p.get('depth', 0.0))}) ({p.get('tool', 'T01')})"
+
+
+def _describe_groove(p):
+    return f"Einstechen (Z {_fnum(p.get('z', 0.0))}; B {_fnum(p.get('width', 0.0))}) ({p.get('tool', 'T01')})"
+
+
+def _describe_thread(p):
+    return f"Gewinde {p.get('orientation', 'aussengewinde')} (P {_fnum(p.get('pitch', 0.0), 2)}; Z {_fnum(p.get('z0', 0.0))}→{_fnum(p.get('z1', 0.0))}) ({p.get('tool', 'T01')})"
+
+
+def _describe_abspanen(p):
+    return f"Abspanen ({p.get('contour_name', 'unbekannt')}, {p.get('slice_strategy', 'parallel_z')}) ({p.get('tool', 'T01')})"
+
+
+def _describe_keyway(p):
+    slot_count = int(float(p.get("slot_count", 1) or 1))
+    return f"Keilnut ({slot_count}x ab Z {_fnum(p.get('start_z', 0.0))}) ({p.get('tool', 'T01')})"
+
+
+# Listentext je Operationstyp (ohne Nummer); ein Lookup statt if/elif-Kette.
+_DESCRIBERS = {
+    OpType.PROGRAM_HEADER: _describe_program_header,
+    OpType.FACE: _describe_face,
+    OpType.CONTOUR: _describe_contour,
+    OpType.DRILL: _describe_drill,
+    OpType.GROOVE: _describe_groove,
+    OpType.THREAD: _describe_thread,
+    OpType.ABSPANEN: _describe_abspanen,
+    OpType.KEYWAY: _describe_keyway,
+}
+
+
+def _format_operation(op, number=None):
+    try:
+        t = op.op_type
+        p = _operation_params(op)
+        describe = _DESCRIBERS.get(t)
     except Exception:
         return str(op)
-
-    def fnum(v, nd=1):
-        try:
-            return f"{float(v):.{nd}f}"
-        except Exception:
-            return str(v)
-
-    if t == OpType.PROGRAM_HEADER:
-        wcs = str(p.get("wcs", "G54")).upper()
-        return wrap(f"Programmkopf ({wcs})")
-    if t == OpType.FACE:
-        mode = p.get("mode", "schruppen")
-        if isinstance(mode, (int, float)):
-            mode = {0: "schruppen", 1: "schlichten", 2: "schruppen + schlichten"}.get(int(mode), "schruppen")
-        mode = "schruppen" if mode is None else str(mode)
-        z_start = p.get("z_start", 0.0)
-        z_end = p.get("z_end", 0.0)
-        coolant = " mit Kühlung" if p.get("coolant") else ""
-        tool = p.get("tool", "T01")
-        return wrap(f"Planen {mode.title()} (Z {fnum(z_start)}→{fnum(z_end)}){coolant} ({tool})")
-    if t == OpType.CONTOUR:
-        return wrap(f"Kontur {p.get('mode', 'schruppen')} ({p.get('side', 'außen')}) ({p.get('tool', 'T01')})")
-    if t == OpType.DRILL:
-        return wrap(f"Bohren {p.get('mode', 'normal')} (Z {fnum(p.get('z0', 0.0))}→{fnum(p.get('depth', 0.0))}) ({p.get('tool', 'T01')})")
-    if t == OpType.GROOVE:
-        return wrap(f"Einstechen (Z {fnum(p.get('z', 0.0))}; B {fnum(p.get('width', 0.0))}) ({p.get('tool', 'T01')})")
-    if t == OpType.THREAD:
-        return wrap(f"Gewinde {p.get('orientation', 'aussengewinde')} (P {fnum(p.get('pitch', 0.0),2)}; Z {fnum(p.get('z0', 0.0))}→{fnum(p.get('z1', 0.0))}) ({p.get('tool', 'T01')})")
-    if t == OpType.ABSPANEN:
-        return wrap(f"Abspanen ({p.get('contour_name', 'unbekannt')}, {p.get('slice_strategy', 'parallel_z')}) ({p.get('tool', 'T01')})")
-    if t == OpType.KEYWAY:
-        slot_count = int(float(p.get("slot_count", 1) or 1))
-        return wrap(f"Keilnut ({slot_count}x ab Z {fnum(p.get('start_z', 0.0))}) ({p.get('tool', 'T01')})")
-    return wrap(f"{t}: {p}")
-
-
-def renumber_operations(handler):
-    if handler.list_ops is None:
-        return
-    for i in range(handler.list_ops.count()):
-        item = handler.list_ops.item(i)
-        op = handler.model.operations[i]
-        item.setText(handler._describe_operation(op, i + 1))
+    text = describe(p) if describe is not None else f"{t}: {op.params or {}}"
+    return f"{int(number)}. {text}" if number is not None else text
@@ -2,6 +2,24 @@ from __future__ import annotations
 
 from qtpy import QtCore, QtWidgets
 
+# (Handler-Attribut, Such-Keys in Priorität) für den Finalize-Durchlauf.
+# "id:<n>" verweist auf die idx-Property aus widget_ids.json.
+_FINALIZE_WIDGETS = (
+    ("list_ops", ("listOperations",)),
+    ("tab_params", ("tabParams",)),
+    ("btn_add", ("id:34721", "btnAdd")),
+    ("btn_delete", ("btnDelete",)),
+    ("btn_move_up", ("btnMoveUp",)),
+    ("btn_move_down", ("btnMoveDown",)),
+    ("btn_new_program", ("btnNewProgram",)),
+    ("btn_generate", ("id:34722", "btnGenerate")),
+    ("btn_save_program", ("id:34724", "btnSaveProgram")),
+    ("contour_add_segment", ("contour_add_segment",)),
+    ("contour_delete_segment", ("contour_delete_segment",)),
+    ("contour_move_up", ("contour_move_up",)),
+    ("contour_move_down", ("contour_move_down",)),
+)
+
 
 def bootstrap_widget_refs(handler) -> None:
     """Initialize widget reference attributes early so startup code can safely probe them."""
@@ -138,7 +156,6 @@ def bootstrap_widget_refs(handler) -> None:
 
     handler.root_widget = handler._find_root_widget()
     handler._setup_resolver()
-    handler._unit_last_index = -1
 
 
 def finalize_ui_ready(handler) -> None:
@@ -166,34 +183,38 @@ def finalize_ui_ready(handler) -> None:
         except Exception:
             pass
     handler._force_attach_core_widgets()
-    handler.list_ops = handler.list_ops or handler._find_any_widget("listOperations")
-    handler.tab_params = handler.tab_params or handler._find_any_widget("tabParams")
-    handler.btn_add = handler.btn_add or handler._find_any_widget("id:34721") or handler._find_any_widget("btnAdd")
-    handler.btn_delete = handler.btn_delete or handler._find_any_widget("btnDelete")
-    handler.btn_move_up = handler.btn_move_up or handler._find_any_widget("btnMoveUp")
-    handler.btn_move_down = handler.btn_move_down or handler._find_any_widget("btnMoveDown")
-    handler.btn_new_program = handler.btn_new_program or handler._find_any_widget("btnNewProgram")
-    handler.btn_generate = handler.btn_generate or handler._find_any_widget("id:34722") or handler._find_any_widget("btnGenerate")
+    # Alle noch fehlenden Kern-Widgets in einem Durchlauf auflösen statt
+    # je Widget eine eigene _find_any_widget()-Baumsuche zu starten.
+    missing = [
+        (attr, keys)
+        for attr, keys in _FINALIZE_WIDGETS
+        if getattr(handler, attr, None) is None
+    ]
+    if missing:
+        wanted = [key for _attr, keys in missing for key in keys]
+        found = handler._index_named_widgets(
+            names=[key for key in wanted if not key.startswith("id:")],
+            ids=[key[3:] for key in wanted if key.startswith("id:")],
+        )
+        for attr, keys in missing:
+            widget = next((found[key] for key in keys if key in found), None)
+            if widget is None:
+                # seltener Fallback: Tab-Seiten-Roots / Attribut am Panel
+                widget = handler._find_any_widget(keys[-1])
+            if widget is not None:
+                setattr(handler, attr, widget)
     if handler.btn_add is None:
         handler.btn_add = handler._get_widget_by_name("btnAdd")
     if handler.btn_generate is None:
         handler.btn_generate = handler._get_widget_by_name("btnGenerate")
-    if getattr(handler, "btn_save_program", None) is None:
-        handler.btn_save_program = getattr(handler, "btn_save_program", None) or handler._find_any_widget("id:34724") or handler._find_any_widget("btnSaveProgram")
     if handler.btn_save_step is None:
         handler.btn_save_step = handler._get_widget_by_name("btn_save_step")
     if handler.btn_load_step is None:
         handler.btn_load_step = handler._get_widget_by_name("btn_load_step")
-    handler.contour_add_segment = handler.contour_add_segment or handler._find_any_widget("contour_add_segment")
-    handler.contour_delete_segment = handler.contour_delete_segment or handler._find_any_widget("contour_delete_segment")
-    handler.contour_move_up = handler.contour_move_up or handler._find_any_widget("contour_move_up")
-    handler.contour_move_down = handler.contour_move_down or handler._find_any_widget("contour_move_down")
     handler._ensure_contour_widgets()
     handler._init_contour_table()
-    try:
-        handler._log(f"[LatheEasyStep] core widgets FIX: add={handler.btn_add} del={handler.btn_delete} list={handler.list_ops}", level="info")
-    except Exception:
-        pass
+    if handler._debug_enabled():
+        handler._log(f"[LatheEasyStep][debug] core widgets FIX: add={handler.btn_add} del={handler.btn_delete} list={handler.list_ops}", level="debug")
     handler._ensure_preview_widgets()
     handler._connect_core_signals()
     try:
@@ -203,7 +224,6 @@ def finalize_ui_ready(handler) -> None:
         handler._connect_mode_visibility_signals()
     except Exception as exc:
         handler._log(f"[LatheEasyStep] finalize signal setup failed: {exc}", level="warning")
-    handler._ensure_core_widgets()
     handler._update_parting_contour_choices()
     handler._update_parting_ready_state()
     try:
@@ -3,6 +3,7 @@ from __future__ import annotations
 from qtpy import QtCore, QtWidgets
 
 from .model import OpType, Operation
+from .ui_widgets import signals_blocked
 
 
 def load_operation_params_to_form(handler, op: Operation) -> None:
@@ -15,47 +16,8 @@ def load_operation_params_to_form(handler, op: Operation) -> None:
     for key, widget in widgets.items():
         if widget is None or key not in op.params:
             continue
-        widget.blockSignals(True)
-        val = op.params[key]
-        if isinstance(widget, QtWidgets.QComboBox):
-            handled = False
-            if key == "slice_strategy":
-                handled = handler._select_slice_strategy_index(widget, val)
-            if not handled:
-                try:
-                    data_idx = widget.findData(val)
-                except Exception:
-                    data_idx = -1
-                if data_idx >= 0:
-                    widget.setCurrentIndex(data_idx)
-                    handled = True
-            if not handled:
-                try:
-                    widget.setCurrentIndex(int(val))
-                    handled = True
-                except Exception:
-                    try:
-                        txt = str(val).strip()
-                        idx = widget.findText(txt)
-                        if idx >= 0:
-                            widget.setCurrentIndex(idx)
-                            handled = True
-                    except Exception:
-                        pass
-        elif isinstance(widget, QtWidgets.QAbstractButton):
-            widget.setChecked(bool(val))
-        else:
-            try:
-                if isinstance(widget, QtWidgets.QSpinBox):
-                    widget.setValue(int(val))
-                else:
-                    widget.setValue(val)
-            except Exception:
-                try:
-                    widget.setValue(float(val))
-                except Exception:
-                    pass
-        widget.blockSignals(False)
+        with signals_blocked(widget):
+            _apply_param_value(handler, key, widget, op.params[key])
 
     if op.op_type == OpType.CONTOUR:
         _load_contour_operation_to_form(handler, op)
@@ -63,91 +25,136 @@ def load_operation_params_to_form(handler, op: Operation) -> None:
 
     if op.op_type == OpType.ABSPANEN and getattr(handler, "parting_contour", None):
         name = str(op.params.get("contour_name") or "")
-        handler.parting_contour.blockSignals(True)
-        handler.parting_contour.setCurrentText(name)
-        handler.parting_contour.blockSignals(False)
+        with signals_blocked(handler.parting_contour):
+            handler.parting_contour.setCurrentText(name)
         handler._update_parting_ready_state()
         handler._update_parting_mode_visibility()
 
 
+def _apply_param_value(handler, key: str, widget, val) -> None:
+    if isinstance(widget, QtWidgets.QComboBox):
+        handled = False
+        if key == "slice_strategy":
+            handled = handler._select_slice_strategy_index(widget, val)
+        if not handled:
+            try:
+                data_idx = widget.findData(val)
+            except Exception:
+                data_idx = -1
+            if data_idx >= 0:
+                widget.setCurrentIndex(data_idx)
+                handled = True
+        if not handled:
+            try:
+                widget.setCurrentIndex(int(val))
+                handled = True
+            except Exception:
+                try:
+                    txt = str(val).strip()
+                    idx = widget.findText(txt)
+                    if idx >= 0:
+                        widget.setCurrentIndex(idx)
+                        handled = True
+                except Exception:
+                    pass
+    elif isinstance(widget, QtWidgets.QAbstractButton):
+        widget.setChecked(bool(val))
+    else:
+        try:
+            if isinstance(widget, QtWidgets.QSpinBox):
+                widget.setValue(int(val))
+            else:
+                widget.setValue(val)
+        except Exception:
+            try:
+                widget.setValue(float(val))
+            except Exception:
+                pass
+
+
+_EDGE_CHOICES = ("Keine", "Fase", "Radius")
+_ARC_CHOICES = ("Auto", "Außen", "Innen")
+_CELL_FLAGS = QtCore.Qt.ItemIsSelectable | QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsEditable
+
+
+def _segment_mode_text(mode: str) -> str:
+    mode = (mode or "xz").lower()
+    if mode == "x":
+        return "X"
+    if mode == "z":
+        return "Z"
+    return "XZ"
+
+
+def _segment_edge_text(edge: str) -> str:
+    edge = (edge or "none").lower()
+    if edge in ("chamfer", "fase"):
+        return "Fase"
+    if edge == "radius":
+        return "Radius"
+    return "Keine"
+
+
+def _set_cell_text(table, row: int, col: int, text: str) -> None:
+    item = table.item(row, col)
+    if item is not None:
+        item.setText(text)
+        return
+    item = QtWidgets.QTableWidgetItem(text)
+    item.setFlags(_CELL_FLAGS)
+    table.setItem(row, col, item)
+
+
+def _cell_combo(handler, table, row: int, col: int, choices) -> QtWidgets.QComboBox:
+    """Auswahl-Combo einer Zelle; vorhandene (bereits verbundene) wird weiterverwendet."""
+    combo = table.cellWidget(row, col)
+    if isinstance(combo, QtWidgets.QComboBox) and combo.count() == len(choices):
+        return combo
+    combo = QtWidgets.QComboBox()
+    combo.addItems(list(choices))
+    combo.currentIndexChanged.connect(handler._handle_contour_table_change)
+    table.setCellWidget(row, col, combo)
+    return combo
+
+
+def _select_combo_text(combo, text: str) -> None:
+    idx = combo.findText(text, QtCore.Qt.MatchFixedString)
+    with signals_blocked(combo):
+        combo.setCurrentIndex(idx if idx >= 0 else 0)
+
+
 def _load_contour_operation_to_form(handler, op: Operation) -> None:
     handler._ensure_contour_widgets()
     handler._init_contour_table()
 
     if getattr(handler, "contour_name", None):
-        try:
-            handler.contour_name.blockSignals(True)
+        with signals_blocked(handler.contour_name):
             handler.contour_name.setText(str(op.params.get("name") or "").strip())
-        finally:
-            handler.contour_name.blockSignals(False)
 
     table = getattr(handler, "contour_segments", None)
     if table is not None:
         segs = op.params.get("segments") or []
-        table.blockSignals(True)
-        table.setRowCount(0)
-
-        def mode_to_text(mode: str) -> str:
-            mode = (mode or "xz").lower()
-            if mode == "x":
-                return "X"
-            if mode == "z":
-                return "Z"
-            return "XZ"
-
-        def edge_to_text(edge: str) -> str:
-            edge = (edge or "none").lower()
-            if edge in ("chamfer", "fase"):
-                return "Fase"
-            if edge == "radius":
-                return "Radius"
-            return "Keine"
-
-        def make_item(text: str) -> QtWidgets.QTableWidgetItem:
-            item = QtWidgets.QTableWidgetItem(text)
-            try:
-                item.setFlags(
-                    QtCore.Qt.ItemIsSelectable
-                    | QtCore.Qt.ItemIsEnabled
-                    | QtCore.Qt.ItemIsEditable
-                )
-            except Exception:
-                pass
-            return item
-
-        for row, seg in enumerate(segs):
-            table.insertRow(row)
-            mode_txt = mode_to_text(seg.get("mode"))
-            x_empty = bool(seg.get("x_empty", False))
-            z_empty = bool(seg.get("z_empty", False))
-            x_val = "" if x_empty else f"{float(seg.get('x', 0.0)):.3f}"
-            z_val = "" if z_empty else f"{float(seg.get('z', 0.0)):.3f}"
-            edge_txt = edge_to_text(seg.get("edge"))
-            size_val = f"{float(seg.get('edge_size', 0.0) or 0.0):.3f}"
-            arc_txt = seg.get("arc_side", "auto")
-
-            table.setItem(row, 0, make_item(mode_txt))
-            table.setItem(row, 1, make_item(x_val))
-            table.setItem(row, 2, make_item(z_val))
-
-            edge_combo = QtWidgets.QComboBox()
-            edge_combo.addItems(["Keine", "Fase", "Radius"])
-            edge_idx = edge_combo.findText(edge_txt, QtCore.Qt.MatchFixedString)
-            edge_combo.setCurrentIndex(edge_idx if edge_idx >= 0 else 0)
-            edge_combo.currentIndexChanged.connect(handler._handle_contour_table_change)
-            table.setCellWidget(row, 3, edge_combo)
-
-            table.setItem(row, 4, make_item(size_val))
-
-            arc_combo = QtWidgets.QComboBox()
-            arc_combo.addItems(["Auto", "Außen", "Innen"])
-            arc_idx = arc_combo.findText(str(arc_txt).capitalize(), QtCore.Qt.MatchFixedString)
-            arc_combo.setCurrentIndex(arc_idx if arc_idx >= 0 else 0)
-            arc_combo.setEnabled(edge_txt == "Radius")
-            arc_combo.currentIndexChanged.connect(handler._handle_contour_table_change)
-            table.setCellWidget(row, 5, arc_combo)
-
-        table.blockSignals(False)
+        with signals_blocked(table, suspend_updates=True):
+            # Zeilenzahl einmal setzen; vorhandene Items/Combos werden
+            # überschrieben statt je Zeile neu angelegt.
+            table.setRowCount(len(segs))
+            for row, seg in enumerate(segs):
+                x_empty = bool(seg.get("x_empty", False))
+                z_empty = bool(seg.get("z_empty", False))
+                edge_txt = _segment_edge_text(seg.get("edge"))
+                arc_txt = seg.get("arc_side", "auto")
+
+                _set_cell_text(table, row, 0, _segment_mode_text(seg.get("mode")))
+                _set_cell_text(table, row, 1, "" if x_empty else f"{float(seg.get('x', 0.0)):.3f}")
+                _set_cell_text(table, row, 2, "" if z_empty else f"{float(seg.get('z', 0.0)):.3f}")
+                _set_cell_text(table, row, 4, f"{float(seg.get('edge_size', 0.0) or 0.0):.3f}")
+
+                edge_combo = _cell_combo(handler, table, row, 3, _EDGE_CHOICES)
+                _select_combo_text(edge_combo, edge_txt)
+                arc_combo = _cell_combo(handler, table, row, 5, _ARC_CHOICES)
+                _select_combo_text(arc_combo, str(arc_txt).capitalize())
+                arc_combo.setEnabled(edge_txt == "Radius")
+
         if table.rowCount() > 0:
             table.setCurrentCell(0, 0)
 
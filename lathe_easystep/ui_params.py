@@ -1,133 +1,261 @@
 from __future__ import annotations
 
-from typing import Dict
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Tuple
 
-from qtpy import QtWidgets
+from qtpy import QtCore, QtWidgets
 
 from .model import OpType
 
+# OpType -> (objectName-Präfix, ((Param-Key, objectName-Suffix), ...))
+PARAM_MAP_SPEC: Dict[str, Tuple[str, Tuple[Tuple[str, str], ...]]] = {
+    OpType.FACE: ("face_", (
+        ("tool", "tool"),
+        ("start_x", "start_x"),
+        ("start_z", "start_z"),
+        ("end_x", "end_x"),
+        ("end_z", "end_z"),
+        ("safe_z", "safe_z"),
+        ("feed", "feed"),
+        ("depth_per_pass", "depth_per_pass"),
+        ("finish_allow_x", "finish_allow_x"),
+        ("finish_allow_z", "finish_allow_z"),
+        ("finish_direction", "finish_direction"),
+        ("depth_max", "depth_max"),
+        ("pause_enabled", "pause_enabled"),
+        ("pause_distance", "pause_distance"),
+        ("mode", "mode"),
+        ("edge_type", "edge_type"),
+        ("edge_size", "edge_size"),
+        ("spindle", "spindle"),
+        ("coolant", "coolant"),
+    )),
+    OpType.CONTOUR: ("contour_", (
+        ("start_x", "start_x"),
+        ("start_z", "start_z"),
+        ("coord_mode", "coord_mode"),
+    )),
+    OpType.THREAD: ("thread_", (
+        ("tool", "tool"),
+        ("spindle", "spindle"),
+        ("coolant", "coolant"),
+        ("orientation", "orientation"),
+        ("standard", "standard"),
+        ("major_diameter", "major_diameter"),
+        ("pitch", "pitch"),
+        ("length", "length"),
+        ("passes", "passes"),
+        ("safe_z", "safe_z"),
+        ("thread_depth", "depth"),
+        ("peak_offset", "peak_offset"),
+        ("first_depth", "first_depth"),
+        ("retract_r", "retract_r"),
+        ("infeed_q", "infeed_q"),
+        ("spring_passes", "spring_passes"),
+        ("e", "e"),
+        ("l", "l"),
+    )),
+    OpType.GROOVE: ("groove_", (
+        ("tool", "tool"),
+        ("spindle", "spindle"),
+        ("coolant", "coolant"),
+        ("diameter", "diameter"),
+        ("width", "width"),
+        ("ref", "ref"),
+        ("lage", "lage"),
+        ("use_tool_width", "use_tool_width"),
+        ("cutting_width", "cutting_width"),
+        ("depth", "depth"),
+        ("z", "z"),
+        ("feed", "feed"),
+        ("stepA", "step_a"),
+        ("overlap", "overlap"),
+        ("retract", "retract"),
+        ("finish", "finish"),
+        ("sweep_feed", "sweep_feed"),
+        ("chip_amp", "chip_amp"),
+        ("chip_n", "chip_n"),
+        ("safe_z", "safe_z"),
+        ("reduced_feed_start_x", "reduced_feed_start_x"),
+        ("reduced_feed", "reduced_feed"),
+        ("reduced_rpm", "reduced_rpm"),
+    )),
+    OpType.DRILL: ("drill_", (
+        ("tool", "tool"),
+        ("spindle", "spindle"),
+        ("coolant", "coolant"),
+        ("mode", "mode"),
+        ("diameter", "diameter"),
+        ("depth", "depth"),
+        ("feed", "feed"),
+        ("safe_z", "safe_z"),
+        ("dwell", "dwell"),
+        ("peck_depth", "peck_depth"),
+    )),
+    OpType.KEYWAY: ("key_", (
+        ("tool", "tool"),
+        ("feed", "plunge_feed"),
+        ("mode", "mode"),
+        ("radial_side", "radial_side"),
+        ("coolant", "coolant"),
+        ("slot_count", "slot_count"),
+        ("slot_start_angle", "slot_start_angle"),
+        ("slot_angle_step", "slot_angle_step"),
+        ("start_x_dia", "start_diameter"),
+        ("start_z", "start_z"),
+        ("nut_length", "nut_length"),
+        ("nut_depth", "nut_depth"),
+        ("slot_width", "slot_width"),
+        ("cutting_width", "cutting_width"),
+        ("top_clearance", "top_clearance"),
+        ("depth_per_pass", "depth_per_pass"),
+        ("plunge_feed", "plunge_feed"),
+        ("use_c_axis", "use_c_axis"),
+        ("use_c_axis_switch", "use_c_axis_switch"),
+        ("c_axis_switch_p", "c_axis_switch_p"),
+    )),
+    OpType.ABSPANEN: ("parting_", (
+        ("side", "side"),
+        ("tool", "tool"),
+        ("spindle", "spindle"),
+        ("coolant", "coolant"),
+        ("feed", "feed"),
+        ("depth_per_pass", "depth_per_pass"),
+        ("mode", "mode"),
+        ("pause_enabled", "pause_enabled"),
+        ("pause_distance", "pause_distance"),
+        ("slice_strategy", "slice_strategy"),
+        ("slice_step", "slice_step"),
+        ("allow_undercut", "allow_undercut"),
+        ("finish_allow_x", "finish_allow_x"),
+        ("finish_allow_z", "finish_allow_z"),
+    )),
+}
+
+# Für diese Operationen sind die Widgets meist schon als Handler-Attribut
+# gebunden (gleicher Name wie das objectName) und haben Vorrang.
+_BOUND_ATTR_OPS = frozenset({OpType.KEYWAY})
+
 
 def setup_param_maps(handler) -> None:
-    handler.param_widgets: Dict[str, Dict[str, QtWidgets.QWidget]] = {
-        OpType.FACE: {
-            "tool": handler._get_widget_by_name("face_tool"),
-            "start_x": handler._get_widget_by_name("face_start_x"),
-            "start_z": handler._get_widget_by_name("face_start_z"),
-            "end_x": handler._get_widget_by_name("face_end_x"),
-            "end_z": handler._get_widget_by_name("face_end_z"),
-            "safe_z": handler._get_widget_by_name("face_safe_z"),
-            "feed": handler._get_widget_by_name("face_feed"),
-            "depth_per_pass": handler._get_widget_by_name("face_depth_per_pass"),
-            "finish_allow_x": handler._get_widget_by_name("face_finish_allow_x"),
-            "finish_allow_z": handler._get_widget_by_name("face_finish_allow_z"),
-            "finish_direction": handler._get_widget_by_name("face_finish_direction"),
-            "depth_max": handler._get_widget_by_name("face_depth_max"),
-            "pause_enabled": handler._get_widget_by_name("face_pause_enabled"),
-            "pause_distance": handler._get_widget_by_name("face_pause_distance"),
-            "mode": handler._get_widget_by_name("face_mode"),
-            "edge_type": handler._get_widget_by_name("face_edge_type"),
-            "edge_size": handler._get_widget_by_name("face_edge_size"),
-            "spindle": handler._get_widget_by_name("face_spindle"),
-            "coolant": handler._get_widget_by_name("face_coolant"),
-        },
-        OpType.CONTOUR: {
-            "start_x": handler._get_widget_by_name("contour_start_x"),
-            "start_z": handler._get_widget_by_name("contour_start_z"),
-            "coord_mode": handler._get_widget_by_name("contour_coord_mode"),
-        },
-        OpType.THREAD: {
-            "tool": handler._get_widget_by_name("thread_tool"),
-            "spindle": handler._get_widget_by_name("thread_spindle"),
-            "coolant": handler._get_widget_by_name("thread_coolant"),
-            "orientation": handler._get_widget_by_name("thread_orientation"),
-            "standard": handler._get_widget_by_name("thread_standard"),
-            "major_diameter": handler._get_widget_by_name("thread_major_diameter"),
-            "pitch": handler._get_widget_by_name("thread_pitch"),
-            "length": handler._get_widget_by_name("thread_length"),
-            "passes": handler._get_widget_by_name("thread_passes"),
-            "safe_z": handler._get_widget_by_name("thread_safe_z"),
-            "thread_depth": handler._get_widget_by_name("thread_depth"),
-            "peak_offset": handler._get_widget_by_name("thread_peak_offset"),
-            "first_depth": handler._get_widget_by_name("thread_first_depth"),
-            "retract_r": handler._get_widget_by_name("thread_retract_r"),
-            "infeed_q": handler._get_widget_by_name("thread_infeed_q"),
-            "spring_passes": handler._get_widget_by_name("thread_spring_passes"),
-            "e": handler._get_widget_by_name("thread_e"),
-            "l": handler._get_widget_by_name("thread_l"),
-        },
-        OpType.GROOVE: {
-            "tool": handler._get_widget_by_name("groove_tool"),
-            "spindle": handler._get_widget_by_name("groove_spindle"),
-            "coolant": handler._get_widget_by_name("groove_coolant"),
-            "diameter": handler._get_widget_by_name("groove_diameter"),
-            "width": handler._get_widget_by_name("groove_width"),
-            "ref": handler._get_widget_by_name("groove_ref"),
-            "lage": handler._get_widget_by_name("groove_lage"),
-            "use_tool_width": handler._get_widget_by_name("groove_use_tool_width"),
-            "cutting_width": handler._get_widget_by_name("groove_cutting_width"),
-            "depth": handler._get_widget_by_name("groove_depth"),
-            "z": handler._get_widget_by_name("groove_z"),
-            "feed": handler._get_widget_by_name("groove_feed"),
-            "stepA": handler._get_widget_by_name("groove_step_a"),
-            "overlap": handler._get_widget_by_name("groove_overlap"),
-            "retract": handler._get_widget_by_name("groove_retract"),
-            "finish": handler._get_widget_by_name("groove_finish"),
-            "sweep_feed": handler._get_widget_by_name("groove_sweep_feed"),
-            "chip_amp": handler._get_widget_by_name("groove_chip_amp"),
-            "chip_n": handler._get_widget_by_name("groove_chip_n"),
-            "safe_z": handler._get_widget_by_name("groove_safe_z"),
-            "reduced_feed_start_x": handler._get_widget_by_name("groove_reduced_feed_start_x"),
-            "reduced_feed": handler._get_widget_by_name("groove_reduced_feed"),
-            "reduced_rpm": handler._get_widget_by_name("groove_reduced_rpm"),
-        },
-        OpType.DRILL: {
-            "tool": handler._get_widget_by_name("drill_tool"),
-            "spindle": handler._get_widget_by_name("drill_spindle"),
-            "coolant": handler._get_widget_by_name("drill_coolant"),
-            "mode": handler._get_widget_by_name("drill_mode"),
-            "diameter": handler._get_widget_by_name("drill_diameter"),
-            "depth": handler._get_widget_by_name("drill_depth"),
-            "feed": handler._get_widget_by_name("drill_feed"),
-            "safe_z": handler._get_widget_by_name("drill_safe_z"),
-            "dwell": handler._get_widget_by_name("drill_dwell"),
-            "peck_depth": handler._get_widget_by_name("drill_peck_depth"),
-        },
-        OpType.KEYWAY: {
-            "tool": getattr(handler, "key_tool", None) or handler._get_widget_by_name("key_tool"),
-            "feed": getattr(handler, "key_plunge_feed", None) or handler._get_widget_by_name("key_plunge_feed"),
-            "mode": getattr(handler, "key_mode", None) or handler._get_widget_by_name("key_mode"),
-            "radial_side": getattr(handler, "key_radial_side", None) or handler._get_widget_by_name("key_radial_side"),
-            "coolant": getattr(handler, "key_coolant", None) or handler._get_widget_by_name("key_coolant"),
-            "slot_count": getattr(handler, "key_slot_count", None) or handler._get_widget_by_name("key_slot_count"),
-            "slot_start_angle": getattr(handler, "key_slot_start_angle", None) or handler._get_widget_by_name("key_slot_start_angle"),
-            "slot_angle_step": getattr(handler, "key_slot_angle_step", None) or handler._get_widget_by_name("key_slot_angle_step"),
-            "start_x_dia": getattr(handler, "key_start_diameter", None) or handler._get_widget_by_name("key_start_diameter"),
-            "start_z": getattr(handler, "key_start_z", None) or handler._get_widget_by_name("key_start_z"),
-            "nut_length": getattr(handler, "key_nut_length", None) or handler._get_widget_by_name("key_nut_length"),
-            "nut_depth": getattr(handler, "key_nut_depth", None) or handler._get_widget_by_name("key_nut_depth"),
-            "slot_width": getattr(handler, "key_slot_width", None) or handler._get_widget_by_name("key_slot_width"),
-            "cutting_width": getattr(handler, "key_cutting_width", None) or handler._get_widget_by_name("key_cutting_width"),
-            "top_clearance": getattr(handler, "key_top_clearance", None) or handler._get_widget_by_name("key_top_clearance"),
-            "depth_per_pass": getattr(handler, "key_depth_per_pass", None) or handler._get_widget_by_name("key_depth_per_pass"),
-            "plunge_feed": getattr(handler, "key_plunge_feed", None) or handler._get_widget_by_name("key_plunge_feed"),
-            "use_c_axis": getattr(handler, "key_use_c_axis", None) or handler._get_widget_by_name("key_use_c_axis"),
-            "use_c_axis_switch": getattr(handler, "key_use_c_axis_switch", None) or handler._get_widget_by_name("key_use_c_axis_switch"),
-            "c_axis_switch_p": getattr(handler, "key_c_axis_switch_p", None) or handler._get_widget_by_name("key_c_axis_switch_p"),
-        },
-        OpType.ABSPANEN: {
-            "side": handler._get_widget_by_name("parting_side"),
-            "tool": handler._get_widget_by_name("parting_tool"),
-            "spindle": handler._get_widget_by_name("parting_spindle"),
-            "coolant": handler._get_widget_by_name("parting_coolant"),
-            "feed": handler._get_widget_by_name("parting_feed"),
-            "depth_per_pass": handler._get_widget_by_name("parting_depth_per_pass"),
-            "mode": handler._get_widget_by_name("parting_mode"),
-            "pause_enabled": handler._get_widget_by_name("parting_pause_enabled"),
-            "pause_distance": handler._get_widget_by_name("parting_pause_distance"),
-            "slice_strategy": handler._get_widget_by_name("parting_slice_strategy"),
-            "slice_step": handler._get_widget_by_name("parting_slice_step"),
-            "allow_undercut": handler._get_widget_by_name("parting_allow_undercut"),
-            "finish_allow_x": handler._get_widget_by_name("parting_finish_allow_x"),
-            "finish_allow_z": handler._get_widget_by_name("parting_finish_allow_z"),
-        },
-    }
+    # Ein Baumdurchlauf (objectName-Cache) statt ~100 Einzel-Lookups; nur
+    # fehlende oder mehrdeutige Namen gehen über die tolerante Suche.
+    cache = getattr(handler, "_widget_name_cache", None)
+    if not cache:
+        handler._rebuild_widget_name_cache()
+        cache = getattr(handler, "_widget_name_cache", None) or {}
+
+    def lookup(obj_name: str):
+        bucket = cache.get(obj_name)
+        if bucket and len(bucket) == 1:
+            return bucket[0]
+        return handler._get_widget_by_name(obj_name)
+
+    param_widgets: Dict[str, Mapping[str, QtWidgets.QWidget]] = {}
+    signal_table: List[Tuple[QtWidgets.QWidget, object]] = []
+    all_widgets: List[QtWidgets.QWidget] = []
+    seen = set()
+    for op_type, (prefix, fields) in PARAM_MAP_SPEC.items():
+        bound = op_type in _BOUND_ATTR_OPS
+        widgets = {}
+        for key, suffix in fields:
+            obj_name = prefix + suffix
+            widget = getattr(handler, obj_name, None) if bound else None
+            widget = widgets[key] = widget or lookup(obj_name)
+            if widget is None or id(widget) in seen:
+                continue
+            seen.add(id(widget))
+            all_widgets.append(widget)
+            signal = _param_change_signal(widget)
+            if signal is not None:
+                signal_table.append((widget, signal))
+        param_widgets[op_type] = MappingProxyType(widgets)
+    # Nach dem Aufbau nur noch lesend genutzt: eingefroren, flache Tupel fürs Verbinden.
+    handler.param_widgets = MappingProxyType(param_widgets)
+    all_widgets = tuple(all_widgets)
+    # Gleiche Widgets wie beim letzten Aufbau: Tupel-Identität behalten, damit
+    # connect_param_change_signals den Durchlauf ganz überspringen kann.
+    previous = getattr(handler, "_all_param_widgets", None)
+    if previous is not None and all_widgets == previous and getattr(handler, "_param_collectors", None):
+        return
+    handler._param_signal_table = tuple(signal_table)
+    handler._all_param_widgets = all_widgets
+    handler._param_collectors = MappingProxyType({
+        op_type: tuple(
+            (key, widget, param_collector(key, widget))
+            for key, widget in widgets.items()
+            if widget is not None
+        )
+        for op_type, widgets in param_widgets.items()
+    })
+
+
+def param_collector(key: str, widget) -> Callable[[object], object]:
+    """Leser für einen Parameter-Widget, einmal beim Aufbau nach Typ gewählt.
+
+    Rückgabe None bedeutet: Parameter nicht setzen (leeres Textfeld o. ä.).
+    """
+    if isinstance(widget, (QtWidgets.QSpinBox, QtWidgets.QDoubleSpinBox)):
+        return _read_spin
+    if isinstance(widget, QtWidgets.QComboBox):
+        return _read_slice_strategy if key == "slice_strategy" else _read_combo
+    if isinstance(widget, QtWidgets.QLineEdit):
+        return _read_line_edit
+    if isinstance(widget, QtWidgets.QAbstractButton):
+        return _read_button
+    return _read_fallback
+
+
+def _read_spin(widget):
+    return float(widget.value())
+
+
+def _read_slice_strategy(widget):
+    idx = widget.currentIndex()
+    data = widget.itemData(idx, QtCore.Qt.UserRole)
+    if isinstance(data, (int, float)):
+        return int(float(data))
+    return idx + 1
+
+
+def _read_combo(widget):
+    data = widget.currentData()
+    return data if data is not None else float(widget.currentIndex())
+
+
+def _read_line_edit(widget):
+    text = widget.text().strip()
+    if text == "":
+        return None
+    # try float, else keep as string
+    try:
+        return float(text.replace(",", "."))
+    except ValueError:
+        return text
+
+
+def _read_button(widget):
+    return float(widget.isChecked())
+
+
+def _read_fallback(widget):
+    # Only record if we can safely read something
+    if hasattr(widget, "value"):
+        return float(widget.value())
+    if hasattr(widget, "text"):
+        text = str(widget.text()).strip()
+        if text != "":
+            return text
+    return None
+
+
+def _param_change_signal(widget):
+    """Signal, das eine Parameteränderung meldet (None = nicht verbinden)."""
+    # Vorschau-Widgets liegen teils mit im Formular, sind aber keine Parameter.
+    if hasattr(widget, "set_paths") or hasattr(widget, "set_primitives"):
+        return None
+    if isinstance(widget, QtWidgets.QComboBox):
+        return widget.currentIndexChanged
+    if isinstance(widget, QtWidgets.QAbstractButton):
+        return widget.toggled
+    return getattr(widget, "valueChanged", None)
@@ -8,7 +8,7 @@ from qtpy import QtCore, QtWidgets
 
 from .model import OpType
 from .persistence import build_program_data as build_program_data_payload
-from .storage import parse_program_payload
+from .storage import atomic_open, parse_program_payload, read_step_file, write_gcode_lines, write_step_file
 
 
 def build_program_data(handler):
@@ -40,7 +40,7 @@ def write_program_file(handler, file_path: str) -> None:
         ):
             raise ValueError("Programmspeichern abgebrochen: fuer mindestens einen Step fehlt eine Step-Datei.")
     program_data = handler._build_program_data()
-    with builtins.open(program_path, "w", encoding="utf-8") as handle:
+    with atomic_open(program_path, "w", encoding="utf-8") as handle:
         json.dump(program_data, handle, indent=2, default=str)
     handler._current_program_path = program_path if program_path else previous_program_path
 
@@ -48,8 +48,7 @@ def write_program_file(handler, file_path: str) -> None:
 def write_gcode_file(handler, file_path: str) -> None:
     gcode_path = handler._normalized_file_path(file_path) or file_path
     lines = handler._build_gcode_lines()
-    with builtins.open(gcode_path, "w", encoding="utf-8") as handle:
-        handle.write("\n".join(lines))
+    write_gcode_lines(gcode_path, lines)
     handler._current_gcode_path = gcode_path
 
 
@@ -88,9 +87,7 @@ def handle_save_step(handler, *, step_file_filter: str) -> None:
             if warning:
                 QtWidgets.QMessageBox.warning(parent, "Werkzeuglage prüfen", warning)
             handler._set_step_file_path(op, file_path)
-            data = handler._operation_to_step_data(op)
-            with builtins.open(file_path, "w", encoding="utf-8") as handle:
-                json.dump(data, handle, indent=2)
+            write_step_file(file_path, handler._operation_to_step_data(op))
         except Exception as exc:
             QtWidgets.QMessageBox.critical(parent, "Step speichern", f"Step konnte nicht gespeichert werden:\n{exc}")
             return
@@ -126,8 +123,7 @@ def handle_load_step(handler, *, step_file_filter: str) -> None:
         if not file_path:
             return
         try:
-            with builtins.open(file_path, "r", encoding="utf-8") as handle:
-                data = json.load(handle)
+            data = read_step_file(file_path)
         except Exception as exc:
             QtWidgets.QMessageBox.critical(parent, "Step laden", f"Step konnte nicht geöffnet werden:\n{exc}")
             return
@@ -225,7 +221,7 @@ def handle_load_program(handler) -> None:
             QtWidgets.QMessageBox.warning(parent, "Programm laden", str(exc))
             return
 
-        handler.model.operations.clear()
+        handler.model.clear_operations()
         handler._op_row_user_selected = False
         handler._active_form_operation_index = -1
         handler._load_program_header_to_form(header)
@@ -296,9 +292,7 @@ def handle_save_changes(handler) -> None:
             if not step_path:
                 continue
             linked_steps += 1
-            data = handler._operation_to_step_data(op)
-            with builtins.open(step_path, "w", encoding="utf-8") as handle:
-                json.dump(data, handle, indent=2)
+            write_step_file(step_path, handler._operation_to_step_data(op))
             handler._remember_dialog_path(
                 settings,
                 step_path,
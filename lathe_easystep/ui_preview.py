@@ -2,7 +2,13 @@ from __future__ import annotations
 
 from typing import Callable, Dict, List, Tuple
 
+from qtpy import QtCore
+
 from .model import OpType, Operation
+from .ui_contour import live_contour_params, live_contour_path
+
+# Sammelfenster für edit-getriebene Vorschau-Refreshes (~ein Frame).
+_PREVIEW_DEBOUNCE_MS = 16
 
 
 def setup_slice_view(handler) -> None:
@@ -68,6 +74,8 @@ def setup_slice_view(handler) -> None:
 
 
 def ensure_preview_widgets(handler, preview_widget_cls, qt_widget_cls) -> None:
+    if handler.preview is not None and handler.contour_preview is not None:
+        return
     root = handler.root_widget or handler._find_root_widget()
     if not root:
         return
@@ -130,13 +138,8 @@ def collect_preview_state(
             current_type = OpType.PROGRAM_HEADER
 
         if current_type == OpType.CONTOUR and (handler.contour_start_x or handler.contour_segments):
-            params: Dict[str, object] = {
-                "start_x": handler.contour_start_x.value() if handler.contour_start_x else 0.0,
-                "start_z": handler.contour_start_z.value() if handler.contour_start_z else 0.0,
-                "coord_mode": handler.contour_coord_mode.currentIndex() if getattr(handler, "contour_coord_mode", None) else 0,
-                "segments": handler._collect_contour_segments(),
-            }
-            contour_prims = build_contour_path(params)
+            params: Dict[str, object] = live_contour_params(handler)
+            contour_prims = live_contour_path(handler, params, build_contour_path)
             if contour_prims:
                 paths.append(contour_prims)
                 active = len(paths) - 1
@@ -170,32 +173,31 @@ def collect_preview_state(
 
     prog = handler._collect_program_header() or {}
     prog["__operations"] = list(handler.model.operations)
+    # Overlays (Rohteil, Rückzug, Arbeitsgrenzen, Futter) gehören vor die
+    # Operationspfade; gesammelt und einmal vorn eingefügt statt je insert(0).
+    overlays: List[List[Tuple[float, float]]] = []
     try:
-        inserts = 0
         stock_primitives = build_stock_outline(prog)
         if stock_primitives:
-            paths.insert(0, stock_primitives)
-            inserts += 1
+            overlays.append(stock_primitives)
 
         retract_primitives = build_retract_primitives(prog)
         if retract_primitives:
-            paths.insert(inserts, retract_primitives)
-            inserts += 1
+            overlays.append(retract_primitives)
 
         worklimit_primitives = build_worklimit_primitives(prog, stock_primitives or [])
         if worklimit_primitives:
-            paths.insert(inserts, worklimit_primitives)
-            inserts += 1
+            overlays.append(worklimit_primitives)
 
         chuck_nogo_primitives = build_chuck_nogo_primitives(prog)
         if chuck_nogo_primitives:
-            paths.insert(inserts, chuck_nogo_primitives)
-            inserts += 1
-
-        if active >= 0 and inserts:
-            active += inserts
+            overlays.append(chuck_nogo_primitives)
     except Exception as exc:
         handler._log("[LatheEasyStep] stock/retract preview ERROR:", exc, level="error")
+    if overlays:
+        paths[:0] = overlays
+        if active >= 0:
+            active += len(overlays)
 
     return paths, active, prog, active_operation
 
@@ -209,6 +211,9 @@ def apply_preview_paths(
     program_context: Dict[str, object] | None = None,
     active_operation: Operation | None = None,
 ) -> None:
+    # Jeder direkte Aufruf (z. B. Kontur-Tab) überschreibt den zuletzt
+    # verglichenen Stand; refresh_preview setzt die Signatur danach neu.
+    handler._last_preview_sig = None
     if handler.preview:
         collision = _detect_preview_collision(paths)
         try:
@@ -348,6 +353,9 @@ def refresh_preview(
         handler._ensure_preview_widgets()
     if handler.preview is None and handler.contour_preview is None:
         return
+    if _defer_hidden_preview(handler):
+        return
+    handler._preview_dirty = False
     paths, active, prog, active_operation = collect_preview_state(
         handler,
         build_contour_path=build_contour_path,
@@ -362,6 +370,9 @@ def refresh_preview(
         build_worklimit_primitives=build_worklimit_primitives,
         build_chuck_nogo_primitives=build_chuck_nogo_primitives,
     )
+    signature = _preview_signature(handler, paths, active, prog, active_operation)
+    if signature is not None and signature == getattr(handler, "_last_preview_sig", None):
+        return
     handler._set_preview_paths(
         paths,
         active,
@@ -369,6 +380,70 @@ def refresh_preview(
         program_context=prog,
         active_operation=active_operation,
     )
+    handler._last_preview_sig = signature
+
+
+def _defer_hidden_preview(handler) -> bool:
+    """Keine Vorschau sichtbar (anderer Tab/Panel verdeckt): nur vormerken.
+
+    Greift nur, wenn jede Vorschau ihr Sichtbarwerden meldet (shown-Signal);
+    on_preview_shown holt den Refresh dann genau einmal nach.
+    """
+    widgets = [w for w in (handler.preview, handler.contour_preview) if w is not None]
+    for widget in widgets:
+        if getattr(widget, "isVisible", lambda: True)() or not hasattr(widget, "shown"):
+            return False
+    for widget in widgets:
+        handler._connect_unique(widget.shown, handler._on_preview_shown)
+    handler._preview_dirty = True
+    return True
+
+
+def request_preview_refresh(handler) -> None:
+    """Vorschau-Refresh für Eingabe-Bursts vormerken (Spinbox ziehen/scrollen).
+
+    Alle Änderungen innerhalb von _PREVIEW_DEBOUNCE_MS laufen in einen
+    Refresh zusammen; der liest beim Auslösen den dann aktuellen Stand.
+    """
+    if handler._preview_refresh_scheduled:
+        return
+    handler._preview_refresh_scheduled = True
+    QtCore.QTimer.singleShot(_PREVIEW_DEBOUNCE_MS, handler._flush_preview_refresh)
+
+
+def flush_preview_refresh(handler) -> None:
+    handler._preview_refresh_scheduled = False
+    handler._refresh_preview()
+
+
+def on_preview_shown(handler) -> None:
+    if not getattr(handler, "_preview_dirty", False):
+        return
+    handler._preview_dirty = False
+    handler._refresh_preview()
+
+
+def _preview_signature(handler, paths, active, prog, active_operation):
+    """Vergleichbarer Schnappschuss der Vorschau-Eingaben (None = immer zeichnen).
+
+    Pfade und Parameter werden flach kopiert; Geometrie-Builder liefern stets
+    neue Listen, daher reicht das für den Vergleich mit dem letzten Stand.
+    """
+    try:
+        slice_widget = handler.preview_slice
+        return (
+            id(handler.preview),
+            id(handler.contour_preview),
+            bool(slice_widget is not None and slice_widget.isVisible()),
+            bool(getattr(handler.preview, "slice_enabled", False)),
+            [list(prims) for prims in paths],
+            active,
+            {key: value for key, value in prog.items() if key != "__operations"},
+            [id(op) for op in prog.get("__operations") or ()],
+            None if active_operation is None else (active_operation.op_type, dict(active_operation.params or {})),
+        )
+    except Exception:
+        return None
 
 
 def _detect_preview_collision(paths) -> bool:
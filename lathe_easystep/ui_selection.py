@@ -66,6 +66,8 @@ def handle_selection_change(handler, row: int) -> None:
     ):
         try:
             handler._sync_form_to_operation(previous_row)
+            if getattr(handler, "_param_change_pending", False):
+                handler._cancel_param_change()
         except Exception as exc:
             handler._log(f"[LatheEasyStep] sync previous operation failed: {exc}", level="warning")
 
@@ -41,81 +41,66 @@ def connect_resolver_fallbacks(handler) -> None:
 def connect_tool_preview_signals(handler) -> None:
     for combo_name in ["face_tool", "drill_tool", "groove_tool", "thread_tool", "parting_tool", "key_tool"]:
         combo = getattr(handler, combo_name, None)
-        if combo and not getattr(handler, f"_{combo_name}_connected", False):
-            combo.currentIndexChanged.connect(handler._update_tool_previews)
-            setattr(handler, f"_{combo_name}_connected", True)
+        if combo:
+            handler._connect_unique(combo.currentIndexChanged, handler._update_tool_previews)
 
 
 def connect_param_change_signals(handler) -> None:
     handler._setup_param_maps()
-    for widgets in handler.param_widgets.values():
-        for widget in widgets.values():
-            if widget is None:
-                continue
-            if widget in handler._connected_param_widgets:
-                continue
-            if hasattr(widget, "set_paths") or hasattr(widget, "set_primitives"):
-                continue
-            if isinstance(widget, QtWidgets.QComboBox):
-                widget.currentIndexChanged.connect(handler._handle_param_change)
-            elif isinstance(widget, QtWidgets.QAbstractButton):
-                widget.toggled.connect(handler._handle_param_change)
-            elif hasattr(widget, "valueChanged"):
-                widget.valueChanged.connect(handler._handle_param_change)
-            handler._connected_param_widgets.add(widget)
+    table = handler._param_signal_table
+    if table is getattr(handler, "_param_signal_table_connected", None):
+        return
+    connected = handler._connected_param_widgets
+    for widget, signal in table:
+        if widget in connected:
+            continue
+        signal.connect(handler._handle_param_change)
+        connected.add(widget)
+    handler._param_signal_table_connected = table
 
 
 def connect_global_form_signals(handler) -> None:
-    if handler.program_unit and handler.program_unit not in handler._connected_global_widgets:
-        handler.program_unit.currentIndexChanged.connect(handler._handle_global_change)
-        handler._connected_global_widgets.add(handler.program_unit)
-    if handler.program_shape and handler.program_shape not in handler._connected_global_widgets:
-        handler.program_shape.currentIndexChanged.connect(handler._handle_global_change)
-        handler._connected_global_widgets.add(handler.program_shape)
-    if handler.program_retract_mode and handler.program_retract_mode not in handler._connected_global_widgets:
-        handler.program_retract_mode.currentIndexChanged.connect(handler._handle_global_change)
-        handler._connected_global_widgets.add(handler.program_retract_mode)
-    if handler.program_has_subspindle and handler.program_has_subspindle not in handler._connected_global_widgets:
-        handler.program_has_subspindle.toggled.connect(handler._update_subspindle_visibility)
-        handler._connected_global_widgets.add(handler.program_has_subspindle)
-    for chuck_combo in (
-        getattr(handler, "program_machine_profile", None),
-        getattr(handler, "program_chuck_size", None),
-        getattr(handler, "program_chuck_part_type", None),
-        getattr(handler, "program_chuck_grip_mode", None),
-        getattr(handler, "program_chuck_profile", None),
-    ):
-        if chuck_combo and chuck_combo not in handler._connected_global_widgets:
-            chuck_combo.currentIndexChanged.connect(handler._handle_global_change)
-            handler._connected_global_widgets.add(chuck_combo)
-    for chuck_spin in (
-        getattr(handler, "program_chuck_x_min", None),
-        getattr(handler, "program_chuck_x_max", None),
-        getattr(handler, "program_chuck_z_limit", None),
+    connected = handler._connected_global_widgets
+    wiring = [
+        (handler.program_unit, "currentIndexChanged", handler._on_unit_changed),
+        (handler.program_shape, "currentIndexChanged", handler._request_global_change),
+        (handler.program_retract_mode, "currentIndexChanged", handler._request_global_change),
+        (handler.program_has_subspindle, "toggled", handler._request_subspindle_update),
+    ]
+    for name in (
+        "program_machine_profile",
+        "program_chuck_size",
+        "program_chuck_part_type",
+        "program_chuck_grip_mode",
+        "program_chuck_profile",
     ):
-        if chuck_spin and chuck_spin not in handler._connected_global_widgets and hasattr(chuck_spin, "valueChanged"):
-            chuck_spin.valueChanged.connect(handler._handle_global_change)
-            handler._connected_global_widgets.add(chuck_spin)
+        wiring.append((getattr(handler, name, None), "currentIndexChanged", handler._handle_global_change))
+    for name in ("program_chuck_x_min", "program_chuck_x_max", "program_chuck_z_limit"):
+        wiring.append((getattr(handler, name, None), "valueChanged", handler._handle_global_change))
+    for widget, signal_name, slot in wiring:
+        if not widget or widget in connected:
+            continue
+        signal = getattr(widget, signal_name, None)
+        if signal is None:
+            continue
+        signal.connect(slot)
+        connected.add(widget)
 
 
 def connect_language_signal(handler) -> None:
     lang_combo = handler._get_widget_by_name("program_language")
-    if lang_combo and not getattr(handler, "_language_connected", False):
-        lang_combo.currentIndexChanged.connect(handler._handle_language_change)
-        handler._language_connected = True
+    if lang_combo:
+        handler._connect_unique(lang_combo.currentIndexChanged, handler._handle_language_change)
 
 
 def connect_mode_visibility_signals(handler) -> None:
     try:
-        if getattr(handler, "face_mode", None):
-            handler.face_mode.currentIndexChanged.connect(lambda *_: handler._update_face_visibility())
-        if getattr(handler, "face_edge_type", None):
-            handler.face_edge_type.currentIndexChanged.connect(lambda *_: handler._update_face_visibility())
+        handler._connect_combo_once(getattr(handler, "face_mode", None), handler._request_face_update)
+        handler._connect_combo_once(getattr(handler, "face_edge_type", None), handler._request_face_update)
     except Exception:
         pass
     try:
-        if getattr(handler, "drill_mode", None):
-            handler.drill_mode.currentIndexChanged.connect(lambda *_: handler._update_drill_visibility())
+        handler._connect_combo_once(getattr(handler, "drill_mode", None), handler._request_drill_update)
     except Exception:
         pass
 
@@ -125,37 +110,15 @@ def connect_list_ops_signals(handler) -> None:
     if widget is None:
         return
 
-    if getattr(handler, "_list_ops_signal_widget", None) is not widget:
-        handler._list_ops_connected = False
-        handler._list_ops_double_click_connected = False
-        handler._list_ops_click_connected = False
-        handler._list_ops_activate_connected = False
-        handler._list_ops_signal_widget = widget
-
-    if not getattr(handler, "_list_ops_connected", False):
-        try:
-            widget.currentRowChanged.connect(handler._handle_selection_change)
-        except Exception:
-            pass
-        handler._list_ops_connected = True
-    if not getattr(handler, "_list_ops_double_click_connected", False):
-        try:
-            widget.itemDoubleClicked.connect(handler._on_step_double_clicked)
-        except Exception:
-            pass
-        handler._list_ops_double_click_connected = True
-    if not getattr(handler, "_list_ops_click_connected", False):
-        try:
-            widget.clicked.connect(handler._mark_operation_user_selected)
-        except Exception:
-            pass
-        handler._list_ops_click_connected = True
-    if not getattr(handler, "_list_ops_activate_connected", False):
-        try:
-            widget.itemActivated.connect(handler._on_step_double_clicked)
-        except Exception:
-            pass
-        handler._list_ops_activate_connected = True
+    for signal_name, slot in (
+        ("currentRowChanged", handler._handle_selection_change),
+        ("itemDoubleClicked", handler._on_step_double_clicked),
+        ("clicked", handler._mark_operation_user_selected),
+        ("itemActivated", handler._on_step_double_clicked),
+    ):
+        signal = getattr(widget, signal_name, None)
+        if signal is not None:
+            handler._connect_unique(signal, slot)
 
 
 def connect_core_signals(handler) -> None:
@@ -164,20 +127,17 @@ def connect_core_signals(handler) -> None:
         handler.tab_params = handler._get_widget_by_name("tabParams")
     handler._ensure_list_ops_type()
 
-    handler._connect_button_once(handler.btn_add, handler._handle_add_operation, "_btn_add_connected")
-    handler._connect_button_once(handler.btn_delete, handler._handle_delete_operation, "_btn_delete_connected")
-    handler._connect_button_once(handler.btn_move_up, handler._handle_move_up, "_btn_move_up_connected")
-    handler._connect_button_once(handler.btn_move_down, handler._handle_move_down, "_btn_move_down_connected")
-    handler._connect_button_once(handler.btn_new_program, handler._handle_new_program, "_btn_new_program_connected")
-    handler._connect_button_once(handler.btn_generate, handler._handle_generate_gcode, "_btn_generate_connected")
-    handler._connect_button_once(handler.btn_save_changes, handler._handle_save_changes, "_btn_save_changes_connected")
-    handler._connect_button_once(handler.btn_load_tool_table, handler._handle_load_tool_table, "_btn_load_tool_table_connected")
-    handler._connect_button_once(handler.btn_save_program, handler._handle_save_program, "_btn_save_program_connected")
-    handler._connect_button_once(handler.btn_load_program, handler._handle_load_program, "_btn_load_program_connected")
+    handler._connect_button_once(handler.btn_add, handler._handle_add_operation)
+    handler._connect_button_once(handler.btn_delete, handler._handle_delete_operation)
+    handler._connect_button_once(handler.btn_move_up, handler._handle_move_up)
+    handler._connect_button_once(handler.btn_move_down, handler._handle_move_down)
+    handler._connect_button_once(handler.btn_new_program, handler._handle_new_program)
+    handler._connect_button_once(handler.btn_generate, handler._handle_generate_gcode)
+    handler._connect_button_once(handler.btn_save_changes, handler._handle_save_changes)
+    handler._connect_button_once(handler.btn_load_tool_table, handler._handle_load_tool_table)
+    handler._connect_button_once(handler.btn_save_program, handler._handle_save_program)
+    handler._connect_button_once(handler.btn_load_program, handler._handle_load_program)
     connect_list_ops_signals(handler)
-    if handler.tab_params and not getattr(handler, "_tab_params_connected", False):
-        handler.tab_params.currentChanged.connect(handler._handle_tab_changed)
-        handler._tab_params_connected = True
-    if handler.parting_mode and not getattr(handler, "_parting_mode_connected", False):
-        handler.parting_mode.currentIndexChanged.connect(handler._update_parting_mode_visibility)
-        handler._parting_mode_connected = True
+    if handler.tab_params:
+        handler._connect_unique(handler.tab_params.currentChanged, handler._handle_tab_changed)
+    handler._connect_combo_once(handler.parting_mode, handler._update_parting_mode_visibility)
@@ -5,6 +5,136 @@ import re
 from qtpy import QtCore, QtWidgets
 
 
+# Reihenfolge, in der gesammelte Sichtbarkeits-Updates ausgeführt werden.
+_VISIBILITY_UPDATE_ORDER = ("program", "retract", "subspindle", "face", "drill")
+
+# Rohteilform (Index bzw. Text) -> sichtbare Felder label_prog_<f>/program_<f>.
+_SHAPE_BY_INDEX = ("zylinder", "rohr", "rechteck", "n-eck")
+_SHAPE_FIELDS = ("xa", "xi", "w", "l", "n", "sw")
+_SHAPE_VISIBLE_FIELDS = {
+    "zylinder": frozenset({"xa"}),
+    "rohr": frozenset({"xa", "xi"}),
+    "rechteck": frozenset({"w", "l"}),
+    "n-eck": frozenset({"n", "sw"}),
+    "ne-eck": frozenset({"n", "sw"}),
+}
+# Rückzugsmodus -> sichtbare Widgets; unbekannte Modi zeigen alles.
+_RETRACT_WIDGET_NAMES = (
+    "label_prog_xra", "program_xra", "program_xra_absolute",
+    "label_prog_xri", "program_xri", "program_xri_absolute",
+    "label_prog_zra", "program_zra", "program_zra_absolute",
+    "label_prog_zri", "program_zri", "program_zri_absolute",
+    "label_retract_hint",
+)
+_RETRACT_VISIBLE_NAMES = {
+    0: frozenset({
+        "label_prog_xra", "program_xra", "program_xra_absolute",
+        "label_prog_zra", "program_zra", "program_zra_absolute",
+        "label_retract_hint",
+    }),
+    1: frozenset({
+        "label_prog_xra", "program_xra", "program_xra_absolute",
+        "label_prog_zra", "program_zra", "program_zra_absolute",
+        "label_prog_xri", "program_xri", "program_xri_absolute",
+        "label_retract_hint",
+    }),
+}
+
+
+def _lookup_widget(handler, name: str, root=None):
+    """_get_widget_by_name (ggf. root.findChild) mit gemerkten Fehlschlägen.
+
+    Optionale Widgets, die im .ui fehlen, lösen sonst bei jedem
+    Sichtbarkeits-Update eine volle Baumsuche aus. Fehlschläge gelten bis
+    zum nächsten _rebuild_widget_name_cache (neues Cache-Objekt).
+    """
+    name_cache = getattr(handler, "_widget_name_cache", None)
+    misses = getattr(handler, "_widget_lookup_misses", None)
+    if misses is None or misses[0] is not name_cache:
+        misses = handler._widget_lookup_misses = (name_cache, set())
+    if name in misses[1]:
+        return None
+    try:
+        widget = handler._get_widget_by_name(name)
+    except Exception:
+        widget = None
+    if widget is None and root is not None:
+        try:
+            widget = root.findChild(QtWidgets.QWidget, name, QtCore.Qt.FindChildrenRecursively)
+        except Exception:
+            widget = None
+    if widget is None:
+        misses[1].add(name)
+    return widget
+
+
+def _find_named(handler, root, cls, *names):
+    """Erstes Widget vom Typ cls zu einem der objectNames.
+
+    Liest aus dem einmal aufgebauten Namens-Cache; nur solange der noch
+    leer ist, wird der Baum per findChild durchsucht.
+    """
+    name_cache = getattr(handler, "_widget_name_cache", None)
+    if name_cache:
+        for name in names:
+            for widget in name_cache.get(name, ()):
+                if isinstance(widget, cls):
+                    return widget
+        return None
+    for name in names:
+        widget = root.findChild(cls, name)
+        if widget is not None:
+            return widget
+    return None
+
+
+def request_visibility_update(handler, *kinds: str) -> None:
+    """Merkt Sichtbarkeits-Updates vor und führt sie gesammelt im nächsten Event-Loop-Tick aus.
+
+    Beim Start (und bei Signal-Kaskaden) feuern die Combos mehrfach hintereinander;
+    so läuft jedes _update_<kind>_visibility() höchstens einmal pro Tick.
+    """
+    pending = getattr(handler, "_visibility_dirty", None)
+    if pending is None:
+        pending = handler._visibility_dirty = set()
+    pending.update(kinds)
+    if getattr(handler, "_visibility_flush_scheduled", False):
+        return
+    handler._visibility_flush_scheduled = True
+    QtCore.QTimer.singleShot(0, handler._flush_visibility_updates)
+
+
+def flush_visibility_updates(handler) -> None:
+    handler._visibility_flush_scheduled = False
+    pending = getattr(handler, "_visibility_dirty", None) or set()
+    handler._visibility_dirty = set()
+    for kind in _VISIBILITY_UPDATE_ORDER:
+        if kind in pending:
+            getattr(handler, f"_update_{kind}_visibility")()
+
+
+def request_global_change(handler, *args, **kwargs) -> None:
+    """Gesammelte Variante von handle_global_change für Rohteilform/Rückzug-Combos."""
+    if getattr(handler, "_global_change_scheduled", False):
+        return
+    handler._global_change_scheduled = True
+    QtCore.QTimer.singleShot(0, handler._flush_global_change)
+
+
+def flush_global_change(handler) -> None:
+    handler._global_change_scheduled = False
+    handler._handle_global_change()
+
+
+def on_unit_changed(handler, *args) -> None:
+    """Einheit (mm/inch) gewechselt: Suffixe sofort, Sichtbarkeit gesammelt."""
+    handler._apply_unit_suffix()
+    handler._apply_chuck_safety_preset()
+    handler._request_visibility_update("program", "retract", "subspindle", "face")
+    if getattr(handler, "_startup_complete", False):
+        handler._refresh_preview()
+
+
 def handle_global_change(handler, *args, **kwargs):
     sender_name = ""
     try:
@@ -157,6 +287,40 @@ def apply_chuck_safety_preset(handler) -> None:
         handler._applying_chuck_preset = False
 
 
+# Einheiten in Label-Texten ("Tiefe (mm)"); nach dem ersten Durchlauf steht
+# die Einheit nur noch im Spinbox-Suffix.
+_UNIT_HINT_RE = re.compile(r"mm|inch|/U")
+_ANGLE_SPINBOX_NAMES = frozenset({"thread_infeed_q", "key_slot_start_angle", "key_slot_angle_step"})
+
+
+def _unit_suffix_spinboxes(handler, root):
+    """(Spinbox, Suffix-Art)-Paare unter root, einmal klassifiziert.
+
+    Der Baum wird nur beim ersten Aufruf je Panel (bzw. nach einem neuen
+    Namens-Cache) durchsucht; Einheitenwechsel iterieren danach nur die
+    gemerkte Liste.
+    """
+    name_cache = getattr(handler, "_widget_name_cache", None)
+    cached = getattr(handler, "_unit_suffix_cache", None)
+    if cached is not None and cached[0] is root and cached[1] is name_cache:
+        return cached[2]
+    entries = []
+    for sb in root.findChildren(QtWidgets.QDoubleSpinBox):
+        name = sb.objectName()
+        lname = name.lower()
+        if name in _ANGLE_SPINBOX_NAMES:
+            kind = "angle"
+        elif name in ("program_s1", "program_s3") or "spindle" in lname:
+            kind = "plain"
+        elif "feed" in lname:
+            kind = "feed"
+        else:
+            kind = "unit"
+        entries.append((sb, kind))
+    handler._unit_suffix_cache = (root, name_cache, entries)
+    return entries
+
+
 def apply_unit_suffix(handler):
     if handler.program_unit is None:
         handler.program_unit = handler._find_unit_combo()
@@ -170,22 +334,16 @@ def apply_unit_suffix(handler):
     root = handler.root_widget or handler.program_unit.window()
     if root is None:
         return
-    for sb in root.findChildren(QtWidgets.QDoubleSpinBox):
-        name = sb.objectName()
-        angle_fields = {"thread_infeed_q", "key_slot_start_angle", "key_slot_angle_step"}
-        if name in angle_fields:
-            sb.setSuffix(" °")
-            continue
-        if name in ("program_s1", "program_s3") or "spindle" in name.lower():
-            sb.setSuffix("")
-            continue
-        sb.setSuffix(feed_suffix if "feed" in name.lower() else unit_suffix)
-    if not hasattr(handler, "_labels_cleaned") or not handler._labels_cleaned:
+    suffixes = {"unit": unit_suffix, "feed": feed_suffix, "angle": " °", "plain": ""}
+    for sb, kind in _unit_suffix_spinboxes(handler, root):
+        sb.setSuffix(suffixes[kind])
+    if not getattr(handler, "_labels_cleaned", False):
         for lbl in root.findChildren(QtWidgets.QLabel):
             text = lbl.text()
-            if "(" in text and ")" in text and any(u in text for u in ("mm", "inch", "/U")):
-                prefix = text.split("(", 1)[0].rstrip()
-                lbl.setText(prefix)
+            cut = text.find("(")
+            if cut < 0 or ")" not in text or _UNIT_HINT_RE.search(text) is None:
+                continue
+            lbl.setText(text[:cut].rstrip())
         handler._labels_cleaned = True
     try:
         win = root.window()
@@ -207,47 +365,19 @@ def update_program_visibility(handler, shape=None):
     if shape is None or shape == "":
         return
     if isinstance(shape, int):
-        shape_map = {0: "zylinder", 1: "rohr", 2: "rechteck", 3: "n-eck"}
-        shape_norm = shape_map.get(shape, str(shape)).strip().lower()
+        shape_norm = (_SHAPE_BY_INDEX[shape] if 0 <= shape < len(_SHAPE_BY_INDEX) else str(shape)).strip().lower()
     else:
         shape_norm = str(shape).strip().lower()
     root = handler.root_widget or handler._find_root_widget() or getattr(handler, "w", None)
     if root is None:
         return
-    def _w(objname: str):
-        if not getattr(handler, "widgets", None):
-            handler.widgets = {}
-        w = handler.widgets.get(objname)
-        if w is None:
-            try:
-                w = handler._get_widget_by_name(objname)
-            except Exception:
-                w = None
-            if w is not None:
-                handler.widgets[objname] = w
-        return w
-    widgets = {
-        "label_xa": _w("label_prog_xa"), "xa": _w("program_xa"),
-        "label_xi": _w("label_prog_xi"), "xi": _w("program_xi"),
-        "label_w": _w("label_prog_w"), "w": _w("program_w"),
-        "label_l": _w("label_prog_l"), "l": _w("program_l"),
-        "label_n": _w("label_prog_n"), "n": _w("program_n"),
-        "label_sw": _w("label_prog_sw"), "sw": _w("program_sw"),
-    }
-    show_xa = shape_norm in ("zylinder", "rohr")
-    show_xi = shape_norm == "rohr"
-    show_w = shape_norm == "rechteck"
-    show_l = shape_norm == "rechteck"
-    show_n = shape_norm in ("n-eck", "ne-eck", "n-eck ")
-    show_sw = show_n
-    for key, visible in {
-        "label_xa": show_xa, "xa": show_xa, "label_xi": show_xi, "xi": show_xi,
-        "label_w": show_w, "w": show_w, "label_l": show_l, "l": show_l,
-        "label_n": show_n, "n": show_n, "label_sw": show_sw, "sw": show_sw,
-    }.items():
-        w = widgets.get(key)
-        if w is not None:
-            w.setVisible(bool(visible))
+    visible = _SHAPE_VISIBLE_FIELDS.get(shape_norm, frozenset())
+    widgets = tuple(
+        (field in visible, _lookup_widget(handler, name))
+        for field in _SHAPE_FIELDS
+        for name in (f"label_prog_{field}", f"program_{field}")
+    )
+    _apply_visibility_state(handler, "_program_visibility_state", widgets)
 
 
 def update_retract_visibility(handler, widget=None, mode_in=None):
@@ -260,37 +390,27 @@ def update_retract_visibility(handler, widget=None, mode_in=None):
     root = handler.root_widget or handler._find_root_widget() or getattr(handler, "w", None)
     if root is None:
         return
-    def show(name: str, visible: bool):
-        w = None
-        try:
-            w = handler._get_widget_by_name(name)
-        except Exception:
-            w = None
-        if w is None and root is not None:
-            try:
-                w = root.findChild(QtWidgets.QWidget, name, QtCore.Qt.FindChildrenRecursively)
-            except Exception:
-                w = None
-        if w is not None:
-            w.setVisible(visible)
-    all_widgets = [
-        "label_prog_xra", "program_xra", "program_xra_absolute",
-        "label_prog_xri", "program_xri", "program_xri_absolute",
-        "label_prog_zra", "program_zra", "program_zra_absolute",
-        "label_prog_zri", "program_zri", "program_zri_absolute",
-        "label_retract_hint",
-    ]
-    for name in all_widgets:
-        show(name, False)
-    if idx == 0:
-        for name in ("label_prog_xra", "program_xra", "program_xra_absolute", "label_prog_zra", "program_zra", "program_zra_absolute", "label_retract_hint"):
-            show(name, True)
-    elif idx == 1:
-        for name in ("label_prog_xra", "program_xra", "program_xra_absolute", "label_prog_zra", "program_zra", "program_zra_absolute", "label_prog_xri", "program_xri", "program_xri_absolute", "label_retract_hint"):
-            show(name, True)
-    else:
-        for name in all_widgets:
-            show(name, True)
+    visible = _RETRACT_VISIBLE_NAMES.get(idx, _RETRACT_WIDGET_NAMES)
+    widgets = tuple(
+        (name in visible, _lookup_widget(handler, name, root))
+        for name in _RETRACT_WIDGET_NAMES
+    )
+    _apply_visibility_state(handler, "_retract_visibility_state", widgets)
+
+
+def _apply_visibility_state(handler, attr: str, widgets) -> None:
+    """Sichtbarkeit je (sichtbar, Widget)-Paar genau einmal setzen.
+
+    Unverändert gegenüber dem letzten Aufruf (gleicher Modus, gleiche
+    Widgets) ist der Aufruf ein No-op; sonst wird jedes Widget direkt auf
+    seinen Zielzustand gesetzt statt erst alle aus- und dann einzublenden.
+    """
+    if widgets == getattr(handler, attr, None):
+        return
+    setattr(handler, attr, widgets)
+    for visible, widget in widgets:
+        if widget is not None:
+            widget.setVisible(visible)
 
 
 def update_subspindle_visibility(handler, *args, **kwargs):
@@ -312,9 +432,9 @@ def update_subspindle_visibility(handler, *args, **kwargs):
     has_sub = bool(handler.program_has_subspindle.isChecked()) if handler.program_has_subspindle else False
     root = handler.root_widget or handler._find_root_widget() or getattr(handler, "w", None)
     if handler.label_prog_s3 is None and root:
-        handler.label_prog_s3 = root.findChild(QtWidgets.QWidget, "label_prog_s3")
+        handler.label_prog_s3 = handler._find_in_tab_page("tabProgram", QtWidgets.QWidget, "label_prog_s3")
     if handler.program_s3 is None and root:
-        handler.program_s3 = root.findChild(QtWidgets.QWidget, "program_s3")
+        handler.program_s3 = handler._find_in_tab_page("tabProgram", QtWidgets.QWidget, "program_s3")
     if handler.label_prog_s3:
         handler.label_prog_s3.setVisible(has_sub)
     if handler.program_s3:
@@ -328,29 +448,29 @@ def update_face_visibility(handler):
         root = None
     if root is not None:
         if getattr(handler, "label_face_mode", None) is None:
-            handler.label_face_mode = root.findChild(QtWidgets.QLabel, "label_face_mode")
+            handler.label_face_mode = _find_named(handler, root, QtWidgets.QLabel, "label_face_mode")
         if getattr(handler, "face_mode", None) is None:
-            handler.face_mode = root.findChild(QtWidgets.QComboBox, "face_mode")
+            handler.face_mode = _find_named(handler, root, QtWidgets.QComboBox, "face_mode")
         if getattr(handler, "label_face_finish_direction", None) is None:
-            handler.label_face_finish_direction = root.findChild(QtWidgets.QLabel, "label_face_finish_direction")
+            handler.label_face_finish_direction = _find_named(handler, root, QtWidgets.QLabel, "label_face_finish_direction")
         if getattr(handler, "face_finish_direction", None) is None:
-            handler.face_finish_direction = root.findChild(QtWidgets.QComboBox, "face_finish_direction")
+            handler.face_finish_direction = _find_named(handler, root, QtWidgets.QComboBox, "face_finish_direction")
         if getattr(handler, "label_face_edge_type", None) is None:
-            handler.label_face_edge_type = root.findChild(QtWidgets.QLabel, "label_face_edge_type")
+            handler.label_face_edge_type = _find_named(handler, root, QtWidgets.QLabel, "label_face_edge_type")
         if getattr(handler, "face_edge_type", None) is None:
-            handler.face_edge_type = root.findChild(QtWidgets.QComboBox, "face_edge_type")
+            handler.face_edge_type = _find_named(handler, root, QtWidgets.QComboBox, "face_edge_type")
         if getattr(handler, "label_face_edge_size", None) is None:
-            handler.label_face_edge_size = root.findChild(QtWidgets.QLabel, "label_face_edge_size")
+            handler.label_face_edge_size = _find_named(handler, root, QtWidgets.QLabel, "label_face_edge_size")
         if getattr(handler, "face_edge_size", None) is None:
-            handler.face_edge_size = root.findChild(QtWidgets.QDoubleSpinBox, "face_edge_size")
+            handler.face_edge_size = _find_named(handler, root, QtWidgets.QDoubleSpinBox, "face_edge_size")
         if getattr(handler, "label_face_chamfer", None) is None:
-            handler.label_face_chamfer = root.findChild(QtWidgets.QLabel, "label_face_chamfer") or root.findChild(QtWidgets.QLabel, "label_face_fase") or root.findChild(QtWidgets.QLabel, "label_face_edge_chamfer")
+            handler.label_face_chamfer = _find_named(handler, root, QtWidgets.QLabel, "label_face_chamfer", "label_face_fase", "label_face_edge_chamfer")
         if getattr(handler, "face_chamfer", None) is None:
-            handler.face_chamfer = root.findChild(QtWidgets.QDoubleSpinBox, "face_chamfer") or root.findChild(QtWidgets.QDoubleSpinBox, "face_fase") or root.findChild(QtWidgets.QDoubleSpinBox, "face_edge_chamfer")
+            handler.face_chamfer = _find_named(handler, root, QtWidgets.QDoubleSpinBox, "face_chamfer", "face_fase", "face_edge_chamfer")
         if getattr(handler, "label_face_radius", None) is None:
-            handler.label_face_radius = root.findChild(QtWidgets.QLabel, "label_face_radius") or root.findChild(QtWidgets.QLabel, "label_face_edge_radius")
+            handler.label_face_radius = _find_named(handler, root, QtWidgets.QLabel, "label_face_radius", "label_face_edge_radius")
         if getattr(handler, "face_radius", None) is None:
-            handler.face_radius = root.findChild(QtWidgets.QDoubleSpinBox, "face_radius") or root.findChild(QtWidgets.QDoubleSpinBox, "face_edge_radius")
+            handler.face_radius = _find_named(handler, root, QtWidgets.QDoubleSpinBox, "face_radius", "face_edge_radius")
     if getattr(handler, "face_mode", None) is None or getattr(handler, "face_edge_type", None) is None:
         return
     mode_text = (handler.face_mode.currentText() or "").strip().lower()
@@ -399,15 +519,15 @@ def update_drill_visibility(handler):
         root = None
     if root is not None:
         if getattr(handler, "drill_mode", None) is None:
-            handler.drill_mode = root.findChild(QtWidgets.QComboBox, "drill_mode")
+            handler.drill_mode = _find_named(handler, root, QtWidgets.QComboBox, "drill_mode")
         if getattr(handler, "label_drill_dwell", None) is None:
-            handler.label_drill_dwell = root.findChild(QtWidgets.QLabel, "label_drill_dwell")
+            handler.label_drill_dwell = _find_named(handler, root, QtWidgets.QLabel, "label_drill_dwell")
         if getattr(handler, "drill_dwell", None) is None:
-            handler.drill_dwell = root.findChild(QtWidgets.QDoubleSpinBox, "drill_dwell")
+            handler.drill_dwell = _find_named(handler, root, QtWidgets.QDoubleSpinBox, "drill_dwell")
         if getattr(handler, "label_drill_peck_depth", None) is None:
-            handler.label_drill_peck_depth = root.findChild(QtWidgets.QLabel, "label_drill_peck_depth")
+            handler.label_drill_peck_depth = _find_named(handler, root, QtWidgets.QLabel, "label_drill_peck_depth")
         if getattr(handler, "drill_peck_depth", None) is None:
-            handler.drill_peck_depth = root.findChild(QtWidgets.QDoubleSpinBox, "drill_peck_depth")
+            handler.drill_peck_depth = _find_named(handler, root, QtWidgets.QDoubleSpinBox, "drill_peck_depth")
     if getattr(handler, "drill_mode", None) is None:
         return
     mode_idx = handler.drill_mode.currentIndex()
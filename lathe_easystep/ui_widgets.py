@@ -1,7 +1,57 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
+
 from qtpy import QtCore, QtWidgets
 
+# (Handler-Attribut, objectName, erwarteter Typ) der Kern-Widgets.
+_CORE_WIDGETS = (
+    ("list_ops", "listOperations", QtWidgets.QListWidget),
+    ("tab_params", "tabParams", QtWidgets.QTabWidget),
+    ("btn_add", "btnAdd", QtWidgets.QPushButton),
+    ("btn_delete", "btnDelete", QtWidgets.QPushButton),
+    ("btn_move_up", "btnMoveUp", QtWidgets.QPushButton),
+    ("btn_move_down", "btnMoveDown", QtWidgets.QPushButton),
+    ("btn_new_program", "btnNewProgram", QtWidgets.QPushButton),
+    ("btn_generate", "btnGenerate", QtWidgets.QPushButton),
+    ("btn_save_changes", "btnSaveChanges", QtWidgets.QPushButton),
+    ("btn_save_step", "btn_save_step", QtWidgets.QPushButton),
+    ("btn_load_step", "btn_load_step", QtWidgets.QPushButton),
+    ("btn_save_program", "btn_save_program", QtWidgets.QPushButton),
+    ("btn_load_program", "btn_load_program", QtWidgets.QPushButton),
+    ("btn_load_tool_table", "btn_load_tool_table", QtWidgets.QPushButton),
+    ("tool_table_path", "tool_table_path", QtWidgets.QLineEdit),
+    ("lbl_tool_table_path", "lbl_tool_table_path", QtWidgets.QLabel),
+    ("face_tool", "face_tool", QtWidgets.QComboBox),
+    ("drill_tool", "drill_tool", QtWidgets.QComboBox),
+    ("groove_tool", "groove_tool", QtWidgets.QComboBox),
+    ("thread_tool", "thread_tool", QtWidgets.QComboBox),
+    ("parting_tool", "parting_tool", QtWidgets.QComboBox),
+    ("key_tool", "key_tool", QtWidgets.QComboBox),
+    ("face_tool_img", "face_tool_img", QtWidgets.QLabel),
+    ("drill_tool_img", "drill_tool_img", QtWidgets.QLabel),
+    ("groove_tool_img", "groove_tool_img", QtWidgets.QLabel),
+    ("thread_tool_img", "thread_tool_img", QtWidgets.QLabel),
+    ("parting_tool_img", "parting_tool_img", QtWidgets.QLabel),
+)
+
+
+@contextmanager
+def signals_blocked(widget, *, suspend_updates: bool = False):
+    """Wie QtCore.QSignalBlocker: Signale sperren und den vorigen Zustand
+    wiederherstellen, auch bei Ausnahmen. Optional zusätzlich Neuzeichnen
+    aussetzen (Tabellen mit vielen Zeilen)."""
+    was_blocked = widget.blockSignals(True)
+    updates = suspend_updates and widget.updatesEnabled()
+    if updates:
+        widget.setUpdatesEnabled(False)
+    try:
+        yield widget
+    finally:
+        if updates:
+            widget.setUpdatesEnabled(True)
+        widget.blockSignals(bool(was_blocked))
+
 
 def ensure_core_widgets(handler) -> None:
     root = (
@@ -16,78 +66,40 @@ def ensure_core_widgets(handler) -> None:
         return
     handler.root_widget = handler.root_widget or root
 
-    def find(name: str, cls):
-        current = getattr(handler, name, None)
-        if current:
-            return current
-        obj_name = (
-            "listOperations" if name == "list_ops" else
-            "tabParams" if name == "tab_params" else
-            "btnAdd" if name == "btn_add" else
-            "btnDelete" if name == "btn_delete" else
-            "btnMoveUp" if name == "btn_move_up" else
-            "btnMoveDown" if name == "btn_move_down" else
-            "btnNewProgram" if name == "btn_new_program" else
-            "btnSaveChanges" if name == "btn_save_changes" else
-            "btnGenerate" if name == "btn_generate" else
-            name
-        )
-        obj = root.findChild(cls, obj_name, QtCore.Qt.FindChildrenRecursively)
-        if obj is None:
-            obj = root.findChild(QtCore.QObject, obj_name, QtCore.Qt.FindChildrenRecursively)
-        if obj is None:
-            obj = root.findChild(QtWidgets.QWidget, obj_name, QtCore.Qt.FindChildrenRecursively)
-        if obj:
-            setattr(handler, name, obj)
-        return getattr(handler, name, None)
-
-    handler.list_ops = find("list_ops", QtWidgets.QListWidget)
-    handler.tab_params = find("tab_params", QtWidgets.QTabWidget)
-    handler.btn_add = find("btn_add", QtWidgets.QPushButton)
-    handler.btn_delete = find("btn_delete", QtWidgets.QPushButton)
-    handler.btn_move_up = find("btn_move_up", QtWidgets.QPushButton)
-    handler.btn_move_down = find("btn_move_down", QtWidgets.QPushButton)
-    handler.btn_new_program = find("btn_new_program", QtWidgets.QPushButton)
-    handler.btn_generate = find("btn_generate", QtWidgets.QPushButton)
-    handler.btn_save_changes = find("btn_save_changes", QtWidgets.QPushButton)
-    handler.btn_save_step = find("btn_save_step", QtWidgets.QPushButton)
-    handler.btn_load_step = find("btn_load_step", QtWidgets.QPushButton)
-    handler.btn_save_program = find("btn_save_program", QtWidgets.QPushButton)
-    handler.btn_load_program = find("btn_load_program", QtWidgets.QPushButton)
-    handler.btn_load_tool_table = find("btn_load_tool_table", QtWidgets.QPushButton)
-    handler.tool_table_path = find("tool_table_path", QtWidgets.QLineEdit)
-    handler.lbl_tool_table_path = find("lbl_tool_table_path", QtWidgets.QLabel)
-
-    handler.face_tool = find("face_tool", QtWidgets.QComboBox)
-    handler.drill_tool = find("drill_tool", QtWidgets.QComboBox)
-    handler.groove_tool = find("groove_tool", QtWidgets.QComboBox)
-    handler.thread_tool = find("thread_tool", QtWidgets.QComboBox)
-    handler.parting_tool = find("parting_tool", QtWidgets.QComboBox)
-    handler.key_tool = find("key_tool", QtWidgets.QComboBox)
-    handler.face_tool_img = find("face_tool_img", QtWidgets.QLabel)
-    handler.drill_tool_img = find("drill_tool_img", QtWidgets.QLabel)
-    handler.groove_tool_img = find("groove_tool_img", QtWidgets.QLabel)
-    handler.thread_tool_img = find("thread_tool_img", QtWidgets.QLabel)
-    handler.parting_tool_img = find("parting_tool_img", QtWidgets.QLabel)
+    missing = [entry for entry in _CORE_WIDGETS if not getattr(handler, entry[0], None)]
+    if missing and not getattr(handler, "_widget_name_cache", None):
+        # Ein Baumdurchlauf füllt Namens-Cache und Typ-Fallbacks gemeinsam.
+        handler._rebuild_widget_name_cache()
+    if missing:
+        found = handler._index_named_widgets(names=[obj_name for _attr, obj_name, _cls in missing])
+        for attr, obj_name, cls in missing:
+            obj = found.get(obj_name)
+            if obj is not None and not isinstance(obj, cls):
+                # gleicher Name, anderer Typ: typisierte Suche bevorzugen
+                obj = root.findChild(cls, obj_name, QtCore.Qt.FindChildrenRecursively) or obj
+            if obj:
+                setattr(handler, attr, obj)
 
     if handler.list_ops is None:
-        explicit = root.findChild(QtWidgets.QListWidget, "list_ops", QtCore.Qt.FindChildrenRecursively)
-        if explicit:
+        explicit = handler._index_named_widgets(names=["list_ops"]).get("list_ops")
+        if isinstance(explicit, QtWidgets.QListWidget):
             handler.list_ops = explicit
     handler._ensure_list_ops_type()
     if handler.tab_params is None:
-        candidates = root.findChildren(QtWidgets.QTabWidget)
-        if candidates:
-            handler.tab_params = candidates[0]
+        first_tabs = getattr(handler, "_first_widget_of_type", {}).get(QtWidgets.QTabWidget)
+        if first_tabs is None:
+            first_tabs = root.findChild(QtWidgets.QTabWidget)
+        if first_tabs is not None:
+            handler.tab_params = first_tabs
     handler._resolve_core_widgets_strict()
 
-    handler._connect_button_once(handler.btn_add, handler._handle_add_operation, "_btn_add_connected")
-    handler._connect_button_once(handler.btn_delete, handler._handle_delete_operation, "_btn_delete_connected")
-    handler._connect_button_once(handler.btn_move_up, handler._handle_move_up, "_btn_move_up_connected")
-    handler._connect_button_once(handler.btn_move_down, handler._handle_move_down, "_btn_move_down_connected")
-    handler._connect_button_once(handler.btn_new_program, handler._handle_new_program, "_btn_new_program_connected")
-    handler._connect_button_once(handler.btn_generate, handler._handle_generate_gcode, "_btn_generate_connected")
-    handler._connect_button_once(handler.btn_save_changes, handler._handle_save_changes, "_btn_save_changes_connected")
-    handler._connect_button_once(handler.btn_save_step, handler._handle_save_step, "_btn_save_step_connected")
-    handler._connect_button_once(handler.btn_load_step, handler._handle_load_step, "_btn_load_step_connected")
-    handler._connect_button_once(handler.btn_thread_preset, handler._apply_thread_preset_force, "_thread_preset_connected")
+    handler._connect_button_once(handler.btn_add, handler._handle_add_operation)
+    handler._connect_button_once(handler.btn_delete, handler._handle_delete_operation)
+    handler._connect_button_once(handler.btn_move_up, handler._handle_move_up)
+    handler._connect_button_once(handler.btn_move_down, handler._handle_move_down)
+    handler._connect_button_once(handler.btn_new_program, handler._handle_new_program)
+    handler._connect_button_once(handler.btn_generate, handler._handle_generate_gcode)
+    handler._connect_button_once(handler.btn_save_changes, handler._handle_save_changes)
+    handler._connect_button_once(handler.btn_save_step, handler._handle_save_step)
+    handler._connect_button_once(handler.btn_load_step, handler._handle_load_step)
+    handler._connect_button_once(handler.btn_thread_preset, handler._apply_thread_preset_force)
@@ -2,16 +2,14 @@
 
 from __future__ import annotations
 
-import json
 import time
-import builtins
 
 import math
 import os
 import re
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
-from weakref import WeakSet
+from typing import Dict, List, Mapping, Optional, Tuple
+from weakref import WeakKeyDictionary, WeakSet, WeakValueDictionary, ref as weak_ref
 
 from qtpy import QtCore, QtGui, QtWidgets
 from qtvcp.core import Action
@@ -33,6 +31,7 @@ from lathe_easystep.storage import (
     set_step_file_path,
     step_file_path,
     step_filename_stem,
+    write_step_file,
 )
 from lathe_easystep.ui_program import (
     apply_program_header_to_handler,
@@ -42,8 +41,11 @@ from lathe_easystep.ui_operations import load_operation_params_to_form
 from lathe_easystep.ui_preview import (
     apply_preview_paths,
     ensure_preview_widgets,
+    flush_preview_refresh,
+    on_preview_shown,
     on_toggle_slice_view,
     refresh_preview,
+    request_preview_refresh,
     setup_slice_view,
     sync_slice_widget,
 )
@@ -55,6 +57,8 @@ from lathe_easystep.ui_selection import (
 )
 from lathe_easystep.ui_contour import (
     available_contour_names,
+    contour_operations,
+    contour_sequence_index,
     current_parting_contour_name,
     debug_contour_state,
     handle_contour_add_segment,
@@ -65,6 +69,7 @@ from lathe_easystep.ui_contour import (
     handle_contour_row_select,
     handle_contour_table_change,
     init_contour_table,
+    iter_contour_ops,
     resolve_contour_path,
     sync_contour_edge_controls,
     update_contour_preview_temp,
@@ -78,7 +83,12 @@ from lathe_easystep.ui_visibility import (
     apply_machine_profile_preset,
     apply_unit_suffix,
     chuck_size_mm,
+    flush_global_change,
+    flush_visibility_updates,
     handle_global_change,
+    on_unit_changed,
+    request_global_change,
+    request_visibility_update,
     update_drill_visibility,
     update_face_visibility,
     update_program_visibility,
@@ -92,7 +102,6 @@ from lathe_easystep.ui_flow import (
     handle_move_down,
     handle_move_up,
     handle_new_program,
-    renumber_operations,
 )
 from lathe_easystep.tool_logic import (
     build_insert_geometry,
@@ -149,6 +158,13 @@ from lathe_easystep.ui_signals import (
 
 # Module logger for non-instantiated contexts
 _LOGGER = logging.getLogger(__name__)
+_LOG_LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL,
+}
 
 
 _INSERT_SHAPE_KEYS = {"C", "D", "V", "S", "T", "W", "R"}
@@ -203,6 +219,24 @@ STANDARD_TR_THREAD_SPECS: List[Tuple[str, float, float]] = [
     ("Tr 55", 55.0, 8.0),
     ("Tr 60", 60.0, 10.0),
 ]
+
+
+def _thread_standard_items() -> Tuple[Tuple[str, float, float, str], ...]:
+    """(Label, Nenndurchmesser, Steigung, Profil) je Normgewinde, z. B. "M10 x 1.5"."""
+
+    def _compact(value: float) -> str:
+        text = f"{value:.3f}".rstrip("0").rstrip(".")
+        return text if text else "0"
+
+    items = []
+    for specs, profile in ((STANDARD_METRIC_THREAD_SPECS, "metric"), (STANDARD_TR_THREAD_SPECS, "tr")):
+        for name, diameter, pitch in specs:
+            items.append((f"{name} x {_compact(pitch)}", diameter, pitch, profile))
+    return tuple(items)
+
+
+# Einmal beim Import formatiert; die Combo wird bei jedem Sprachwechsel neu befüllt.
+_THREAD_STANDARD_ITEMS = _thread_standard_items()
 THREAD_ORIENTATION_LABELS: Tuple[str, str] = ("Aussen", "Innen")
 DRILL_MODE_LABELS: Tuple[str, str, str, str, str] = (
     "G81 Bohren",
@@ -235,6 +269,27 @@ TAB_ORDER = [
     "tabDrill",
     "tabKeyway",
 ]
+# Operationstyp je Tab-Index, parallel zu TAB_ORDER.
+_OP_TYPE_BY_TAB = (
+    OpType.PROGRAM_HEADER,  # Programmkopf
+    OpType.FACE,
+    OpType.CONTOUR,
+    OpType.ABSPANEN,
+    OpType.THREAD,
+    OpType.GROOVE,
+    OpType.DRILL,
+    OpType.KEYWAY,
+)
+# Ruhezeit nach der letzten Formular-Eingabe, bevor Operation und Vorschau
+# nachgezogen werden (Tippen einer Zahl = ein Sync statt einer pro Taste).
+_PARAM_DEBOUNCE_MS = 80
+# Rückwärtsindex Tab-Text -> Übersetzungen (für Tabs ohne bekannten objectName);
+# bei Mehrdeutigkeit gewinnt wie bisher der erste Eintrag in TAB_TRANSLATIONS.
+_TAB_TEXT_INDEX: Dict[str, Dict[str, str]] = {}
+for _tab_translations in TAB_TRANSLATIONS.values():
+    for _tab_text in _tab_translations.values():
+        _TAB_TEXT_INDEX.setdefault(_tab_text, _tab_translations)
+del _tab_translations, _tab_text
 # Root objectName variants depending on how the panel is launched:
 # - embedded in LinuxCNC: often the .ui root is a QMainWindow named 'MainWindow'
 # - standalone qtvcp panel: often 'lathe_easystep_panel'
@@ -250,6 +305,36 @@ PANEL_WIDGET_NAMES = (
     'MainWindow',
     'VCPWindow',
 )
+# Reihenfolge oben ist Suchpriorität; für Mitgliedschaftstests (pro Ahnen-
+# Schritt beim Hochlaufen der Parent-Kette) die Set-Variante verwenden.
+PANEL_WIDGET_NAME_SET = frozenset(PANEL_WIDGET_NAMES)
+# Dynamische Combo-Property: Sprache der aktuell eingetragenen Optionen.
+_COMBO_LANG_PROPERTY = "_last_lang"
+# Typen, deren erstes Vorkommen _rebuild_widget_name_cache für Fallbacks merkt.
+_FIRST_WIDGET_TYPES = (QtWidgets.QListWidget, QtWidgets.QTabWidget)
+# Programmkopf-Widgets, die _resolve_header_widgets per objectName nachlädt
+# (program_unit/program_shape haben eigene Suchfunktionen).
+_HEADER_WIDGET_NAMES = (
+    "program_npv", "program_retract_mode", "program_s1", "program_s3",
+    "program_has_subspindle", "program_xt", "program_zt", "program_sc",
+    "program_machine_profile", "program_chuck_size", "program_chuck_part_type",
+    "program_chuck_grip_mode", "program_chuck_profile", "program_chuck_x_min",
+    "program_chuck_x_max", "program_chuck_z_limit", "program_name",
+    "program_xa", "program_xi", "program_za", "program_zi", "program_zb",
+    "program_w", "program_l", "program_n", "program_sw",
+    "program_xra", "program_xri", "program_zra", "program_zri",
+    "program_xra_absolute", "program_xri_absolute",
+    "program_zra_absolute", "program_zri_absolute",
+)
+# Gewinde-Tab-Widgets für _ensure_thread_widgets; alle Attribute werden in
+# bootstrap_widget_refs mit None vorbelegt.
+_THREAD_WIDGET_NAMES = (
+    "thread_standard", "thread_orientation", "thread_tool", "thread_spindle",
+    "thread_major_diameter", "thread_pitch", "thread_length", "thread_passes",
+    "thread_safe_z", "thread_depth", "thread_peak_offset", "thread_first_depth",
+    "thread_retract_r", "thread_infeed_q", "thread_spring_passes", "thread_e",
+    "thread_l", "btn_thread_preset",
+)
 
 
 def _looks_like_panel_widget(widget: QtWidgets.QWidget | None) -> bool:
@@ -262,6 +347,22 @@ def _looks_like_panel_widget(widget: QtWidgets.QWidget | None) -> bool:
         return bool(has_ops and has_tabs)
     except Exception:
         return False
+
+
+def _set_widget_text(widget, text: str | None, *setter_names: str) -> None:
+    """Ruft die vorhandenen Text-Setter (setText/setToolTip/...) mit ``text`` auf.
+
+    Fähigkeitsprüfung per getattr statt try/except: Widgets ohne den Setter
+    werden still übersprungen, echte Fehler im Setter bleiben sichtbar.
+    """
+    if text is None:
+        return
+    for setter_name in setter_names:
+        setter = getattr(widget, setter_name, None)
+        if setter is not None:
+            setter(text)
+
+
 TEXT_TRANSLATIONS = {
     "label_prog_npv": {"de": "Nullpunktverschiebung", "en": "Work Offset"},
     "label_prog_unit": {"de": "Maßeinheit", "en": "Units"},
@@ -534,6 +635,48 @@ def normalize_arc_side(value: object | None) -> str:
         return "outer"
     return "auto"
 
+
+# Präfix -> Segmenttyp; "xz" wird vor dem Einzelbuchstaben geprüft.
+_CONTOUR_MODE_BY_PREFIX = {"xz": "xz", "x": "x", "z": "z"}
+# Anfangsbuchstabe der Kantenbeschriftung (Fase/Chamfer, Radius).
+_CONTOUR_EDGE_BY_INITIAL = {"f": "chamfer", "c": "chamfer", "r": "radius"}
+
+
+def _contour_segment_mode(text: str) -> str:
+    """Spalte "Typ" der Konturtabelle -> 'xz' | 'x' | 'z' (Default 'xz')."""
+    return _CONTOUR_MODE_BY_PREFIX.get(text[:2]) or _CONTOUR_MODE_BY_PREFIX.get(text[:1], "xz")
+
+
+def _contour_edge_kind(text: str) -> str:
+    """Kantenbeschriftung (de/en) -> 'chamfer' | 'radius' | 'none'."""
+    return _CONTOUR_EDGE_BY_INITIAL.get(text[:1], "none")
+
+
+_COMMA_TABLE = str.maketrans(",", ".")
+
+
+def _cell_float(text: str) -> float:
+    """Zellentext -> float; Komma als Dezimaltrenner, leer/ungültig = 0.0."""
+    if not text:
+        return 0.0
+    try:
+        return float(text.translate(_COMMA_TABLE))
+    except ValueError:
+        return 0.0
+
+
+def _cell_choice_text(widget, item) -> str:
+    """Text einer Auswahlzelle: bevorzugt Combo-Zellwidget, sonst Tabellen-Item."""
+    try:
+        if widget is not None and hasattr(widget, "currentText"):
+            return str(widget.currentText()).strip().lower()
+        if item is not None:
+            return item.text().strip().lower()
+    except Exception:
+        pass
+    return ""
+
+
 # Tooltips für Gewinde-Widgets (de / en)
 THREAD_TOOLTIP_TRANSLATIONS = {
     "thread_length": {
@@ -593,11 +736,45 @@ GROOVE_TOOLTIP_TRANSLATIONS = {
         "en": "Finish allowance is radial; X is diameter (G7).",
     },
 }
+
+
+# Generische Qt-Labelnamen (label_32 ...) kollidieren im Embedded-Mode mit
+# Host-GUI-Widgets (z. B. QtDragon Tool-Info) und werden nie übersetzt.
+_GENERIC_LABEL_RE = re.compile(r"^label_\d+$")
+
+
+def _flatten_translations(table, fallback: str | None = None, skip=None):
+    """{Sprache: ((Widgetname, Text), ...)} für den Sprachwechsel vorberechnen.
+
+    ``fallback`` ist die Sprache, die bei fehlendem/leerem Text einspringt.
+    """
+    flat = {}
+    for lang in ("de", "en"):
+        entries = []
+        for name, translations in table.items():
+            if skip is not None and skip.match(str(name or "")):
+                continue
+            text = translations.get(lang)
+            if not text and fallback:
+                text = translations.get(fallback)
+            entries.append((name, text))
+        flat[lang] = tuple(entries)
+    return flat
+
+
+_TEXT_BY_LANG = _flatten_translations(TEXT_TRANSLATIONS, skip=_GENERIC_LABEL_RE)
+_BUTTON_BY_LANG = _flatten_translations(BUTTON_TRANSLATIONS)
+_THREAD_TOOLTIP_BY_LANG = _flatten_translations(THREAD_TOOLTIP_TRANSLATIONS, fallback="de")
+_PARTING_TOOLTIP_BY_LANG = _flatten_translations(PARTING_TOOLTIP_TRANSLATIONS, fallback="de")
+_GROOVE_TOOLTIP_BY_LANG = _flatten_translations(GROOVE_TOOLTIP_TRANSLATIONS, fallback="de")
 # ----------------------------------------------------------------------
 # Preview widget
 # ----------------------------------------------------------------------
 class LathePreviewWidget(QtWidgets.QWidget):
     sliceChanged = QtCore.Signal(float)
+    # Meldet das Sichtbarwerden, damit im Hintergrund übersprungene
+    # Vorschau-Refreshes nachgeholt werden können.
+    shown = QtCore.Signal()
     def __init__(self, parent=None):
         super().__init__(parent)
         self.x_is_diameter = True  # X values are treated as radius for drawing but labeled as diameter
@@ -636,7 +813,7 @@ class LathePreviewWidget(QtWidgets.QWidget):
             return 0.0
         return x_num * 0.5 if getattr(self, "x_is_diameter", False) else x_num
 
-
+    @QtCore.Slot()
     def _on_blink_timer(self):
         # Blink when collision is active
         if not self._collision_active:
@@ -1021,6 +1198,10 @@ class LathePreviewWidget(QtWidgets.QWidget):
             painter.drawText(10, 16, "D final: " + ", ".join(f"{d:.3f}" for d in active_diams[:3]))
         painter.drawText(10, 32, f"D max: {max_diameter:.3f}")
 
+    def showEvent(self, event):  # type: ignore[override]
+        super().showEvent(event)
+        self.shown.emit()
+
     def mousePressEvent(self, event):  # type: ignore[override]
         # Click on legend to toggle
         rect = getattr(self, "_legend_click_rect", None)
@@ -1174,6 +1355,90 @@ class LathePreviewWidget(QtWidgets.QWidget):
             paths = []
         self.set_paths(paths)
 
+    def _model_polygons(self) -> List[QtGui.QPolygonF]:
+        """Je Pfad ein QPolygonF in Anzeigekoordinaten (Z, X/R), einmal je Pfadliste.
+
+        Beim Zeichnen bildet eine QTransform das ganze Polygon in einem
+        Aufruf auf Pixel ab, statt jeden Punkt in Python umzurechnen.
+        Primitive-Pfade werden dafür einmal abgetastet.
+        """
+        key = self.x_is_diameter
+        cache = getattr(self, "_model_polygons_cache", None)
+        if cache is not None and cache[0] is self.paths and cache[1] == key:
+            return cache[2]
+        to_display = self._x_to_display
+        polygons = []
+        for path in self.paths:
+            if path and isinstance(path[0], dict):
+                try:
+                    pts = self.primitives_to_points(path)
+                except Exception:
+                    pts = []
+            else:
+                pts = path or []
+            polygons.append(QtGui.QPolygonF([QtCore.QPointF(float(zv), to_display(xv)) for xv, zv in pts]))
+        self._model_polygons_cache = (self.paths, key, polygons)
+        return polygons
+
+    def _view_bounds(self) -> Tuple[float, float, float, float]:
+        """(min_x, max_x, min_z, max_z) der Ansicht inkl. Mindestspanne und Rand.
+
+        Hängt nur an den Pfaden, nicht an der Widgetgröße; wird daher je
+        Pfadliste einmal berechnet statt bei jedem Repaint (Blink-Timer,
+        Schnitt-Ziehen) alle Punkte und Bögen erneut abzutasten.
+        """
+        key = (self.x_is_diameter, self._base_span)
+        cache = getattr(self, "_view_bounds_cache", None)
+        if cache is not None and cache[0] is self.paths and cache[1] == key:
+            return cache[2]
+        # Grenzen aller Pfade (Punktlisten und abgetastete Primitive)
+        inf = float('inf')
+        min_x, max_x = inf, -inf
+        min_z, max_z = inf, -inf
+        for poly in self._model_polygons():
+            if poly.isEmpty():
+                continue
+            box = poly.boundingRect()
+            min_z = min(min_z, box.left())
+            max_z = max(max_z, box.right())
+            min_x = min(min_x, box.top())
+            max_x = max(max_x, box.bottom())
+
+        if min_x == inf or min_z == inf:
+            min_x = max_x = 0.0
+            min_z = max_z = 0.0
+        # Ursprung und Mindestgröße immer berücksichtigen
+        half_span = self._base_span / 2.0
+        min_x = min(min_x, -half_span, 0.0)
+        max_x = max(max_x, half_span, 0.0)
+        min_z = min(min_z, -half_span, 0.0)
+        max_z = max(max_z, half_span, 0.0)
+
+        dx = max_x - min_x
+        dz = max_z - min_z
+
+        def ensure_span(min_val: float, max_val: float, base_span: float) -> Tuple[float, float]:
+            span = max_val - min_val
+            if span < base_span:
+                pad = (base_span - span) / 2.0
+                return min_val - pad, max_val + pad
+            return min_val, max_val
+
+        min_x, max_x = ensure_span(min_x, max_x, self._base_span)
+        min_z, max_z = ensure_span(min_z, max_z, self._base_span)
+
+        # kleiner Rand um die Geometrie
+        dx = max(max_x - min_x, 1e-3)
+        dz = max(max_z - min_z, 1e-3)
+        pad = 0.05
+        min_x -= dx * pad
+        max_x += dx * pad
+        min_z -= dz * pad
+        max_z += dz * pad
+        bounds = (min_x, max_x, min_z, max_z)
+        self._view_bounds_cache = (self.paths, key, bounds)
+        return bounds
+
     def paintEvent(self, event):  # type: ignore[override]
         painter = QtGui.QPainter(self)
         if getattr(self, "view_mode", "side") == "slice":
@@ -1191,68 +1456,7 @@ class LathePreviewWidget(QtWidgets.QWidget):
         self._legend_click_rect = None
         try:
             painter.fillRect(self.rect(), QtCore.Qt.black)
-            # Collect bounds across all paths (supports point lists and primitive lists)
-            inf = float('inf')
-            min_x, max_x = inf, -inf
-            min_z, max_z = inf, -inf
-
-            def _upd(xv: float, zv: float):
-                nonlocal min_x, max_x, min_z, max_z
-                x_draw = self._x_to_display(xv)
-                min_x = min(min_x, x_draw)
-                max_x = max(max_x, x_draw)
-                min_z = min(min_z, zv)
-                max_z = max(max_z, zv)
-
-            any_data = False
-            for path in self.paths:
-                if not path:
-                    continue
-                any_data = True
-                first = path[0]
-                if isinstance(first, dict):
-                    # primitives (line/arc with p1/p2/c) -> sample to points for bounds
-                    try:
-                        pts = self.primitives_to_points(path)
-                    except Exception:
-                        pts = []
-                    for (xv, zv) in pts:
-                        _upd(float(xv), float(zv))
-                else:
-                    for (xv, zv) in path:
-                        _upd(float(xv), float(zv))
-
-            if not any_data or min_x == inf or min_z == inf:
-                min_x = max_x = 0.0
-                min_z = max_z = 0.0
-            # Ursprung und Mindestgröße immer berücksichtigen
-            half_span = self._base_span / 2.0
-            min_x = min(min_x, -half_span, 0.0)
-            max_x = max(max_x, half_span, 0.0)
-            min_z = min(min_z, -half_span, 0.0)
-            max_z = max(max_z, half_span, 0.0)
-
-            dx = max_x - min_x
-            dz = max_z - min_z
-
-            def ensure_span(min_val: float, max_val: float, base_span: float) -> Tuple[float, float]:
-                span = max_val - min_val
-                if span < base_span:
-                    pad = (base_span - span) / 2.0
-                    return min_val - pad, max_val + pad
-                return min_val, max_val
-
-            min_x, max_x = ensure_span(min_x, max_x, self._base_span)
-            min_z, max_z = ensure_span(min_z, max_z, self._base_span)
-
-            # kleiner Rand um die Geometrie
-            dx = max(max_x - min_x, 1e-3)
-            dz = max(max_z - min_z, 1e-3)
-            pad = 0.05
-            min_x -= dx * pad
-            max_x += dx * pad
-            min_z -= dz * pad
-            max_z += dz * pad
+            min_x, max_x, min_z, max_z = self._view_bounds()
 
             margin = 30
             rect = self.rect().adjusted(margin, margin, -margin, -margin)
@@ -1267,17 +1471,20 @@ class LathePreviewWidget(QtWidgets.QWidget):
             self._view_max_z = max_z
             self._view_scale = scale
 
+            # Abbildung je Repaint einmal auflösen: pix = off + wert * scale
+            z_off = rect.left() - min_z * scale
+            x_off = rect.bottom() + min_x * scale
+
             def to_screen(x_val: float, z_val: float) -> QtCore.QPointF:
                 # Z horizontal, X vertikal
-                x_draw = self._x_to_display(x_val)
-                x_pix = rect.left() + (z_val - min_z) * scale
-                z_pix = rect.bottom() - (x_draw - min_x) * scale
-                return QtCore.QPointF(x_pix, z_pix)
+                return QtCore.QPointF(z_off + z_val * scale, x_off - self._x_to_display(x_val) * scale)
 
             def to_screen_display(x_display: float, z_val: float) -> QtCore.QPointF:
-                x_pix = rect.left() + (z_val - min_z) * scale
-                z_pix = rect.bottom() - (x_display - min_x) * scale
-                return QtCore.QPointF(x_pix, z_pix)
+                return QtCore.QPointF(z_off + z_val * scale, x_off - x_display * scale)
+
+            # dieselbe Abbildung für ganze Polygone aus _model_polygons()
+            model_to_screen = QtGui.QTransform(scale, 0.0, 0.0, -scale, z_off, x_off)
+            model_polygons = self._model_polygons()
 
             # optional slice indicator (selected Z)
             if getattr(self, "slice_enabled", False) and getattr(self, "view_mode", "side") == "side":
@@ -1461,20 +1668,15 @@ class LathePreviewWidget(QtWidgets.QWidget):
                                     painter.drawPolyline(QtGui.QPolygonF(points))
                         continue
                     else:
-                        try:
-                            pts = self.primitives_to_points(path)
-                        except Exception:
-                            pts = []
-                        if len(pts) >= 2:
-                            points = [to_screen(x, z) for x, z in pts]
-                            painter.drawPolyline(QtGui.QPolygonF(points))
-                        elif len(pts) == 1:
-                            pt = to_screen(pts[0][0], pts[0][1])
+                        poly = model_polygons[idx]
+                        if poly.size() >= 2:
+                            painter.drawPolyline(model_to_screen.map(poly))
+                        elif poly.size() == 1:
+                            pt = model_to_screen.map(poly[0])
                             painter.drawLine(QtCore.QLineF(pt.x() - 4, pt.y(), pt.x() + 4, pt.y()))
                             painter.drawLine(QtCore.QLineF(pt.x(), pt.y() - 4, pt.x(), pt.y() + 4))
                         continue
-                points = [to_screen(x, z) for x, z in path]
-                painter.drawPolyline(QtGui.QPolygonF(points))
+                painter.drawPolyline(model_to_screen.map(model_polygons[idx]))
 
             legend_enabled = getattr(self, "show_legend", True)
             collapsed = getattr(self, "_legend_collapsed", False)
@@ -2700,7 +2902,7 @@ def _pick_best_root(widgets):
             if cur is None:
                 break
             try:
-                if cur.objectName() in PANEL_WIDGET_NAMES:
+                if cur.objectName() in PANEL_WIDGET_NAME_SET:
                     if cur.objectName() in ("MainWindow", "VCPWindow") and not _looks_like_panel_widget(cur):
                         pass
                     else:
@@ -2757,7 +2959,7 @@ class WidgetResolver:
             if level == "warning" and root_name in ("MainWindow", "VCPWindow"):
                 for w in (self.widgets or []):
                     try:
-                        if getattr(w, "objectName", lambda: "")() in PANEL_WIDGET_NAMES:
+                        if getattr(w, "objectName", lambda: "")() in PANEL_WIDGET_NAME_SET:
                             level = "debug"
                             break
                     except Exception:
@@ -2823,7 +3025,7 @@ class WidgetResolver:
                 iid = int(maybe_id)
                 for r in roots:
                     try:
-                        for w in r.findChildren(cls, QtCore.Qt.FindChildrenRecursively):
+                        for w in r.findChildren(cls):
                             try:
                                 val = w.property("idx")
                                 if val is None:
@@ -2843,7 +3045,7 @@ class WidgetResolver:
             if name:
                 c = r.findChildren(cls, name, QtCore.Qt.FindChildrenRecursively)
             else:
-                c = r.findChildren(cls, QtCore.Qt.FindChildrenRecursively)
+                c = r.findChildren(cls)
             found.extend(c)
 
         for w in self.widgets:
@@ -2852,7 +3054,7 @@ class WidgetResolver:
             if name:
                 c = w.findChildren(cls, name, QtCore.Qt.FindChildrenRecursively)
             else:
-                c = w.findChildren(cls, QtCore.Qt.FindChildrenRecursively)
+                c = w.findChildren(cls)
             found.extend(c)
 
         uniq = []
@@ -3002,6 +3204,9 @@ validate_contour_segments_for_profile = _validate_contour_segments_for_profile_e
 
 
 class HandlerClass:
+    # Hinweis: HandlerClass ist bewusst kein QObject. QtCore.Slot-Dekoratoren
+    # dürfen hier NICHT verwendet werden – PyQt5 lehnt connect() auf dekorierte
+    # Methoden eines Nicht-QObject-Empfängers ab ("connect() failed").
     def _register_known_widgets(self):
         """
         Find commonly-used widgets inside the embedded panel and register them
@@ -3164,7 +3369,7 @@ class HandlerClass:
                 current = self._main_window
                 while current is not None:
                     try:
-                        if current.objectName() in PANEL_WIDGET_NAMES:
+                        if current.objectName() in PANEL_WIDGET_NAME_SET:
                             if current.objectName() in ("MainWindow", "VCPWindow") and not _looks_like_panel_widget(current):
                                 pass
                             else:
@@ -3221,11 +3426,23 @@ class HandlerClass:
         self.tools: Dict[int, Tool] = {}  # loaded tool table
         self._loaded_tools: Dict[int, Tool] | None = None  # cache for repopulating combos after deferred widgets
         self._missing_iso_tools: List[int] = []
-        self.param_widgets: Dict[str, Dict[str, QtWidgets.QWidget]] = {}
+        self.param_widgets: Mapping[str, Mapping[str, QtWidgets.QWidget]] = {}
+        self._all_param_widgets: Tuple[QtWidgets.QWidget, ...] = ()
+        self._param_signal_table: Tuple[Tuple[QtWidgets.QWidget, object], ...] = ()
+        self._param_signal_table_connected: Optional[tuple] = None
+        self._param_collectors: Mapping[str, tuple] = {}
         self._connected_param_widgets: WeakSet[QtWidgets.QWidget] = WeakSet()
         self._connected_global_widgets: WeakSet[QtWidgets.QWidget] = WeakSet()
         self._thread_standard_populated = False
-        self._thread_standard_signal_connected = False
+        self._last_language: Optional[str] = None
+        self._param_change_pending = False
+        self._param_change_timer = None
+        self._header_widgets_root: Optional[QtWidgets.QWidget] = None
+        self._last_preview_sig: Optional[tuple] = None
+        self._list_ops_prepared: Optional[QtWidgets.QListWidget] = None
+        self._preview_dirty = False
+        self._preview_refresh_scheduled = False
+        self._parting_slice_items_ready: Optional[QtWidgets.QComboBox] = None
         self._thread_applying_standard = False
         self._startup_complete = False
         self._startup_in_progress = False
@@ -3234,10 +3451,18 @@ class HandlerClass:
         self._post_start_init_done = False
         self._post_start_init_steps = []
         self._widget_name_cache: Dict[str, List[QtWidgets.QWidget]] = {}
+        self._first_widget_of_type: Dict[type, QtWidgets.QWidget] = {}
+        # objectName -> Widget für bereits aufgelöste Einzel-Lookups; schwach
+        # referenziert, damit abgebaute Panels nicht festgehalten werden.
+        self._widget_registry: WeakValueDictionary[str, QtWidgets.QWidget] = WeakValueDictionary()
+        # Widget -> (Elternkette als schwache Referenzen, Panel) für
+        # _panel_from_widget; abgebaute Widgets fallen von selbst heraus.
+        self._in_panel_cache: WeakKeyDictionary = WeakKeyDictionary()
         self._startup_epoch = time.monotonic()
         self._startup_heartbeat_scheduled = False
         self._step_last_dir: str | None = None
         self._last_dialog_dir: str | None = None
+        self._restore_dialog_dirs()
         self._current_program_path: str | None = None
         self._current_gcode_path: str | None = None
         self._loading_step = False
@@ -3247,6 +3472,7 @@ class HandlerClass:
         self._moving_up = False
         self._moving_down = False
         self._generating_gcode = False
+        self._gcode_job = None
         self._creating_new_program = False
 
         # zentrale Widgets
@@ -3259,6 +3485,19 @@ class HandlerClass:
         self._verbose_widget_logs = False
         self._bootstrap_widget_refs()
 
+    def _restore_dialog_dirs(self) -> None:
+        """Zuletzt benutzte Dialog-Verzeichnisse der vorigen Sitzung übernehmen.
+
+        Die Dialoge lesen ihre Schlüssel selbst; die Werte hier greifen als
+        Rückfall, wenn QSettings beim Öffnen nichts Brauchbares liefert.
+        """
+        try:
+            settings = QtCore.QSettings()
+            self._step_last_dir = settings.value("LatheEasyStep/StepLastDir", "", type=str) or None
+            self._last_dialog_dir = settings.value("LatheEasyStep/LastDialogDir", "", type=str) or None
+        except Exception:
+            pass
+
     def _dialog_start_dir(self, settings: QtCore.QSettings, *keys: str) -> str:
         """Return the most relevant start directory for file dialogs."""
         candidates: List[str | None] = []
@@ -3313,9 +3552,7 @@ class HandlerClass:
     def _write_step_file(self, op: Operation, file_path: str) -> str:
         normalized = self._normalized_file_path(file_path) or file_path
         self._set_step_file_path(op, normalized)
-        data = self._operation_to_step_data(op)
-        with builtins.open(normalized, "w", encoding="utf-8") as handle:
-            json.dump(data, handle, indent=2)
+        write_step_file(normalized, self._operation_to_step_data(op))
         return normalized
 
     def _ensure_step_file_link(
@@ -3396,7 +3633,33 @@ class HandlerClass:
             logger=getattr(self, "LOG", None),
         )
 
+    def _debug_enabled(self) -> bool:
+        """True, wenn Debug-Meldungen tatsächlich ausgegeben würden.
+
+        Teure Debug-Payloads (Namenslisten, Widget-Dumps) nur hinter diesem
+        Check aufbauen, sonst kosten sie auch bei abgeschaltetem Debug-Log.
+        """
+        if getattr(self, "_verbose_widget_logs", False):
+            return True
+        logger = getattr(self, "LOG", None) or _LOGGER
+        try:
+            return bool(logger.isEnabledFor(logging.DEBUG))
+        except Exception:
+            return False
+
     def _log(self, *parts, level: str | None = None):
+        if level == "debug" and not self._debug_enabled():
+            return
+        verbose = getattr(self, "_verbose_widget_logs", False)
+        logger = getattr(self, "LOG", None)
+        if not logger:
+            # Ohne qtvcp-Logger: Modul-Logging statt print(); abgeschaltete
+            # Level kosten so weder Formatierung noch stdout-I/O. Der
+            # Entwickler-Schalter _verbose_widget_logs gibt wie _debug_enabled()
+            # trotzdem alles aus.
+            logger = _LOGGER
+            if level is not None and not verbose and not logger.isEnabledFor(_LOG_LEVELS.get(level, logging.INFO)):
+                return
         msg = " ".join(str(p) for p in parts)
         if level is None:
             level = "info"
@@ -3407,13 +3670,15 @@ class HandlerClass:
                 level = "error"
             elif "warn" in lowered:
                 level = "warning"
+        if verbose and logger is _LOGGER and not logger.isEnabledFor(_LOG_LEVELS.get(level, logging.INFO)):
+            # Modul-Logger würde die Meldung verwerfen -> direkt ausgeben
+            print(msg)
+            return
         try:
-            logger = getattr(self, "LOG", None)
-            if logger:
-                fn = getattr(logger, level, None)
-                if callable(fn):
-                    fn(msg)
-                    return
+            fn = getattr(logger, level, None)
+            if callable(fn):
+                fn(msg)
+                return
         except Exception:
             pass
         print(msg)
@@ -3741,6 +4006,7 @@ class HandlerClass:
 
     def _force_attach_core_widgets(self):
         """Robuste Suche nach Liste/Buttons direkt im Panel-Baum und erneutes Verbinden."""
+        self._header_widgets_root = None
         root = self._find_root_widget()
         search_roots = [root] if root else []
 
@@ -3765,24 +4031,33 @@ class HandlerClass:
         self.btn_generate = self.btn_generate or _grab("btnGenerate", QtWidgets.QPushButton)
         # Sichtbarkeit/Größe sicherstellen, falls das Widget eingebettet "verschwunden" ist
         if self.list_ops:
-            try:
-                self.list_ops.setMinimumWidth(220)
-                self.list_ops.show()
-                self.list_ops.raise_()
-                # Stelle sicher, dass der Text sichtbar ist (Theme-Unabhängig)
-                self.list_ops.setStyleSheet(
-                    "QListWidget { background: #e6e6e6; color: black; }"
-                    "QListWidget::item:selected { background: #4fa3f7; color: white; }"
-                )
-            except Exception:
-                pass
+            self._prepare_list_ops(self.list_ops)
+
+    def _prepare_list_ops(self, lst) -> None:
+        """Einmalig je Listen-Instanz: Style, Mindestbreite, sichtbar machen."""
+        if getattr(self, "_list_ops_prepared", None) is lst:
+            return
+        try:
+            # Sichtbarkeit erzwingen – eigener Style gegen dunkle QSS
+            lst.setStyleSheet(
+                "QListWidget { background: #f5f5f5; color: #000000; }"
+                "QListWidget::item:selected { background: #4fa3f7; color: #ffffff; }"
+            )
+            lst.setMinimumWidth(220)
+            # Einzeilige Einträge: Zeilenhöhe einmal statt pro Eintrag berechnen
+            lst.setUniformItemSizes(True)
+            lst.show()
+            lst.raise_()
+        except Exception:
+            return
+        self._list_ops_prepared = lst
 
     def _find_root_widget(self):
         """Suche das Panel auch im eingebetteten Zustand."""
         def _panel_from(widget: QtWidgets.QWidget | None):
             while widget:
                 try:
-                    if widget.objectName() in PANEL_WIDGET_NAMES:
+                    if widget.objectName() in PANEL_WIDGET_NAME_SET:
                         if widget.objectName() in ("MainWindow", "VCPWindow") and not _looks_like_panel_widget(widget):
                             pass
                         else:
@@ -3877,7 +4152,7 @@ class HandlerClass:
             if maybe_id is not None:
                 try:
                     iid = int(maybe_id)
-                    for w in r.findChildren(QtWidgets.QWidget, QtCore.Qt.FindChildrenRecursively):
+                    for w in r.findChildren(QtWidgets.QWidget):
                         try:
                             val = w.property("idx")
                             if val is None:
@@ -3899,8 +4174,60 @@ class HandlerClass:
             
         return None
 
+    def _index_named_widgets(self, names=(), ids=()) -> Dict[str, QtWidgets.QWidget]:
+        """Löst mehrere objectNames/idx-Werte gesammelt auf.
+
+        Namen kommen zuerst aus dem objectName-Cache; alles Übrige (inkl.
+        ``idx``-Properties, Keys ``"id:<n>"``) wird in *einem* Durchlauf über
+        den Panel-Baum gesucht, der endet, sobald alles gefunden ist.
+        """
+        found: Dict[str, QtWidgets.QWidget] = {}
+        cache = getattr(self, "_widget_name_cache", {})
+        missing = set()
+        for name in names:
+            hit = next((w for w in cache.get(name, []) if w is not None), None)
+            if hit is not None:
+                found[name] = hit
+            else:
+                missing.add(name)
+        wanted_ids = {}
+        for iid in ids:
+            try:
+                wanted_ids[int(iid)] = f"id:{int(iid)}"
+            except (TypeError, ValueError):
+                continue
+        if not missing and not wanted_ids:
+            return found
+        root = self.root_widget or self._find_root_widget()
+        if root is None:
+            return found
+        remaining = len(missing) + len(wanted_ids)
+        for w in root.findChildren(QtWidgets.QWidget):
+            try:
+                name = w.objectName()
+                if name in missing:
+                    missing.discard(name)
+                    found[name] = w
+                    remaining -= 1
+                if wanted_ids:
+                    val = w.property("idx")
+                    if isinstance(val, str) and val.isdigit():
+                        val = int(val)
+                    key = wanted_ids.pop(val, None) if isinstance(val, int) else None
+                    if key is not None:
+                        found[key] = w
+                        remaining -= 1
+            except Exception:
+                continue
+            if remaining <= 0:
+                break
+        return found
+
     def _find_panel_tab_widget(self) -> QtWidgets.QTabWidget | None:
         """Suche das TabWidget innerhalb des eingebetteten Panels."""
+        for tab_widget in getattr(self, "_widget_name_cache", {}).get("tabParams", []):
+            if isinstance(tab_widget, QtWidgets.QTabWidget):
+                return tab_widget
         root = self._find_root_widget()
         if root is None:
             return None
@@ -3918,15 +4245,55 @@ class HandlerClass:
         return None
 
     def _panel_from_widget(self, widget: QtWidgets.QWidget | None):
-        """Hilfsfunktion: finde den Panel-Elternteil zu einem Widget."""
-        while widget:
+        """Hilfsfunktion: finde den Panel-Elternteil zu einem Widget.
+
+        Das Ergebnis wird pro Widget gemerkt, zusammen mit der Elternkette bis
+        zum Panel (bzw. bis oben). Ein Treffer gilt nur, solange diese Kette
+        noch dieselbe ist; Reparenting irgendwo darin löst eine neue Suche aus.
+        """
+        if widget is None:
+            return None
+        cache = getattr(self, "_in_panel_cache", None)
+        if cache is not None:
             try:
-                if widget.objectName() in PANEL_WIDGET_NAMES:
-                    return widget
+                entry = cache.get(widget)
+            except TypeError:
+                entry = None
+            if entry is not None and self._parent_chain_matches(widget, entry[0]):
+                return entry[1]
+        chain = []
+        probe = widget
+        panel = None
+        while probe:
+            try:
+                if probe.objectName() in PANEL_WIDGET_NAME_SET:
+                    panel = probe
+                    break
             except Exception:
                 pass
-            widget = widget.parentWidget()
-        return None
+            probe = probe.parentWidget()
+            chain.append(probe)
+        if cache is not None:
+            try:
+                cache[widget] = (tuple(weak_ref(p) if p is not None else None for p in chain), panel)
+            except TypeError:
+                pass
+        return panel
+
+    @staticmethod
+    def _parent_chain_matches(widget, chain) -> bool:
+        probe = widget
+        for expected in chain:
+            try:
+                probe = probe.parentWidget()
+            except Exception:
+                return False
+            if expected is None:
+                if probe is not None:
+                    return False
+            elif expected() is not probe:
+                return False
+        return True
 
     def _find_unit_combo(self):
         """ComboBox mit Einträgen 'mm' und 'inch' direkt in self.w suchen."""
@@ -3983,14 +4350,23 @@ class HandlerClass:
         return None
 
     def _rebuild_widget_name_cache(self):
-        """Build an objectName cache for the current panel subtree."""
+        """Build an objectName cache for the current panel subtree.
+
+        The same pass remembers the first QListWidget/QTabWidget so the
+        core-widget fallbacks need no second tree walk.
+        """
         root = self.root_widget or self._find_root_widget()
         cache: Dict[str, List[QtWidgets.QWidget]] = {}
+        first_of_type: Dict[type, QtWidgets.QWidget] = {}
         if root is not None:
             try:
                 widgets = [root]
-                widgets.extend(root.findChildren(QtWidgets.QWidget, QtCore.Qt.FindChildrenRecursively))
+                widgets.extend(root.findChildren(QtWidgets.QWidget))
                 for widget in widgets:
+                    if len(first_of_type) < len(_FIRST_WIDGET_TYPES):
+                        for cls in _FIRST_WIDGET_TYPES:
+                            if cls not in first_of_type and isinstance(widget, cls):
+                                first_of_type[cls] = widget
                     try:
                         obj_name = widget.objectName()
                     except Exception:
@@ -4001,6 +4377,40 @@ class HandlerClass:
             except Exception:
                 pass
         self._widget_name_cache = cache
+        self._first_widget_of_type = first_of_type
+        registry = getattr(self, "_widget_registry", None)
+        if registry is not None:
+            registry.clear()
+
+    def _tab_page(self, page_name: str) -> QtWidgets.QWidget | None:
+        """Liefert eine Tab-Seite (tabProgram, tabFace, ...) aus dem Namens-Cache."""
+        for page in getattr(self, "_widget_name_cache", {}).get(page_name, []):
+            if page is not None:
+                return page
+        root = self.root_widget or self._find_root_widget()
+        if root is None:
+            return None
+        page = root.findChild(QtWidgets.QWidget, page_name, QtCore.Qt.FindChildrenRecursively)
+        self._cache_named_widget(page)
+        return page
+
+    def _find_in_tab_page(self, page_name: str, cls, name: str):
+        """Sucht ``name`` nur unter den direkten Kindern der Tab-Seite.
+
+        Die Formular-Widgets liegen laut lathe_easystep.ui direkt auf ihrer
+        Tab-Seite (nur Layouts dazwischen), daher reicht FindDirectChildrenOnly.
+        Für unbekannte/umgebaute Layouts fällt die Suche auf den ganzen Panel-
+        Baum zurück.
+        """
+        page = self._tab_page(page_name)
+        if page is not None:
+            widget = page.findChild(cls, name, QtCore.Qt.FindDirectChildrenOnly)
+            if widget is not None:
+                return widget
+        root = self.root_widget or self._find_root_widget()
+        if root is None:
+            return None
+        return root.findChild(cls, name, QtCore.Qt.FindChildrenRecursively)
 
     def _cache_named_widget(self, widget: QtWidgets.QWidget | None):
         if widget is None:
@@ -4016,6 +4426,26 @@ class HandlerClass:
             bucket.append(widget)
 
     def _get_widget_by_name(self, name: str) -> QtWidgets.QWidget | None:
+        """Wie _resolve_widget_by_name, aber mit Memo pro objectName.
+
+        Param-Maps, Übersetzungen und Tooltips fragen dieselben Namen immer
+        wieder ab; aufgelöste Widgets landen in ``_widget_registry`` (wird bei
+        _rebuild_widget_name_cache, also beim Neuaufbau des Panels, geleert).
+        """
+        registry = getattr(self, "_widget_registry", None)
+        if registry is not None:
+            widget = registry.get(name)
+            if widget is not None:
+                return widget
+        widget = self._resolve_widget_by_name(name)
+        if widget is not None and registry is not None:
+            try:
+                registry[name] = widget
+            except TypeError:
+                pass
+        return widget
+
+    def _resolve_widget_by_name(self, name: str) -> QtWidgets.QWidget | None:
         """Robuste Widget-Auflösung mit erweiterten Fallbacks für embedded Panel.
 
         Wichtig: Für Parametereinsammeln muss das *richtige* Widget gefunden werden.
@@ -4170,7 +4600,7 @@ class HandlerClass:
                         alternates.add(lname.replace('contour', 'preview'))
 
                 # scan only widgets inside the panel root
-                for w in root.findChildren(QtWidgets.QWidget, QtCore.Qt.FindChildrenRecursively):
+                for w in root.findChildren(QtWidgets.QWidget):
                     try:
                         on = (w.objectName() or "").lower()
                     except Exception:
@@ -4227,7 +4657,7 @@ class HandlerClass:
             # Found it! Set the attribute and connect signals if it's a button
             setattr(self, name, widget)
             if getattr(self, "_verbose_widget_logs", False):
-                self._log(f"[LatheEasyStep] found deferred widget '{name}': {widget}", level="debug")
+                self._log("[LatheEasyStep] found deferred widget", f"'{name}':", widget, level="debug")
             
             # If it's a button, try to connect its signal
             if isinstance(widget, QtWidgets.QPushButton):
@@ -4386,6 +4816,15 @@ class HandlerClass:
     def _on_toggle_slice_view(self, checked: bool):
         on_toggle_slice_view(self, checked)
 
+    def _on_preview_shown(self, *_args):
+        on_preview_shown(self)
+
+    def _request_preview_refresh(self):
+        request_preview_refresh(self)
+
+    def _flush_preview_refresh(self):
+        flush_preview_refresh(self)
+
     def _on_slice_changed(self, z_val: float):
         self._current_slice_z = float(z_val)
         self._sync_slice_widget()
@@ -4535,11 +4974,11 @@ class HandlerClass:
         # Gegenspindel-Checkbox und S3-Felder sicherstellen
         root = self.root_widget or self._find_root_widget()
         if self.program_has_subspindle is None and root:
-            self.program_has_subspindle = root.findChild(QtWidgets.QCheckBox, "program_has_subspindle")
+            self.program_has_subspindle = self._find_in_tab_page("tabProgram", QtWidgets.QCheckBox, "program_has_subspindle")
         if self.label_prog_s3 is None and root:
-            self.label_prog_s3 = root.findChild(QtWidgets.QWidget, "label_prog_s3")
+            self.label_prog_s3 = self._find_in_tab_page("tabProgram", QtWidgets.QWidget, "label_prog_s3")
         if self.program_s3 is None and root:
-            self.program_s3 = root.findChild(QtWidgets.QWidget, "program_s3")
+            self.program_s3 = self._find_in_tab_page("tabProgram", QtWidgets.QWidget, "program_s3")
 
         # Rückzug-Combo sicherstellen
         if self.program_retract_mode is None:
@@ -4555,59 +4994,47 @@ class HandlerClass:
                         self.program_retract_mode = combo
                         break
 
-        if self.program_retract_mode:
-            items = [self.program_retract_mode.itemText(i) for i in range(self.program_retract_mode.count())]
+        if self.program_retract_mode and self._debug_enabled():
             self._log(
-                f"[LatheEasyStep] retract combo found: "
+                f"[LatheEasyStep][debug] retract combo found: "
                 f"{self.program_retract_mode.objectName()}, "
-                f"items={items}, "
-                f"current='{self.program_retract_mode.currentText()}'", level="info")
-            # Signal hier (spät) sicher verbinden
-            self.program_retract_mode.currentIndexChanged.connect(self._handle_global_change)
-        else:
-            pass
-
-        # falls wir die Rohteilform-Combo jetzt haben: Signal anschließen
-        if self.program_shape:
-            self.program_shape.currentIndexChanged.connect(self._handle_global_change)
-
-        # falls Gegenspindel-Checkbox jetzt vorhanden: Signal anschließen
-        if self.program_has_subspindle:
-            self.program_has_subspindle.toggled.connect(self._update_subspindle_visibility)
+                f"items={self._combo_item_texts(self.program_retract_mode)}, "
+                f"current='{self.program_retract_mode.currentText()}'", level="debug")
 
         # Planen-Combos sicherstellen (für Sichtbarkeitsschaltung)
         if self.face_mode is None and root:
-            self.face_mode = root.findChild(QtWidgets.QComboBox, "face_mode")
+            self.face_mode = self._find_in_tab_page("tabFace", QtWidgets.QComboBox, "face_mode")
         if self.face_edge_type is None and root:
-            self.face_edge_type = root.findChild(QtWidgets.QComboBox, "face_edge_type")
-        if self.face_mode:
-            self.face_mode.currentIndexChanged.connect(self._update_face_visibility)
-        if self.face_edge_type:
-            self.face_edge_type.currentIndexChanged.connect(self._update_face_visibility)
+            self.face_edge_type = self._find_in_tab_page("tabFace", QtWidgets.QComboBox, "face_edge_type")
+
+        # Rückzug/Rohteilform/Gegenspindel + Planen-Combos (spät) verbinden.
+        # Gleiche Helfer wie in _finalize_ui_ready -> keine Doppelverbindungen.
+        self._connect_global_form_signals()
+        self._connect_mode_visibility_signals()
 
         # Kontur-Widgets sicherstellen
         if self.contour_start_x is None and root:
-            self.contour_start_x = root.findChild(QtWidgets.QDoubleSpinBox, "contour_start_x")
+            self.contour_start_x = self._find_in_tab_page("tabContour", QtWidgets.QDoubleSpinBox, "contour_start_x")
         if self.contour_start_z is None and root:
-            self.contour_start_z = root.findChild(QtWidgets.QDoubleSpinBox, "contour_start_z")
+            self.contour_start_z = self._find_in_tab_page("tabContour", QtWidgets.QDoubleSpinBox, "contour_start_z")
         if self.contour_name is None and root:
-            self.contour_name = root.findChild(QtWidgets.QLineEdit, "contour_name")
+            self.contour_name = self._find_in_tab_page("tabContour", QtWidgets.QLineEdit, "contour_name")
         if self.contour_segments is None and root:
-            self.contour_segments = root.findChild(QtWidgets.QTableWidget, "contour_segments")
+            self.contour_segments = self._find_in_tab_page("tabContour", QtWidgets.QTableWidget, "contour_segments")
         if self.contour_add_segment is None and root:
-            self.contour_add_segment = root.findChild(QtWidgets.QPushButton, "contour_add_segment")
+            self.contour_add_segment = self._find_in_tab_page("tabContour", QtWidgets.QPushButton, "contour_add_segment")
         if self.contour_delete_segment is None and root:
-            self.contour_delete_segment = root.findChild(QtWidgets.QPushButton, "contour_delete_segment")
+            self.contour_delete_segment = self._find_in_tab_page("tabContour", QtWidgets.QPushButton, "contour_delete_segment")
         if self.contour_move_up is None and root:
-            self.contour_move_up = root.findChild(QtWidgets.QPushButton, "contour_move_up")
+            self.contour_move_up = self._find_in_tab_page("tabContour", QtWidgets.QPushButton, "contour_move_up")
         if self.contour_move_down is None and root:
-            self.contour_move_down = root.findChild(QtWidgets.QPushButton, "contour_move_down")
+            self.contour_move_down = self._find_in_tab_page("tabContour", QtWidgets.QPushButton, "contour_move_down")
         if self.contour_edge_type is None and root:
-            self.contour_edge_type = root.findChild(QtWidgets.QComboBox, "contour_edge_type")
+            self.contour_edge_type = self._find_in_tab_page("tabContour", QtWidgets.QComboBox, "contour_edge_type")
         if self.label_contour_edge_size is None and root:
-            self.label_contour_edge_size = root.findChild(QtWidgets.QLabel, "label_contour_edge_size")
+            self.label_contour_edge_size = self._find_in_tab_page("tabContour", QtWidgets.QLabel, "label_contour_edge_size")
         if self.contour_edge_size is None and root:
-            self.contour_edge_size = root.findChild(QtWidgets.QDoubleSpinBox, "contour_edge_size")
+            self.contour_edge_size = self._find_in_tab_page("tabContour", QtWidgets.QDoubleSpinBox, "contour_edge_size")
 
         self._connect_contour_signals()
 
@@ -4622,27 +5049,13 @@ class HandlerClass:
 
         # einmal initial anwenden
         QtCore.QTimer.singleShot(0, self._apply_unit_suffix)
-        QtCore.QTimer.singleShot(0, self._update_program_visibility)
-        QtCore.QTimer.singleShot(0, self._update_retract_visibility)
-        QtCore.QTimer.singleShot(0, self._update_subspindle_visibility)
-        QtCore.QTimer.singleShot(0, self._update_face_visibility)
+        self._request_visibility_update("program", "retract", "subspindle", "face")
         QtCore.QTimer.singleShot(0, self._auto_load_tool_table)
         # Kontur-Tab initial vorbereiten (Spalten/Leerzeile optional)
         QtCore.QTimer.singleShot(0, self._init_contour_table)
         QtCore.QTimer.singleShot(0, self._sync_contour_edge_controls)
         QtCore.QTimer.singleShot(0, self._update_contour_preview_temp)
 
-        # Polling-Timer für die Einheit (mm/inch),
-        # falls das Qt-Signal aus irgendeinem Grund nicht feuert
-        if self.program_unit:
-            self._unit_last_index = self.program_unit.currentIndex()
-            self._unit_timer = QtCore.QTimer(self.root_widget or None)
-            self._unit_timer.setInterval(200)  # alle 200 ms prüfen
-            self._unit_timer.timeout.connect(self._check_unit_change)
-            self._unit_timer.start()
-            self._log("[LatheEasyStep] unit polling timer started", level="info")
-        else:
-            pass
         self._startup_mark("initialized__ end")
 
         # Jetzt sicherstellen, dass die Preview-Widgets referenziert sind
@@ -4766,12 +5179,18 @@ class HandlerClass:
         root = self.root_widget or self._panel_from_widget(self.list_ops) or self._find_root_widget()
         if root and self.root_widget is None:
             self.root_widget = root
+        registry = self._widget_registry
+
         def grab(name: str):
-            return (
-                getattr(self, name, None)
-                or self._find_any_widget(name)
-                or (root.findChild(QtWidgets.QWidget, name, QtCore.Qt.FindChildrenRecursively) if root else None)
-            )
+            widget = getattr(self, name, None) or registry.get(name)
+            if widget is None:
+                widget = (
+                    self._find_any_widget(name)
+                    or (root.findChild(QtWidgets.QWidget, name, QtCore.Qt.FindChildrenRecursively) if root else None)
+                )
+                if widget is not None:
+                    registry[name] = widget
+            return widget
         self.contour_start_x = grab("contour_start_x")
         self.contour_start_z = grab("contour_start_z")
         self.contour_name = grab("contour_name")
@@ -4815,7 +5234,7 @@ class HandlerClass:
                 self.contour_segments.raise_()
             except Exception:
                 pass
-        if getattr(self, "_verbose_widget_logs", False):
+        if self._debug_enabled():
             try:
                 names = []
                 for c in candidates:
@@ -4832,46 +5251,13 @@ class HandlerClass:
 
     def _ensure_thread_widgets(self):
         """Sichert sich die relevanten Widgets im Gewinde-Tab."""
-        if self.thread_standard is None:
-            self.thread_standard = self._get_widget_by_name("thread_standard")
-        if self.thread_orientation is None:
-            self.thread_orientation = self._get_widget_by_name("thread_orientation")
-        if self.thread_tool is None:
-            self.thread_tool = self._get_widget_by_name("thread_tool")
-        if self.thread_spindle is None:
-            self.thread_spindle = self._get_widget_by_name("thread_spindle")
-        if self.thread_major_diameter is None:
-            self.thread_major_diameter = self._get_widget_by_name("thread_major_diameter")
-        if self.thread_pitch is None:
-            self.thread_pitch = self._get_widget_by_name("thread_pitch")
-        if self.thread_length is None:
-            self.thread_length = self._get_widget_by_name("thread_length")
-        if self.thread_passes is None:
-            self.thread_passes = self._get_widget_by_name("thread_passes")
-        if self.thread_safe_z is None:
-            self.thread_safe_z = self._get_widget_by_name("thread_safe_z")
-        if self.thread_depth is None:
-            self.thread_depth = self._get_widget_by_name("thread_depth")
-        if self.thread_peak_offset is None:
-            self.thread_peak_offset = self._get_widget_by_name("thread_peak_offset")
-        if self.thread_first_depth is None:
-            self.thread_first_depth = self._get_widget_by_name("thread_first_depth")
-        if self.thread_retract_r is None:
-            self.thread_retract_r = self._get_widget_by_name("thread_retract_r")
-        if self.thread_infeed_q is None:
-            self.thread_infeed_q = self._get_widget_by_name("thread_infeed_q")
-        if self.thread_spring_passes is None:
-            self.thread_spring_passes = self._get_widget_by_name("thread_spring_passes")
-        if self.thread_e is None:
-            self.thread_e = self._get_widget_by_name("thread_e")
-        if self.thread_l is None:
-            self.thread_l = self._get_widget_by_name("thread_l")
-        # Preset-Button: ggf. noch suchen und verbinden
-        if self.btn_thread_preset is None:
-            self.btn_thread_preset = self._get_widget_by_name("btn_thread_preset")
-        if self.btn_thread_preset is not None and not getattr(self, "_thread_preset_connected", False):
+        for name in _THREAD_WIDGET_NAMES:
+            if getattr(self, name) is None:
+                setattr(self, name, self._get_widget_by_name(name))
+        # Preset-Button verbinden (wird oben mit aufgelöst)
+        if self.btn_thread_preset is not None:
             try:
-                self._connect_button_once(self.btn_thread_preset, self._apply_thread_preset_force, "_thread_preset_connected")
+                self._connect_button_once(self.btn_thread_preset, self._apply_thread_preset_force)
             except Exception:
                 pass
 
@@ -4880,31 +5266,17 @@ class HandlerClass:
         if combo is None or self._thread_standard_populated:
             return
 
-        def _compact(value: float) -> str:
-            text = f"{value:.3f}".rstrip("0").rstrip(".")
-            return text if text else "0"
-
         lang = self._current_language_code()
         custom = "Custom" if lang == "en" else "Benutzerdefiniert"
 
         combo.blockSignals(True)
         combo.clear()
         combo.addItem(custom, {"label": custom})
-        # Metric threads (ISO 60°) -> profile "metric"
-        for name, diameter, pitch in STANDARD_METRIC_THREAD_SPECS:
-            pitch_text = _compact(pitch)
-            label = f"{name} x {pitch_text}"
+        # Metrisch (ISO 60°) -> Profil "metric", Trapez -> Profil "tr"
+        for label, diameter, pitch, profile in _THREAD_STANDARD_ITEMS:
             combo.addItem(
                 label,
-                {"label": label, "major": diameter, "pitch": pitch, "profile": "metric"},
-            )
-        # Trapezoidal threads -> profile "tr"
-        for name, diameter, pitch in STANDARD_TR_THREAD_SPECS:
-            pitch_text = _compact(pitch)
-            label = f"{name} x {pitch_text}"
-            combo.addItem(
-                label,
-                {"label": label, "major": diameter, "pitch": pitch, "profile": "tr"},
+                {"label": label, "major": diameter, "pitch": pitch, "profile": profile},
             )
         combo.setCurrentIndex(0)
         combo.blockSignals(False)
@@ -4917,16 +5289,14 @@ class HandlerClass:
             return
         if not self._thread_standard_populated:
             self._populate_thread_standard_options()
-        if not self._thread_standard_signal_connected:
-            try:
-                combo.currentIndexChanged.connect(self._apply_standard_thread_selection)
-                self._thread_standard_signal_connected = True
-            except Exception:
-                pass
+        try:
+            self._connect_combo_once(combo, self._apply_standard_thread_selection)
+        except Exception:
+            pass
         # Connect preset button (force apply)
-        if self.btn_thread_preset is not None and not getattr(self, "_thread_preset_connected", False):
+        if self.btn_thread_preset is not None:
             try:
-                self._connect_button_once(self.btn_thread_preset, self._apply_thread_preset_force, "_thread_preset_connected")
+                self._connect_button_once(self.btn_thread_preset, self._apply_thread_preset_force)
             except Exception:
                 pass
         # Apply a soft preset now (sets major/pitch + fills empty fields)
@@ -4965,13 +5335,9 @@ class HandlerClass:
         """
         if spin is None:
             return False
-        try:
-            curr = float(spin.value())
-            if abs(curr) < 1e-9:
-                spin.setValue(float(value))
-                return True
-        except Exception:
-            pass
+        if abs(float(spin.value())) < 1e-9:
+            spin.setValue(float(value))
+            return True
         return False
 
     def _apply_thread_preset(self, force: bool = False):
@@ -5042,25 +5408,17 @@ class HandlerClass:
                 if self._set_if_zero(self.thread_peak_offset, peak_offset): changed.append('peak_offset')
                 if self._set_if_zero(self.thread_retract_r, 1.5): changed.append('retract_r')
                 if self._set_if_zero(self.thread_infeed_q, q_angle): changed.append('infeed_q')
-                # spring passes
-                if self.thread_spring_passes is not None:
-                    try:
-                        if force or int(self.thread_spring_passes.value()) == 0:
-                            self.thread_spring_passes.setValue(1); changed.append('spring_passes')
-                    except Exception:
-                        pass
+                # spring passes (force ist hier immer False)
+                sp = self.thread_spring_passes
+                if sp is not None and int(sp.value()) == 0:
+                    sp.setValue(1); changed.append('spring_passes')
                 if self._set_if_zero(self.thread_e, 0.0): changed.append('e')
-                if self.thread_l is not None:
-                    try:
-                        if force or int(self.thread_l.value()) == 0:
-                            self.thread_l.setValue(0); changed.append('l')
-                    except Exception:
-                        pass
+                tl = self.thread_l
+                if tl is not None and int(tl.value()) == 0:
+                    tl.setValue(0); changed.append('l')
             # Debug-Ausgabe
-            try:
-                self._log(f"[LatheEasyStep] _apply_thread_preset: profile={profile}, pitch={p}, changed={changed}", level="info")
-            except Exception:
-                pass
+            if self._debug_enabled():
+                self._log(f"[LatheEasyStep][debug] _apply_thread_preset: profile={profile}, pitch={p}, changed={changed}", level="debug")
         finally:
             self._thread_applying_standard = False
 
@@ -5077,44 +5435,57 @@ class HandlerClass:
 
     def _debug_widget_names(self):
         """Debug-Ausgabe: vorhandene Buttons/ListWidgets im Baum."""
+        if not self._debug_enabled():
+            return
         root = self.root_widget or self._find_root_widget()
         if root is None:
             self._log("[LatheEasyStep] debug: no root widget", level="debug")
             return
-        btns = [w.objectName() for w in root.findChildren(QtWidgets.QPushButton)]
-        lists = [w.objectName() for w in root.findChildren(QtWidgets.QListWidget)]
+        btns = []
+        lists = []
+        # ein Baumdurchlauf für beide Typen
+        for w in root.findChildren(QtWidgets.QWidget):
+            if isinstance(w, QtWidgets.QPushButton):
+                btns.append(w.objectName())
+            elif isinstance(w, QtWidgets.QListWidget):
+                lists.append(w.objectName())
         self._log(f"[LatheEasyStep] debug root: {root.objectName()}", level="debug")
         self._log(f"[LatheEasyStep] debug buttons: {btns}", level="debug")
         self._log(f"[LatheEasyStep] debug list widgets: {lists}", level="debug")
 
-    def _connect_button_once(self, button, handler, flag_name: str):
-
-        """Verbindet Buttons stabil (keine Doppel-Auslösung).
-
-    
-
-        Wir disconnecten *immer* zuerst, weil Buttons an mehreren Stellen initialisiert werden können
-
-        (_ensure_core_widgets, _connect_signals, usw.). Das verhindert zuverlässig Mehrfachverbindungen.
+    @staticmethod
+    def _connect_unique(signal, slot) -> bool:
+        """connect() mit Qt.UniqueConnection; False, wenn bereits verbunden.
 
+        Qt selbst verhindert Doppelverbindungen (PyQt meldet sie als
+        TypeError), daher brauchen wiederholte Init-Pfade keine eigenen Flags.
         """
+        try:
+            signal.connect(slot, QtCore.Qt.UniqueConnection)
+        except TypeError:
+            return False
+        return True
 
-        if not button:
+    def _connect_button_once(self, button, handler):
+        """Verbindet Buttons stabil (keine Doppel-Auslösung).
 
+        Ist ``handler`` neu am Button, wird ``clicked`` vorher komplett
+        getrennt (Altverbindungen aus früheren Init-Pfaden/Handler-Instanzen);
+        ist er schon verbunden, passiert nichts.
+        """
+        if not button or not self._connect_unique(button.clicked, handler):
             return
-
         try:
-
             button.clicked.disconnect()
-
         except Exception:
-
             pass
+        button.clicked.connect(handler, QtCore.Qt.UniqueConnection)
 
-        button.clicked.connect(handler)
-
-        setattr(self, flag_name, True)
-
+    def _connect_combo_once(self, combo, slot) -> bool:
+        """Verbindet currentIndexChanged genau einmal pro Combo und Slot."""
+        if combo is None:
+            return False
+        return self._connect_unique(combo.currentIndexChanged, slot)
 
     def _ensure_core_widgets(self):
         """Sucht fehlende Kern-Widgets (Liste/Buttons/Tabs) im UI-Baum nach."""
@@ -5124,9 +5495,16 @@ class HandlerClass:
         combo = getattr(self, "parting_slice_strategy", None)
         if combo is None:
             return
-        for idx, data_value in enumerate((1, 2)):
+        # Itemdaten ändern sich nur beim Neubefüllen der Combo; gemerkt wird
+        # die Combo-Instanz, damit ein ersetztes Widget erneut befüllt wird.
+        if getattr(self, "_parting_slice_items_ready", None) is combo:
+            return
+        data_values = (1, 2)
+        for idx, data_value in enumerate(data_values):
             if idx < combo.count():
                 combo.setItemData(idx, data_value, QtCore.Qt.UserRole)
+        if combo.count() >= len(data_values):
+            self._parting_slice_items_ready = combo
 
     def _select_slice_strategy_index(self, combo, value) -> bool:
         combo = combo or getattr(self, "parting_slice_strategy", None)
@@ -5157,20 +5535,13 @@ class HandlerClass:
                     return True
         return False
 
-    def _check_unit_change(self):
-        """Pollt die Einheit-Combo und triggert _apply_unit_suffix() bei Änderung."""
-        if self.program_unit is None:
-            return
-
-        idx = self.program_unit.currentIndex()
-        if idx != self._unit_last_index:
-            self._unit_last_index = idx
-            self._log(f"[LatheEasyStep] unit changed (poll) idx={idx}", level="info")
-            self._apply_unit_suffix()
-            self._update_program_visibility()
-            self._update_retract_visibility()
-            self._update_subspindle_visibility()
-            self._update_face_visibility()
+    @staticmethod
+    def _combo_item_texts(combo) -> List[str]:
+        """Alle Eintragstexte einer Combo; bei QStringListModel in einem Aufruf."""
+        model = combo.model()
+        if isinstance(model, QtCore.QStringListModel):
+            return list(model.stringList())
+        return [combo.itemText(i) for i in range(combo.count())]
 
     # ---- Parameter-Mapping --------------------------------------------
     def _setup_param_maps(self):
@@ -5303,28 +5674,24 @@ class HandlerClass:
         return "en" if combo.currentIndex() == 1 else "de"
 
     def _handle_language_change(self, *_args):
-        self._apply_language_texts()
+        if not self._apply_language_texts():
+            return
         self._thread_standard_populated = False
         self._setup_thread_helpers()
 
-    def _apply_language_texts(self):
+    def _apply_language_texts(self, force: bool = False) -> bool:
+        """Übersetzt alle Texte; False, wenn die Sprache unverändert war.
+
+        Die Combo feuert auch ohne echten Wechsel (z. B. beim Neubefüllen
+        durch _apply_combo_translations) – dann sparen wir den kompletten
+        setText-/Tooltip-Durchlauf.
+        """
         lang = self._current_language_code()
-        for name, translations in TEXT_TRANSLATIONS.items():
-            # Schutz für Embedded-Mode: generische Qt-Labelnamen wie label_32,
-            # label_38 etc. kollidieren häufig mit Host-GUI-Widgets (z. B.
-            # QtDragon Tool-Info). Diese Namen daher grundsätzlich nicht
-            # automatisch überschreiben.
-            if re.match(r"^label_\d+$", str(name or "")):
-                continue
-            widget = self._get_widget_by_name(name)
-            if widget is None:
-                continue
-            text = translations.get(lang)
-            if text is not None:
-                try:
-                    widget.setText(text)
-                except Exception:
-                    pass
+        if not force and lang == getattr(self, "_last_language", None):
+            return False
+        self._last_language = lang
+        # label_<n> ist in _TEXT_BY_LANG bereits ausgefiltert (Embedded-Mode).
+        self._apply_flat_translations(_TEXT_BY_LANG, lang, "setText")
         self._apply_combo_translations(lang)
         self._handle_global_change()
         self._apply_tab_titles(lang)
@@ -5342,19 +5709,38 @@ class HandlerClass:
             self._apply_groove_tooltips(lang)
         except Exception:
             pass
+        return True
+
+    def _apply_flat_translations(self, flat, lang: str, *setter_names: str):
+        entries = flat.get(lang)
+        if entries is None:
+            entries = flat[DEFAULT_LANGUAGE]
+        for name, text in entries:
+            if text is None:
+                continue
+            widget = self._get_widget_by_name(name)
+            if widget is None:
+                continue
+            _set_widget_text(widget, text, *setter_names)
 
     def _apply_combo_translations(self, lang: str):
         for name, options in COMBO_OPTION_TRANSLATIONS.items():
             widget = self._get_widget_by_name(name)
             if widget is None or lang not in options:
                 continue
+            # Dynamische Property merkt die zuletzt eingesetzte Sprache je Combo;
+            # ein neu geladenes Widget hat sie nicht und wird wieder befüllt.
+            if widget.property(_COMBO_LANG_PROPERTY) == lang:
+                continue
+            widget.setProperty(_COMBO_LANG_PROPERTY, lang)
             current_index = widget.currentIndex()
             widget.blockSignals(True)
             widget.clear()
-            for entry in options[lang]:
-                widget.addItem(entry)
+            widget.addItems(list(options[lang]))
             widget.setCurrentIndex(max(0, min(current_index, widget.count() - 1)))
             widget.blockSignals(False)
+            if name == "parting_slice_strategy":
+                self._parting_slice_items_ready = None
         self._setup_parting_slice_strategy_items()
 
     def _apply_tab_titles(self, lang: str):
@@ -5375,42 +5761,23 @@ class HandlerClass:
             if translations:
                 title = translations.get(lang)
             if title is None:
-                current_text = self.tab_params.tabText(idx).strip()
-                for translations in TAB_TRANSLATIONS.values():
-                    if current_text in translations.values():
-                        title = translations.get(lang)
-                        break
+                translations = _TAB_TEXT_INDEX.get(tab_widget.tabText(idx).strip())
+                if translations:
+                    title = translations.get(lang)
             if title:
-                try:
-                    self.tab_params.setTabText(idx, title)
-                except Exception:
-                    pass
+                tab_widget.setTabText(idx, title)
 
     def _apply_button_translations(self, lang: str):
-        for name, translations in BUTTON_TRANSLATIONS.items():
-            button = self._get_widget_by_name(name)
-            if button is None:
-                continue
-            text = translations.get(lang)
-            if text is not None:
-                try:
-                    button.setText(text)
-                except Exception:
-                    pass
+        self._apply_flat_translations(_BUTTON_BY_LANG, lang, "setText")
 
         # Planen-spezifische Logik
-        if getattr(self, "face_mode", None) and self.face_mode not in self._connected_param_widgets:
-            self.face_mode.currentIndexChanged.connect(self._update_face_visibility)
-            self._connected_param_widgets.add(self.face_mode)
-        if getattr(self, "face_edge_type", None) and self.face_edge_type not in self._connected_param_widgets:
-            self.face_edge_type.currentIndexChanged.connect(self._update_face_visibility)
-            self._connected_param_widgets.add(self.face_edge_type)
+        self._connect_mode_visibility_signals()
 
         # Abspan-spezifische Logik
-        if getattr(self, "parting_contour", None) and not getattr(self, "_parting_contour_connected", False):
-            self.parting_contour.currentIndexChanged.connect(self._update_parting_ready_state)
-            self.parting_contour.editTextChanged.connect(self._update_parting_ready_state)
-            self._parting_contour_connected = True
+        parting_contour = getattr(self, "parting_contour", None)
+        if parting_contour:
+            self._connect_unique(parting_contour.currentIndexChanged, self._update_parting_ready_state)
+            self._connect_unique(parting_contour.editTextChanged, self._update_parting_ready_state)
 
         self._connect_contour_signals()
 
@@ -5420,104 +5787,59 @@ class HandlerClass:
 
     def _apply_thread_tooltips(self, lang: str):
         """Setzt Tooltips für bekannte Thread-Widgets gemäß Sprache."""
-        for name, translations in THREAD_TOOLTIP_TRANSLATIONS.items():
-            widget = self._get_widget_by_name(name)
-            if widget is None:
-                continue
-            text = translations.get(lang) or translations.get("de")
-            try:
-                widget.setToolTip(text)
-            except Exception:
-                pass
-        for btn_attr, handler, flag in (
-            ("contour_add_segment", self._handle_contour_add_segment, "_contour_add_connected"),
-            ("contour_delete_segment", self._handle_contour_delete_segment, "_contour_delete_connected"),
-            ("contour_move_up", self._handle_contour_move_up, "_contour_move_up_connected"),
-            ("contour_move_down", self._handle_contour_move_down, "_contour_move_down_connected"),
+        self._apply_flat_translations(_THREAD_TOOLTIP_BY_LANG, lang, "setToolTip")
+        for btn_attr, handler in (
+            ("contour_add_segment", self._handle_contour_add_segment),
+            ("contour_delete_segment", self._handle_contour_delete_segment),
+            ("contour_move_up", self._handle_contour_move_up),
+            ("contour_move_down", self._handle_contour_move_down),
         ):
             btn = getattr(self, btn_attr, None)
-            if btn and not getattr(self, flag, False):
-                connected = False
-                try:
-                    btn.clicked.connect(handler, QtCore.Qt.UniqueConnection)
-                    connected = True
-                except TypeError:
-                    # Qt version may not support UniqueConnection; skip further connect attempt
-                    connected = True  # Mark as attempted to avoid retry
-                except Exception:
-                    pass
-                if connected:
-                    setattr(self, flag, True)
+            if btn:
+                self._connect_unique(btn.clicked, handler)
 
-        if getattr(self, "contour_segments", None) and not getattr(self, "_contour_table_connected", False):
-            self.contour_segments.itemChanged.connect(self._handle_contour_table_change)
-            self.contour_segments.currentCellChanged.connect(self._handle_contour_row_select)
-            self._contour_table_connected = True
+        table = getattr(self, "contour_segments", None)
+        if table:
+            self._connect_unique(table.itemChanged, self._handle_contour_table_change)
+            self._connect_unique(table.currentCellChanged, self._handle_contour_row_select)
 
     def _apply_parting_tooltips(self, lang: str):
         """Setzt Tooltips für bekannte Abspanen-Widgets gemäß Sprache."""
-        for name, translations in PARTING_TOOLTIP_TRANSLATIONS.items():
-            widget = self._get_widget_by_name(name)
-            if widget is None:
-                continue
-            text = translations.get(lang) or translations.get("de")
-            try:
-                widget.setToolTip(text)
-                try:
-                    widget.setWhatsThis(text)
-                except Exception:
-                    # some widgets may not implement setWhatsThis
-                    pass
-            except Exception:
-                pass
-            self._contour_table_connected = True
+        self._apply_flat_translations(_PARTING_TOOLTIP_BY_LANG, lang, "setToolTip", "setWhatsThis")
 
     def _apply_groove_tooltips(self, lang: str):
         """Setzt Tooltips für bekannte Nut-Widgets gemäß Sprache."""
-        for name, translations in GROOVE_TOOLTIP_TRANSLATIONS.items():
-            widget = self._get_widget_by_name(name)
-            if widget is None:
+        self._apply_flat_translations(_GROOVE_TOOLTIP_BY_LANG, lang, "setToolTip", "setWhatsThis")
+
+        for attr, signal_name, slots in (
+            ("contour_start_x", "valueChanged", (self._update_contour_preview_temp,)),
+            ("contour_start_z", "valueChanged", (self._update_contour_preview_temp,)),
+            ("contour_name", "textChanged", (self._update_contour_preview_temp, self._update_parting_contour_choices)),
+            ("contour_edge_type", "currentIndexChanged", (self._handle_contour_edge_change,)),
+            ("contour_edge_size", "valueChanged", (self._handle_contour_edge_change,)),
+        ):
+            widget = getattr(self, attr, None)
+            if not widget:
                 continue
-            text = translations.get(lang) or translations.get("de")
-            try:
-                widget.setToolTip(text)
-                try:
-                    widget.setWhatsThis(text)
-                except Exception:
-                    pass
-            except Exception:
-                pass
-
-        if getattr(self, "contour_start_x", None) and not getattr(self, "_contour_start_x_connected", False):
-            self.contour_start_x.valueChanged.connect(self._update_contour_preview_temp)
-            self._contour_start_x_connected = True
-        if getattr(self, "contour_start_z", None) and not getattr(self, "_contour_start_z_connected", False):
-            self.contour_start_z.valueChanged.connect(self._update_contour_preview_temp)
-            self._contour_start_z_connected = True
-        if getattr(self, "contour_name", None) and not getattr(self, "_contour_name_connected", False):
-            self.contour_name.textChanged.connect(self._update_contour_preview_temp)
-            self.contour_name.textChanged.connect(self._update_parting_contour_choices)
-            self._contour_name_connected = True
-
-        if getattr(self, "contour_edge_type", None) and not getattr(self, "_contour_edge_type_connected", False):
-            self.contour_edge_type.currentIndexChanged.connect(self._handle_contour_edge_change)
-            self._contour_edge_type_connected = True
-        if getattr(self, "contour_edge_size", None) and not getattr(self, "_contour_edge_size_connected", False):
-            self.contour_edge_size.valueChanged.connect(self._handle_contour_edge_change)
-            self._contour_edge_size_connected = True
+            signal = getattr(widget, signal_name)
+            for slot in slots:
+                self._connect_unique(signal, slot)
 
     # ---- Abspan-Helfer ----------------------------------------------
-    def _available_contour_names(self) -> List[str]:
-        return available_contour_names(self)
+    def _available_contour_names(self, contours=None) -> List[str]:
+        return available_contour_names(self, contours)
 
     def _current_parting_contour_name(self) -> str:
         return current_parting_contour_name(self)
 
-    def _debug_contour_state(self, context: str = ""):
-        debug_contour_state(self, context)
+    def _debug_contour_state(self, context: str = "", contours=None):
+        debug_contour_state(self, context, contours)
+
+    def _iter_contour_ops(self) -> List[Tuple[int, Operation, str]]:
+        return iter_contour_ops(self)
 
-    def _resolve_contour_path(self, contour_name: str) -> List[Tuple[float, float]]:
-        return resolve_contour_path(self, contour_name)
+    def _resolve_contour_path(self, contour_name: str, contours=None) -> List[Tuple[float, float]]:
+        return resolve_contour_path(self, contour_name, contours)
 
     def _update_parting_contour_choices(self):
         update_parting_contour_choices(self)
@@ -5559,7 +5881,7 @@ class HandlerClass:
         return f"Kontur {idx + 1}"
 
     def _contour_count(self) -> int:
-        return sum(1 for op in self.model.operations if op.op_type == OpType.CONTOUR)
+        return len(contour_operations(self))
 
     def _contour_name_or_fallback(self, op: Operation, idx: int) -> str:
         name = str(op.params.get("name") or "").strip()
@@ -5573,31 +5895,14 @@ class HandlerClass:
 
     def _contour_sequence_index(self, target: Operation) -> int | None:
         """Zählt nur Kontur-Operationen und gibt deren Reihenindex zurück."""
-        idx = 0
-        for op in self.model.operations:
-            if op.op_type != OpType.CONTOUR:
-                continue
-            if op is target:
-                return idx
-            idx += 1
-        return None
+        return contour_sequence_index(self, target)
 
     # ---- Helfer -------------------------------------------------------
     def _current_op_type(self) -> str:
         if self.tab_params is None:
             self.tab_params = self._get_widget_by_name("tabParams")
         idx = self.tab_params.currentIndex() if self.tab_params else 1  # Default=Planen
-        mapping = {
-            0: OpType.PROGRAM_HEADER,  # Programmkopf
-            1: OpType.FACE,
-            2: OpType.CONTOUR,
-            3: OpType.ABSPANEN,
-            4: OpType.THREAD,
-            5: OpType.GROOVE,
-            6: OpType.DRILL,
-            7: OpType.KEYWAY,
-        }
-        return mapping.get(idx, OpType.FACE)
+        return _OP_TYPE_BY_TAB[idx] if 0 <= idx < len(_OP_TYPE_BY_TAB) else OpType.FACE
 
 
     def _widget_get_value(self, widget):
@@ -5637,52 +5942,15 @@ class HandlerClass:
 
     def _collect_params(self, op_type: str) -> Dict[str, object]:
         self._setup_param_maps()
-        widgets = self.param_widgets.get(op_type, {})
         params: Dict[str, object] = {}
-        for key, widget in widgets.items():
-            if widget is None:
-                continue
+        for key, widget, read in self._param_collectors.get(op_type, ()):
             try:
-                if isinstance(widget, QtWidgets.QSpinBox):
-                    params[key] = float(widget.value())
-                elif isinstance(widget, QtWidgets.QDoubleSpinBox):
-                    params[key] = float(widget.value())
-                elif isinstance(widget, QtWidgets.QComboBox):
-                    if key == "slice_strategy":
-                        idx = widget.currentIndex()
-                        data = widget.itemData(idx, QtCore.Qt.UserRole)
-                        if isinstance(data, (int, float)):
-                            params[key] = int(float(data))
-                        else:
-                            params[key] = idx + 1
-                    else:
-                        data = widget.currentData()
-                        if data is not None:
-                            params[key] = data
-                        else:
-                            params[key] = float(widget.currentIndex())
-                elif isinstance(widget, QtWidgets.QLineEdit):
-                    text = widget.text().strip()
-                    if text == "":
-                        continue
-                    # try float, else keep as string
-                    try:
-                        params[key] = float(text.replace(",", "."))
-                    except Exception:
-                        params[key] = text
-                elif isinstance(widget, QtWidgets.QAbstractButton):
-                    params[key] = float(widget.isChecked())
-                else:
-                    # Fallback: only record if we can safely read something
-                    if hasattr(widget, "value"):
-                        params[key] = float(widget.value())
-                    elif hasattr(widget, "text"):
-                        text = str(widget.text()).strip()
-                        if text != "":
-                            params[key] = text
+                value = read(widget)
             except Exception:
                 # Never let a broken widget mapping wipe the whole params dict
                 continue
+            if value is not None:
+                params[key] = value
         # Kontur-Segmente separat aus Tabelle einsammeln
         if op_type == OpType.CONTOUR:
             params["segments"] = self._collect_contour_segments()
@@ -5741,82 +6009,33 @@ class HandlerClass:
                 if key not in params or params[key] is None or params[key] == "":
                     params[key] = default
         return params
-    def _collect_program_header(self) -> Dict[str, object]:
-        """Sammelt alle Programmkopf-Parameter für Kommentare/G-Code."""
-        # Fehlende Widgets nachladen, falls sie zum Zeitpunkt der Initialisierung
-        # noch nicht gefunden wurden (z. B. wegen verzögertem UI-Aufbau).
-        if self.program_npv is None:
-            self.program_npv = self._get_widget_by_name("program_npv")
+    def _resolve_header_widgets(self) -> None:
+        """Fehlende Programmkopf-Widgets nachladen (z. B. wegen verzögertem UI-Aufbau).
+
+        Sobald alle gefunden sind - oder nach dem Start ein voller Durchlauf
+        am selben Panel lief - ist der Aufruf ein No-op; Optionale Widgets,
+        die im .ui fehlen, lösen so nicht bei jedem Sammeln neue Suchen aus.
+        _force_attach_core_widgets gibt die Suche wieder frei.
+        """
+        root = self.root_widget
+        if root is not None and getattr(self, "_header_widgets_root", None) is root:
+            return
         if self.program_unit is None:
             self.program_unit = self._find_unit_combo()
         if self.program_shape is None:
             self.program_shape = self._find_shape_combo()
-        if self.program_retract_mode is None:
-            self.program_retract_mode = self._get_widget_by_name("program_retract_mode")
-        if self.program_s1 is None:
-            self.program_s1 = self._get_widget_by_name("program_s1")
-        if self.program_s3 is None:
-            self.program_s3 = self._get_widget_by_name("program_s3")
-        if self.program_has_subspindle is None:
-            self.program_has_subspindle = self._get_widget_by_name("program_has_subspindle")
-        if self.program_xt is None:
-            self.program_xt = self._get_widget_by_name("program_xt")
-        if self.program_zt is None:
-            self.program_zt = self._get_widget_by_name("program_zt")
-        if self.program_sc is None:
-            self.program_sc = self._get_widget_by_name("program_sc")
-        if getattr(self, "program_machine_profile", None) is None:
-            self.program_machine_profile = self._get_widget_by_name("program_machine_profile")
-        if getattr(self, "program_chuck_size", None) is None:
-            self.program_chuck_size = self._get_widget_by_name("program_chuck_size")
-        if getattr(self, "program_chuck_part_type", None) is None:
-            self.program_chuck_part_type = self._get_widget_by_name("program_chuck_part_type")
-        if getattr(self, "program_chuck_grip_mode", None) is None:
-            self.program_chuck_grip_mode = self._get_widget_by_name("program_chuck_grip_mode")
-        if getattr(self, "program_chuck_profile", None) is None:
-            self.program_chuck_profile = self._get_widget_by_name("program_chuck_profile")
-        if getattr(self, "program_chuck_x_min", None) is None:
-            self.program_chuck_x_min = self._get_widget_by_name("program_chuck_x_min")
-        if getattr(self, "program_chuck_x_max", None) is None:
-            self.program_chuck_x_max = self._get_widget_by_name("program_chuck_x_max")
-        if getattr(self, "program_chuck_z_limit", None) is None:
-            self.program_chuck_z_limit = self._get_widget_by_name("program_chuck_z_limit")
-        if self.program_name is None:
-            self.program_name = self._get_widget_by_name("program_name")
-        if self.program_xa is None:
-            self.program_xa = self._get_widget_by_name("program_xa")
-        if self.program_xi is None:
-            self.program_xi = self._get_widget_by_name("program_xi")
-        if self.program_za is None:
-            self.program_za = self._get_widget_by_name("program_za")
-        if self.program_zi is None:
-            self.program_zi = self._get_widget_by_name("program_zi")
-        if self.program_zb is None:
-            self.program_zb = self._get_widget_by_name("program_zb")
-        if self.program_w is None:
-            self.program_w = self._get_widget_by_name("program_w")
-        if self.program_l is None:
-            self.program_l = self._get_widget_by_name("program_l")
-        if self.program_n is None:
-            self.program_n = self._get_widget_by_name("program_n")
-        if self.program_sw is None:
-            self.program_sw = self._get_widget_by_name("program_sw")
-        if self.program_xra is None:
-            self.program_xra = self._get_widget_by_name("program_xra")
-        if self.program_xri is None:
-            self.program_xri = self._get_widget_by_name("program_xri")
-        if self.program_zra is None:
-            self.program_zra = self._get_widget_by_name("program_zra")
-        if self.program_zri is None:
-            self.program_zri = self._get_widget_by_name("program_zri")
-        if self.program_xra_absolute is None:
-            self.program_xra_absolute = self._get_widget_by_name("program_xra_absolute")
-        if self.program_xri_absolute is None:
-            self.program_xri_absolute = self._get_widget_by_name("program_xri_absolute")
-        if self.program_zra_absolute is None:
-            self.program_zra_absolute = self._get_widget_by_name("program_zra_absolute")
-        if self.program_zri_absolute is None:
-            self.program_zri_absolute = self._get_widget_by_name("program_zri_absolute")
+        complete = self.program_unit is not None and self.program_shape is not None
+        for name in _HEADER_WIDGET_NAMES:
+            if getattr(self, name) is None:
+                widget = self._get_widget_by_name(name)
+                setattr(self, name, widget)
+                complete = complete and widget is not None
+        if complete or getattr(self, "_startup_complete", False):
+            self._header_widgets_root = root
+
+    def _collect_program_header(self) -> Dict[str, object]:
+        """Sammelt alle Programmkopf-Parameter für Kommentare/G-Code."""
+        self._resolve_header_widgets()
 
         header: Dict[str, object] = {}
         if self.program_npv:
@@ -5974,75 +6193,29 @@ class HandlerClass:
             mode_item = table.item(row, 0)
             x_item = table.item(row, 1)
             z_item = table.item(row, 2)
-            edge_item = table.item(row, 3)
             size_item = table.item(row, 4)
-            # Edge type can be a QComboBox cell widget (preferred) or a text item
-            edge_widget = table.cellWidget(row, 3)
-            arc_side_item = table.item(row, 5)
-            arc_side_widget = table.cellWidget(row, 5)
-
-            mode_raw = mode_item.text().strip().lower() if mode_item else "xz"
-            if mode_raw.startswith("xz"):
-                mode = "xz"
-            elif mode_raw.startswith("x"):
-                mode = "x"
-            elif mode_raw.startswith("z"):
-                mode = "z"
-            else:
-                mode = "xz"
-
-            # Edge type text (German/English): prefer combo widget if present
-            edge_txt = ""
-            try:
-                if edge_widget is not None and hasattr(edge_widget, "currentText"):
-                    edge_txt = str(edge_widget.currentText()).strip().lower()
-                elif edge_item is not None and edge_item.text():
-                    edge_txt = edge_item.text().strip().lower()
-            except Exception:
-                edge_txt = ""
-            if not edge_txt:
-                edge_txt = "keine"
-            
-            # Accept common German/English labels
-            if edge_txt.startswith(("f", "c")):  # Fase / Chamfer
-                edge = "chamfer"
-            elif edge_txt.startswith(("r", "ra")):  # Radius
-                edge = "radius"
-            else:
-                edge = "none"
-            
 
+            mode = _contour_segment_mode(mode_item.text().strip().lower() if mode_item else "xz")
+            # Edge type can be a QComboBox cell widget (preferred) or a text item
+            edge = _contour_edge_kind(_cell_choice_text(table.cellWidget(row, 3), table.item(row, 3)) or "keine")
             # Bogen-Seite (Auto/Außen/Innen) – nur relevant bei Radius
-            arc_txt = ""
-            try:
-                if arc_side_widget is not None and hasattr(arc_side_widget, "currentText"):
-                    arc_txt = str(arc_side_widget.currentText()).strip().lower()
-                elif arc_side_item is not None and arc_side_item.text():
-                    arc_txt = arc_side_item.text().strip().lower()
-            except Exception:
-                arc_txt = ""
-
+            arc_txt = _cell_choice_text(table.cellWidget(row, 5), table.item(row, 5))
             arc_side = normalize_arc_side(arc_txt)
 
-            def _to_float(item):
-                try:
-                    txt = item.text().replace(",", ".")
-                    return float(txt)
-                except Exception:
-                    return 0.0
-
-            x_text = x_item.text().strip() if x_item and x_item.text() else ""
-            z_text = z_item.text().strip() if z_item and z_item.text() else ""
+            # Zelltext nur einmal lesen (item.text() geht jedes Mal durch Qt)
+            x_text = x_item.text().strip() if x_item else ""
+            z_text = z_item.text().strip() if z_item else ""
+            size_text = size_item.text().strip() if size_item else ""
 
             segments.append(
                 {
                     "mode": mode,
-                    "x": _to_float(x_item) if x_item else 0.0,
-                    "z": _to_float(z_item) if z_item else 0.0,
+                    "x": _cell_float(x_text),
+                    "z": _cell_float(z_text),
                     "x_empty": x_text == "",
                     "z_empty": z_text == "",
                     "edge": edge,
-                    "edge_size": _to_float(size_item) if size_item else 0.0,
+                    "edge_size": _cell_float(size_text),
                     "arc_side": arc_side,
                     "arc_side_raw": arc_txt,
                 }
@@ -6133,6 +6306,7 @@ class HandlerClass:
 
     def _refresh_operation_list(self, select_index: int | None = None):
         """Synchronisiert die linke Operationsliste mit dem internen Modell."""
+        self._contour_ops_cache = None
         if self.list_ops is not None:
             try:
                 if self.list_ops.objectName() not in ("listOperations", "list_ops"):
@@ -6140,6 +6314,14 @@ class HandlerClass:
             except Exception:
                 self.list_ops = None
 
+        if self.list_ops is None:
+            cache = getattr(self, "_widget_name_cache", {})
+            for name in ("listOperations", "list_ops"):
+                self.list_ops = next(
+                    (w for w in cache.get(name, []) if isinstance(w, QtWidgets.QListWidget)), None
+                )
+                if self.list_ops is not None:
+                    break
         if self.list_ops is None:
             root = self.root_widget or self._find_root_widget()
             if root:
@@ -6153,13 +6335,28 @@ class HandlerClass:
             return
 
         # Nur die Operations-Liste updaten (nicht andere QListWidgets).
-        for lst in [self.list_ops]:
-            current = lst.currentRow()
-            lst.blockSignals(True)
+        lst = self.list_ops
+        self._prepare_list_ops(lst)
+        current = lst.currentRow()
+        lst.blockSignals(True)
+        lst.setUpdatesEnabled(False)
+        try:
             self._op_row_user_selected = False
-            lst.clear()
-            for i, op in enumerate(self.model.operations):
-                lst.addItem(self._describe_operation(op, i + 1))
+            texts = [self._describe_operation(op, i + 1) for i, op in enumerate(self.model.operations)]
+            # Vorhandene Items weiterverwenden: nur geänderte Texte setzen und
+            # die Differenz am Ende anhängen bzw. abschneiden.
+            kept = min(lst.count(), len(texts))
+            for i in range(kept):
+                item = lst.item(i)
+                if item.text() != texts[i]:
+                    item.setText(texts[i])
+            if kept == 0:
+                lst.clear()  # z. B. neues Programm: ein Reset statt N Einzelentfernungen
+            else:
+                for row in range(lst.count() - 1, kept - 1, -1):
+                    lst.takeItem(row)
+            if len(texts) > kept:
+                lst.addItems(texts[kept:])
 
             if select_index is None:
                 target_idx = current
@@ -6172,35 +6369,26 @@ class HandlerClass:
                 lst.setCurrentRow(target_idx)
             elif lst.count() > 0:
                 lst.setCurrentRow(lst.count() - 1)
+        finally:
+            lst.setUpdatesEnabled(True)
             lst.blockSignals(False)
-            try:
-                if getattr(self, "_verbose_widget_logs", False):
-                    items = [lst.item(i).text() for i in range(lst.count())]
-                    self._log(
-                        f"[LatheEasyStep][debug] list '{lst.objectName()}' "
-                        f"count={lst.count()} items={items} vis={lst.isVisible()} "
-                        f"size={lst.size()}", level="debug")
-                # Sichtbarkeit erzwingen – eigener Style gegen dunkle QSS
-                lst.setStyleSheet(
-                    "QListWidget { background: #f5f5f5; color: #000000; }"
-                    "QListWidget::item:selected { background: #4fa3f7; color: #ffffff; }"
-                )
-                lst.show()
-                lst.raise_()
-                lst.setMinimumWidth(220)
-            except Exception:
-                pass
-            try:
-                lst.repaint()
-                lst.update()
-                # Zum selektierten Step scrollen, nicht immer ans Ende.
-                sel_item = lst.item(lst.currentRow())
-                if sel_item:
-                    lst.scrollToItem(sel_item)
-                elif lst.count() > 0:
-                    lst.scrollToBottom()
-            except Exception:
-                pass
+        if getattr(self, "_verbose_widget_logs", False):
+            items = [lst.item(i).text() for i in range(lst.count())]
+            self._log(
+                f"[LatheEasyStep][debug] list '{lst.objectName()}' "
+                f"count={lst.count()} items={items} vis={lst.isVisible()} "
+                f"size={lst.size()}", level="debug")
+        try:
+            # update() statt repaint(): Qt fasst das Neuzeichnen zusammen.
+            lst.update()
+            # Zum selektierten Step scrollen, nicht immer ans Ende.
+            sel_item = lst.item(lst.currentRow())
+            if sel_item:
+                lst.scrollToItem(sel_item)
+            elif lst.count() > 0:
+                lst.scrollToBottom()
+        except Exception:
+            pass
 
         self._update_parting_contour_choices()
 
@@ -6213,6 +6401,12 @@ class HandlerClass:
         sync_form_to_operation(self, idx)
 
     def _update_selected_operation(self, *, force: bool = False):
+        """Formular in die gewählte Operation übernehmen und Vorschau nachziehen.
+
+        Das Modell wird sofort aktualisiert. Bei edit-getriebenen Aufrufen
+        (ohne force) wird die Vorschau nur vorgemerkt, damit ein Burst aus
+        Spinbox-Schritten einen einzigen Neuaufbau auslöst.
+        """
         if self.list_ops is None:
             return
         if not force and not self._op_row_user_selected:
@@ -6222,7 +6416,10 @@ class HandlerClass:
             return
         op = self.model.operations[idx]
         self._sync_form_to_operation(idx)
-        self._refresh_preview()
+        if force:
+            self._refresh_preview()
+        else:
+            self._request_preview_refresh()
         if op.op_type == OpType.CONTOUR:
             self._update_parting_contour_choices()
 
@@ -6260,14 +6457,16 @@ class HandlerClass:
                         if self.list_ops:
                             item = self.list_ops.item(i)
                             if item:
-                                item.setText(self._describe_operation(existing, i + 1))
+                                text = self._describe_operation(existing, i + 1)
+                                if item.text() != text:
+                                    item.setText(text)
                             self.list_ops.setCurrentRow(i)
                         self._refresh_preview()
                         return
                 # noch kein Programmkopf: vorne einfügen
                 op = Operation(op_type, params)
                 self.model.update_geometry(op)
-                self.model.operations.insert(0, op)
+                self.model.insert_operation(0, op)
                 self._refresh_operation_list(select_index=0)
                 self._refresh_preview()
             else:
@@ -6297,11 +6496,9 @@ class HandlerClass:
                     self._log("[LatheEasyStep] add operation cancelled: no step file selected", level="info")
                     return
                 self.model.add_operation(op)
-                try:
+                if self._debug_enabled():
                     debug_ops = [f"{i}:{o.op_type}" for i, o in enumerate(self.model.operations)]
                     self._log(f"[LatheEasyStep][debug] operations now: {debug_ops}", level="debug")
-                except Exception:
-                    pass
 
                 self._refresh_operation_list(select_index=len(self.model.operations) - 1)
                 self._refresh_preview()
@@ -6564,65 +6761,41 @@ class HandlerClass:
     def _build_program_filepath(self, name_raw: str | None) -> str:
         return build_program_filepath(self, name_raw)
 
-    def _handle_param_change(self):
-        """Generic handler for parameter widgets (spinboxes, combos, checkboxes, lineedits)."""
-        try:
-            w = self.sender()
-        except Exception:
-            return
-        if w is None:
-            return
-
-        # Determine current operation
-        idx = -1
-        try:
-            if self.list_ops is not None:
-                idx = int(self.list_ops.currentRow())
-        except Exception:
-            idx = -1
-
-        if idx < 0 or idx >= len(self.model.operations):
-            return
-
-        op = self.model.operations[idx]
-        if op.params is None:
-            op.params = {}
+    def _handle_param_change(self, *_args):
+        """Generic handler for parameter widgets (spinboxes, combos, checkboxes, lineedits).
 
-        name = getattr(w, "objectName", lambda: "")()
-        if not name:
-            return
-
-        # Read widget value
-        val = None
-        try:
-            # QComboBox
-            if hasattr(w, "currentText") and hasattr(w, "currentIndex"):
-                # Prefer itemData if present (but fall back to text)
-                try:
-                    data = w.itemData(w.currentIndex())
-                    val = data if data is not None else w.currentText()
-                except Exception:
-                    val = w.currentText()
-            # QCheckBox
-            elif hasattr(w, "isChecked"):
-                val = bool(w.isChecked())
-            # Spin boxes
-            elif hasattr(w, "value"):
-                val = float(w.value())
-            # Line edit
-            elif hasattr(w, "text"):
-                val = str(w.text())
-        except Exception:
+        Eine Eingabe feuert oft mehrere Signale (valueChanged + editingFinished,
+        Combo-Index + Text), Tippen zudem eines pro Taste; gesynct wird erst,
+        wenn _PARAM_DEBOUNCE_MS lang keine weitere Änderung kam.
+        """
+        if getattr(self, "_ui_loading", False):
             return
-
+        timer = getattr(self, "_param_change_timer", None)
+        if timer is None:
+            timer = QtCore.QTimer()
+            timer.setSingleShot(True)
+            timer.setInterval(_PARAM_DEBOUNCE_MS)
+            timer.timeout.connect(self._flush_param_change)
+            self._param_change_timer = timer
+        self._param_change_pending = True
+        timer.start()
+
+    def _cancel_param_change(self):
+        """Ausstehenden Sync verwerfen (der Aufrufer hat das Formular bereits übernommen)."""
+        self._param_change_pending = False
+        timer = getattr(self, "_param_change_timer", None)
+        if timer is not None:
+            timer.stop()
+
+    def _flush_param_change(self):
+        self._param_change_pending = False
         # Do NOT write widget.objectName() directly into op.params.
         # The authoritative mapping is built by _collect_params(op_type),
         # so we rebuild the selected operation from the UI and refresh geometry/preview.
         try:
-            self._update_selected_operation(force=True)
-        except Exception:
-            pass
-        return
+            self._update_selected_operation()
+        except Exception as exc:
+            self._log(f"[LatheEasyStep] param sync failed: {exc}", level="warning")
 
 
     def _handle_selection_change(self, row: int):
@@ -6632,6 +6805,15 @@ class HandlerClass:
     def _handle_global_change(self, *args, **kwargs):
         handle_global_change(self, *args, **kwargs)
 
+    def _on_unit_changed(self, *args):
+        on_unit_changed(self, *args)
+
+    def _request_global_change(self, *args, **kwargs):
+        request_global_change(self, *args, **kwargs)
+
+    def _flush_global_change(self):
+        flush_global_change(self)
+
     def _apply_machine_profile_preset(self) -> None:
         self.MACHINE_CHUCK_PROFILE_PRESETS = MACHINE_CHUCK_PROFILE_PRESETS
         apply_machine_profile_preset(self)
@@ -6663,10 +6845,23 @@ class HandlerClass:
     def _update_drill_visibility(self):
         update_drill_visibility(self)
 
+    def _request_visibility_update(self, *kinds: str):
+        request_visibility_update(self, *kinds)
+
+    def _flush_visibility_updates(self):
+        flush_visibility_updates(self)
+
+    def _request_face_update(self, *args, **kwargs):
+        request_visibility_update(self, "face")
+
+    def _request_subspindle_update(self, *args, **kwargs):
+        request_visibility_update(self, "subspindle")
+
+    def _request_drill_update(self, *args, **kwargs):
+        request_visibility_update(self, "drill")
+
     def _describe_operation(self, op, number=None):
         return describe_operation(self, op, number)
-    def _renumber_operations(self):
-        renumber_operations(self)
 
     # ---- QtVCP user command hook (leer) -------------------------------
     def call_user_command_(self, command_file: str | None):
@@ -0,0 +1,27 @@
+"""Gemeinsame Fixtures der Tests."""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from lathe_easystep_handler import HandlerClass
+
+
+@pytest.fixture
+def bare_handler(monkeypatch):
+    """Fabrik für HandlerClass-Instanzen ohne __init__ (keine QtVCP-Widgets).
+
+    Der Stub gilt nur für die Dauer des Tests; Attribute, die __init__ sonst
+    anlegt, setzen die Tests selbst.
+    """
+    monkeypatch.setattr(HandlerClass, "__init__", lambda self, halcomp, widgets, paths: None)
+    return lambda: HandlerClass(None, None, None)
+
+
+@pytest.fixture
+def qapp():
+    """QApplication für Tests mit echten Widgets; lebt nur während des Tests."""
+    from qtpy import QtWidgets
+
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
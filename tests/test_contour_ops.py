@@ -0,0 +1,389 @@
+"""Tests for the cached contour-operation subset used by the parting tab."""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from lathe_easystep.model import Operation, OpType, ProgramModel
+
+
+@pytest.fixture
+def handler(bare_handler):
+    h = bare_handler()
+    h.model = ProgramModel()
+    h.contour_name = None
+    h.contour_segments = None
+    h.list_ops = None
+    h.root_widget = None
+    h._find_root_widget = lambda: None
+    h._update_parting_contour_choices = lambda: None
+    return h
+
+
+def test_contour_subset_follows_model_changes(handler):
+    first = Operation(OpType.CONTOUR, {"name": "Aussen"})
+    handler.model.add_operation(Operation(OpType.FACE, {}))
+    handler.model.add_operation(first)
+    assert handler._available_contour_names() == ["Aussen"]
+    assert handler._contour_count() == 1
+
+    second = Operation(OpType.CONTOUR, {"name": ""})
+    handler.model.add_operation(second)
+    assert handler._available_contour_names() == ["Aussen", "Kontur 2"]
+    assert handler._contour_sequence_index(second) == 1
+
+    # Verschieben ändert die Länge nicht -> Cache wird über den Refresh verworfen.
+    handler.model.move_up(2)
+    handler._refresh_operation_list()
+    assert handler._contour_sequence_index(second) == 0
+
+    first.params["name"] = "Innen"
+    assert "Innen" in handler._available_contour_names()
+
+
+def test_iter_contour_ops_snapshot_feeds_helpers(handler):
+    handler.model.add_operation(Operation(OpType.FACE, {}))
+    contour = Operation(OpType.CONTOUR, {"name": "Aussen"}, path=[(10.0, 0.0), (10.0, -5.0)])
+    handler.model.add_operation(contour)
+
+    contours = handler._iter_contour_ops()
+    assert contours == [(1, contour, "Aussen")]
+    assert handler._available_contour_names(contours) == ["Aussen"]
+    assert handler._resolve_contour_path("Aussen", contours) == [(10.0, 0.0), (10.0, -5.0)]
+    assert handler._resolve_contour_path("Innen", contours) == []
+
+
+def test_live_contour_path_is_memoized_per_input(monkeypatch, handler):
+    from lathe_easystep import ui_contour
+
+    class _Text:
+        def __init__(self, text):
+            self._text = text
+
+        def text(self):
+            return self._text
+
+    class _Value:
+        def __init__(self, value):
+            self._value = value
+
+        def value(self):
+            return self._value
+
+    builds = []
+
+    def _build(params):
+        builds.append(params)
+        return [(params["start_x"], params["start_z"])]
+
+    monkeypatch.setattr(ui_contour, "build_contour_path", _build)
+    handler.contour_name = _Text("Live")
+    handler.contour_segments = object()
+    handler.contour_start_x = _Value(20.0)
+    handler.contour_start_z = _Value(0.0)
+    handler.contour_coord_mode = None
+    segments = [{"mode": "xz", "x": 20.0, "z": -10.0}]
+    handler._collect_contour_segments = lambda: [dict(seg) for seg in segments]
+
+    assert handler._resolve_contour_path("Live") == [(20.0, 0.0)]
+    assert handler._resolve_contour_path("Live") == [(20.0, 0.0)]
+    assert len(builds) == 1
+
+    segments[0]["z"] = -12.0
+    handler._resolve_contour_path("Live")
+    assert len(builds) == 2
+
+
+def test_parting_combo_is_only_rebuilt_when_names_change(handler, qapp):
+    from qtpy import QtWidgets
+
+    del handler._update_parting_contour_choices
+    handler._update_parting_ready_state = lambda *a: None
+    handler.parting_contour = QtWidgets.QComboBox()
+    handler.parting_contour.setEditable(True)
+    clears = []
+    handler.parting_contour.clear = lambda orig=handler.parting_contour.clear: (clears.append(1), orig())
+    handler.model.add_operation(Operation(OpType.CONTOUR, {"name": "Aussen"}))
+
+    handler._update_parting_contour_choices()
+    handler._update_parting_contour_choices()
+    assert [handler.parting_contour.itemText(i) for i in range(handler.parting_contour.count())] == ["Aussen"]
+    assert len(clears) == 1
+
+    handler.model.add_operation(Operation(OpType.CONTOUR, {"name": "Innen"}))
+    handler._update_parting_contour_choices()
+    assert handler.parting_contour.count() == 2
+    assert handler.parting_contour.currentText() == "Aussen"
+
+
+def test_parting_contour_combo_is_bound_on_first_lookup(handler):
+    from lathe_easystep.ui_contour import parting_contour_combo
+
+    class _Combo:
+        def currentText(self):
+            return " Aussen "
+
+    handler.parting_contour = None
+    combo = _Combo()
+    lookups = []
+    handler._get_widget_by_name = lambda name: lookups.append(name) or combo
+
+    assert handler._current_parting_contour_name() == "Aussen"
+    assert parting_contour_combo(handler) is combo
+    assert lookups == ["parting_contour"]
+
+
+def test_sequence_index_follows_model_revision(handler):
+    a = Operation(OpType.CONTOUR, {"name": "A"})
+    b = Operation(OpType.CONTOUR, {"name": "B"})
+    handler.model.add_operation(a)
+    handler.model.add_operation(Operation(OpType.FACE, {}))
+    handler.model.add_operation(b)
+    assert handler._contour_sequence_index(b) == 1
+    assert handler._contour_sequence_index(Operation(OpType.FACE, {})) is None
+
+    # gleiche Länge, aber neue Revision -> ohne _refresh_operation_list neu aufgebaut
+    rev = handler.model.revision
+    handler.model.move_up(2)
+    handler.model.move_up(1)
+    assert handler.model.revision == rev + 2
+    assert handler._contour_sequence_index(b) == 0
+    assert handler._contour_count() == 2
+
+    handler.model.clear_operations()
+    assert handler._contour_count() == 0
+
+
+class _Preview:
+    def __init__(self):
+        self.drawn = []
+
+    def set_paths(self, paths, active_index=None):
+        self.drawn.append((paths, active_index))
+
+    def set_front_context(self, *_args):
+        pass
+
+
+def test_refresh_preview_skips_unchanged_state(handler):
+    handler.preview = _Preview()
+    handler.contour_preview = _Preview()
+    handler.preview_slice = None
+    header = {"xa": 40.0}
+    handler._collect_program_header = lambda: dict(header)
+    handler._log = lambda *a, **kw: None
+    op = Operation(OpType.FACE, {}, path=[{"type": "line", "p1": (0.0, 0.0), "p2": (10.0, 0.0)}])
+    handler.model.add_operation(op)
+
+    handler._refresh_preview()
+    handler._refresh_preview()
+    assert len(handler.preview.drawn) == 1
+
+    header["xa"] = 50.0
+    handler._refresh_preview()
+    assert len(handler.preview.drawn) == 2
+
+    # direkter Aufruf (Kontur-Tab) -> nächster Refresh zeichnet wieder
+    handler._set_preview_paths([])
+    handler._refresh_preview()
+    assert len(handler.preview.drawn) == 4
+
+    op.path = [{"type": "line", "p1": (0.0, 0.0), "p2": (12.0, 0.0)}]
+    handler._refresh_preview()
+    assert len(handler.preview.drawn) == 5
+
+
+def test_collect_contour_segments_reads_table_rows(handler, qapp):
+    from qtpy import QtWidgets
+
+    table = QtWidgets.QTableWidget(2, 6)
+    for col, text in enumerate(["Z", "", "-12,5", "Radius", "1.5", "Innen"]):
+        table.setItem(0, col, QtWidgets.QTableWidgetItem(text))
+    edge_combo = QtWidgets.QComboBox()
+    edge_combo.addItems(["Keine", "Fase"])
+    edge_combo.setCurrentIndex(1)
+    table.setCellWidget(1, 3, edge_combo)
+    table.setItem(1, 1, QtWidgets.QTableWidgetItem("abc"))
+    handler.contour_segments = table
+
+    first, second = handler._collect_contour_segments()
+    assert first == {
+        "mode": "z", "x": 0.0, "z": -12.5, "x_empty": True, "z_empty": False,
+        "edge": "radius", "edge_size": 1.5, "arc_side": "inner", "arc_side_raw": "innen",
+    }
+    assert second["mode"] == "xz"
+    assert second["edge"] == "chamfer"
+    assert second["x"] == 0.0 and second["x_empty"] is False
+    assert second["z_empty"] is True and second["arc_side"] == "auto"
+
+
+def test_cell_float_accepts_comma_and_tolerates_garbage():
+    from lathe_easystep_handler import _cell_float
+
+    assert _cell_float("-12,5") == -12.5
+    assert _cell_float("3.25") == 3.25
+    assert _cell_float("") == 0.0
+    assert _cell_float("1,2,3") == 0.0
+
+
+def test_hidden_preview_refresh_is_deferred_until_shown(handler, qapp):
+    from lathe_easystep_handler import LathePreviewWidget
+
+    handler.preview = LathePreviewWidget()
+    handler.contour_preview = None
+    handler.preview_slice = None
+    handler._collect_program_header = lambda: {}
+    handler._log = lambda *a, **kw: None
+    handler._ensure_preview_widgets = lambda: None
+    drawn = []
+    handler._set_preview_paths = lambda paths, *a, **kw: drawn.append(paths)
+
+    handler._refresh_preview()
+    handler._refresh_preview()
+    assert drawn == []
+    assert handler._preview_dirty is True
+
+    handler.preview.show()
+    assert len(drawn) == 1
+    assert handler._preview_dirty is False
+
+    handler.preview.hide()
+    handler.preview.show()
+    assert len(drawn) == 1
+
+
+class _Toggle:
+    def __init__(self):
+        self.calls = []
+
+    def setVisible(self, visible):
+        self.calls.append(visible)
+
+
+class _ModeCombo:
+    def __init__(self, idx):
+        self.idx = idx
+
+    def currentIndex(self):
+        return self.idx
+
+
+def test_parting_mode_visibility_only_toggles_on_change(handler):
+    for name in ("label_parting_depth", "parting_depth_per_pass", "label_parting_pause",
+                 "parting_pause_enabled", "label_parting_pause_distance", "parting_pause_distance",
+                 "label_parting_slice_strategy", "parting_slice_strategy", "parting_allow_undercut"):
+        setattr(handler, name, None)
+    handler.parting_mode = _ModeCombo(0)
+    handler.parting_depth_per_pass = _Toggle()
+    handler.parting_slice_step = _Toggle()
+
+    handler._update_parting_mode_visibility()
+    handler._update_parting_mode_visibility()
+    assert handler.parting_depth_per_pass.calls == [True]
+    assert handler.parting_slice_step.calls == [False]
+
+    handler.parting_mode.idx = 1
+    handler._update_parting_mode_visibility()
+    assert handler.parting_depth_per_pass.calls == [True, False]
+
+    handler.parting_pause_enabled = _Toggle()
+    handler._update_parting_mode_visibility()
+    assert handler.parting_pause_enabled.calls == [False]
+
+
+def test_contour_table_load_reuses_rows(handler, qapp):
+    from qtpy import QtWidgets
+    from lathe_easystep.ui_operations import _load_contour_operation_to_form
+
+    table = QtWidgets.QTableWidget(0, 6)
+    handler.contour_segments = table
+    for name in ("_ensure_contour_widgets", "_init_contour_table", "_sync_contour_edge_controls",
+                 "_update_contour_preview_temp", "_update_parting_ready_state"):
+        setattr(handler, name, lambda: None)
+    changes = []
+    handler._handle_contour_table_change = lambda *a: changes.append(a)
+    segs = [
+        {"mode": "x", "x": 20.0, "z": 0.0, "edge": "radius", "edge_size": 1.0},
+        {"mode": "z", "x": 0.0, "z": -5.0, "z_empty": False, "x_empty": True, "edge": "none"},
+    ]
+
+    _load_contour_operation_to_form(handler, Operation(OpType.CONTOUR, {"name": "A", "segments": segs}))
+    first_item, first_combo = table.item(0, 1), table.cellWidget(0, 3)
+    assert table.rowCount() == 2
+    assert [table.item(1, c).text() for c in (0, 1, 2)] == ["Z", "", "-5.000"]
+    assert first_combo.currentText() == "Radius" and table.cellWidget(0, 5).isEnabled()
+
+    _load_contour_operation_to_form(handler, Operation(OpType.CONTOUR, {"name": "B", "segments": [dict(segs[1])]}))
+    assert table.rowCount() == 1
+    assert table.item(0, 1) is first_item and table.item(0, 1).text() == ""
+    assert table.cellWidget(0, 3) is first_combo and first_combo.currentText() == "Keine"
+    assert not table.cellWidget(0, 5).isEnabled()
+    assert changes == []
+
+
+def test_contour_name_available_matches_name_list(handler):
+    from lathe_easystep.ui_contour import contour_name_available
+
+    handler.model.add_operation(Operation(OpType.CONTOUR, {"name": "Aussen"}))
+    handler.model.add_operation(Operation(OpType.CONTOUR, {"name": ""}))
+
+    for name in ("Aussen", "Kontur 2", "Innen", ""):
+        assert contour_name_available(handler, name) == (bool(name) and name in handler._available_contour_names())
+
+
+def test_contour_move_swaps_rows_in_place(handler, qapp):
+    from qtpy import QtWidgets
+    from lathe_easystep.ui_contour import handle_contour_move_down, handle_contour_move_up
+
+    table = QtWidgets.QTableWidget(2, 6)
+    combos = []
+    for row, (x_text, edge_idx) in enumerate((("10.000", 0), ("20.000", 2))):
+        table.setItem(row, 1, QtWidgets.QTableWidgetItem(x_text))
+        combo = QtWidgets.QComboBox()
+        combo.addItems(["Keine", "Fase", "Radius"])
+        combo.setCurrentIndex(edge_idx)
+        table.setCellWidget(row, 3, combo)
+        combos.append(combo)
+    handler.contour_segments = table
+    calls = []
+    for name in ("_update_selected_operation", "_update_contour_preview_temp", "_sync_contour_edge_controls"):
+        setattr(handler, name, lambda name=name: calls.append(name))
+
+    table.setCurrentCell(1, 0)
+    table.itemChanged.connect(lambda *a: calls.append("itemChanged"))
+    table.currentCellChanged.connect(lambda *a: calls.append("currentCellChanged"))
+    handle_contour_move_up(handler)
+    assert calls == ["_update_selected_operation", "_update_contour_preview_temp", "_sync_contour_edge_controls"]
+    assert table.rowCount() == 2 and table.currentRow() == 0
+    assert [table.item(r, 1).text() for r in (0, 1)] == ["20.000", "10.000"]
+    assert [table.cellWidget(r, 3) for r in (0, 1)] == combos
+    assert [c.currentText() for c in combos] == ["Radius", "Keine"]
+
+    handle_contour_move_down(handler)
+    assert table.currentRow() == 1
+    assert [table.item(r, 1).text() for r in (0, 1)] == ["10.000", "20.000"]
+    assert [c.currentText() for c in combos] == ["Keine", "Radius"]
+
+
+def test_contour_add_segment_refreshes_once(handler, qapp):
+    from qtpy import QtWidgets
+
+    table = QtWidgets.QTableWidget(0, 6)
+    handler.contour_segments = table
+    handler.contour_start_x = handler.contour_start_z = None
+    handler._contour_edge_template_text = "Fase"
+    handler._contour_edge_template_size = 0.5
+    calls = []
+    for name in ("_ensure_contour_widgets", "_init_contour_table", "_update_selected_operation",
+                 "_update_contour_preview_temp", "_sync_contour_edge_controls"):
+        setattr(handler, name, lambda name=name: calls.append(name))
+    table.cellChanged.connect(lambda *a: calls.append("cellChanged"))
+
+    handler._handle_contour_add_segment()
+    handler._handle_contour_add_segment()
+    assert table.rowCount() == 2 and table.currentRow() == 1
+    assert [table.cellWidget(r, 3).currentText() for r in range(2)] == ["Fase"] * 2
+    assert table.item(1, 4).text() == "0.500"
+    assert calls.count("_update_selected_operation") == 2
+    assert "cellChanged" not in calls
@@ -0,0 +1,14 @@
+"""Tests für lathe_easystep.gcode_utils."""
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from lathe_easystep.gcode_utils import sanitize_comment_text, sanitize_gcode_text
+
+
+def test_sanitize_gcode_text_transliterates_umlauts():
+    plain = "G0 X10.000 Z2.000"
+    assert sanitize_gcode_text(plain) is plain
+    assert sanitize_gcode_text("Größe Übermaß") == "Groesse Uebermass"
+    assert sanitize_gcode_text("Ø 20") == "? 20"
+    assert sanitize_comment_text("Kühlung (aus)") == "Kuehlung aus"
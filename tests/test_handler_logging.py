@@ -0,0 +1,99 @@
+"""Tests for the debug gate in HandlerClass._log."""
+import logging
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+
+class _RecordingLogger:
+    def __init__(self, level=logging.INFO):
+        self.level = level
+        self.records = []
+
+    def isEnabledFor(self, level):
+        return level >= self.level
+
+    def debug(self, msg):
+        self.records.append(("debug", msg))
+
+    def info(self, msg):
+        self.records.append(("info", msg))
+
+
+class _Parts:
+    """Counts how often str() is taken, i.e. whether the message was formatted."""
+
+    def __init__(self):
+        self.formatted = 0
+
+    def __str__(self):
+        self.formatted += 1
+        return "payload"
+
+
+@pytest.fixture
+def handler(bare_handler):
+    h = bare_handler()
+    h.LOG = None
+    h._verbose_widget_logs = False
+    return h
+
+
+def test_debug_messages_are_dropped_without_formatting(handler):
+    log = _RecordingLogger(logging.INFO)
+    handler.LOG = log
+    part = _Parts()
+    handler._log("[LatheEasyStep][debug]", part, level="debug")
+    assert log.records == []
+    assert part.formatted == 0
+    assert handler._debug_enabled() is False
+
+
+def test_debug_messages_pass_when_logger_is_at_debug_level(handler):
+    log = _RecordingLogger(logging.DEBUG)
+    handler.LOG = log
+    handler._log("[LatheEasyStep][debug] hello", level="debug")
+    assert log.records == [("debug", "[LatheEasyStep][debug] hello")]
+
+
+def test_verbose_widget_logs_force_debug_output(handler):
+    log = _RecordingLogger(logging.INFO)
+    handler.LOG = log
+    handler._verbose_widget_logs = True
+    assert handler._debug_enabled() is True
+    handler._log("[LatheEasyStep][debug] verbose", level="debug")
+    assert log.records == [("debug", "[LatheEasyStep][debug] verbose")]
+
+
+def test_info_messages_are_not_affected_by_debug_gate(handler):
+    log = _RecordingLogger(logging.WARNING)
+    handler.LOG = log
+    handler._log("[LatheEasyStep] ready", level="info")
+    assert log.records == [("info", "[LatheEasyStep] ready")]
+
+
+def test_without_qtvcp_logger_disabled_levels_are_not_formatted(monkeypatch, capsys, handler):
+    import lathe_easystep_handler
+
+    module_log = _RecordingLogger(logging.WARNING)
+    monkeypatch.setattr(lathe_easystep_handler, "_LOGGER", module_log)
+    part = _Parts()
+    handler._log("[LatheEasyStep] status", part, level="info")
+    assert part.formatted == 0
+    assert module_log.records == []
+    assert capsys.readouterr().out == ""
+
+
+def test_verbose_widget_logs_print_without_qtvcp_logger(monkeypatch, capsys, handler):
+    import lathe_easystep_handler
+
+    module_log = _RecordingLogger(logging.WARNING)
+    monkeypatch.setattr(lathe_easystep_handler, "_LOGGER", module_log)
+    handler._verbose_widget_logs = True
+    assert handler._debug_enabled() is True
+    handler._log("[LatheEasyStep][debug] verbose", level="debug")
+    assert capsys.readouterr().out == "[LatheEasyStep][debug] verbose\n"
+    assert module_log.records == []
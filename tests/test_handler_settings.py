@@ -0,0 +1,16 @@
+"""Tests für die QSettings-Anbindung des Handlers."""
+from qtpy import QtCore
+
+
+def test_dialog_dirs_are_restored_from_settings(tmp_path, monkeypatch, bare_handler):
+    stored = {"LatheEasyStep/StepLastDir": str(tmp_path), "LatheEasyStep/LastDialogDir": ""}
+
+    class _Settings:
+        def value(self, key, default="", type=None):
+            return stored.get(key, default)
+
+    monkeypatch.setattr(QtCore, "QSettings", _Settings)
+    h = bare_handler()
+    h._restore_dialog_dirs()
+    assert h._step_last_dir == str(tmp_path)
+    assert h._last_dialog_dir is None
@@ -0,0 +1,31 @@
+"""Tests für lathe_easystep.model (ProgramModel)."""
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from lathe_easystep.model import Operation, OpType, ProgramModel
+
+
+def test_update_geometry_dispatches_by_builder_arity():
+    calls = []
+
+    def one_arg(params):
+        calls.append(("one", params["x"]))
+        return [(1.0, 0.0)]
+
+    def two_args(params, settings):
+        calls.append(("two", settings["emit_line_numbers"]))
+        return [(2.0, 0.0)]
+
+    model = ProgramModel(geometry_builders={OpType.FACE: one_arg, OpType.DRILL: two_args})
+    face = Operation(OpType.FACE, {"x": 5})
+    drill = Operation(OpType.DRILL, {})
+    for _ in range(2):
+        model.update_geometry(face)
+        model.update_geometry(drill)
+    assert face.path == [(1.0, 0.0)] and drill.path == [(2.0, 0.0)]
+    assert calls == [("one", 5), ("two", False)] * 2
+    assert model._builder_argc == {one_arg: 1, two_args: 2}
+    groove = Operation(OpType.GROOVE, {}, path=[(0.0, 0.0)])
+    model.update_geometry(groove)
+    assert groove.path == []
@@ -0,0 +1,15 @@
+"""Tests für lathe_easystep.persistence (Step-Daten <-> Operation)."""
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from lathe_easystep.model import OpType
+from lathe_easystep.persistence import step_data_to_operation
+
+
+def test_step_data_to_operation_copies_params():
+    data = {"op_type": OpType.FACE, "params": {"tool": 1}}
+    op = step_data_to_operation(data)
+    assert op.params == {"tool": 1}
+    assert op.params is not data["params"]
+    assert step_data_to_operation({"params": {1: "a"}}).params == {"1": "a"}
@@ -0,0 +1,37 @@
+"""Tests für den Zeichenweg von LathePreviewWidget."""
+import os
+import sys
+
+from qtpy import QtGui
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from lathe_easystep_handler import LathePreviewWidget
+
+
+def test_preview_view_bounds_are_cached_per_path_list(qapp):
+    preview = LathePreviewWidget()
+    preview.resize(300, 200)
+    preview.set_paths([[(40.0, 0.0), (40.0, -30.0)]])
+    sampled = []
+    preview.primitives_to_points = lambda prims: sampled.append(prims) or []
+    bounds = preview._view_bounds()
+    # X als Durchmesser: Radius 20 plus 5 % Rand
+    assert bounds[1] > 20.0 and bounds[2] < -30.0
+    preview.render(QtGui.QPixmap(300, 200))
+    assert preview._view_bounds() is bounds
+
+    preview.set_paths([[{"type": "line", "p1": (0.0, 0.0), "p2": (10.0, 0.0)}]])
+    preview._view_bounds()
+    preview._view_bounds()
+    assert len(sampled) == 1
+
+
+def test_preview_model_polygons_use_display_coordinates(qapp):
+    preview = LathePreviewWidget()
+    preview.set_paths([[(40.0, 0.0), (20.0, -30.0)]])
+    polygons = preview._model_polygons()
+    # (Z, Radius) je Punkt
+    assert [(pt.x(), pt.y()) for pt in polygons[0]] == [(0.0, 20.0), (-30.0, 10.0)]
+    assert preview._model_polygons() is polygons
+    preview.x_is_diameter = False
+    assert preview._model_polygons()[0][0].y() == 40.0
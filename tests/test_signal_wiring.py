@@ -0,0 +1,456 @@
+"""Tests for the connect-once helpers used during (repeated) panel startup."""
+import os
+import sys
+
+import pytest
+from weakref import WeakSet
+
+from qtpy import QtCore
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from lathe_easystep_handler import HandlerClass
+
+
+class _Signal:
+    """Records connects; refuses duplicates for Qt.UniqueConnection like PyQt."""
+
+    def __init__(self):
+        self.calls = []
+
+    def connect(self, fn, *args, **kwargs):
+        if QtCore.Qt.UniqueConnection in args and fn in self.calls:
+            raise TypeError("connection is not unique")
+        self.calls.append(fn)
+
+    def disconnect(self):
+        self.calls.clear()
+
+
+class _ComboBox:
+    def __init__(self):
+        self.currentIndexChanged = _Signal()
+
+
+@pytest.fixture
+def handler(bare_handler):
+    h = bare_handler()
+    h._connected_param_widgets = WeakSet()
+    h._connected_global_widgets = WeakSet()
+    h._log = lambda *a, **kw: None
+    return h
+
+
+def test_connect_combo_once_connects_each_instance_once(handler):
+    combo = _ComboBox()
+    slot = handler._request_face_update
+    assert handler._connect_combo_once(combo, slot) is True
+    assert handler._connect_combo_once(combo, slot) is False
+    assert len(combo.currentIndexChanged.calls) == 1
+
+    replacement = _ComboBox()
+    assert handler._connect_combo_once(replacement, slot) is True
+    assert len(replacement.currentIndexChanged.calls) == 1
+
+
+def test_mode_visibility_signals_survive_repeated_finalize_passes(handler):
+    handler.face_mode = _ComboBox()
+    handler.face_edge_type = _ComboBox()
+    handler.drill_mode = _ComboBox()
+    for _ in range(3):
+        handler._connect_mode_visibility_signals()
+    assert len(handler.face_mode.currentIndexChanged.calls) == 1
+    assert len(handler.face_edge_type.currentIndexChanged.calls) == 1
+    assert len(handler.drill_mode.currentIndexChanged.calls) == 1
+
+
+def test_unit_combo_is_signal_driven(handler):
+    handler.program_unit = _ComboBox()
+    handler.program_shape = None
+    handler.program_retract_mode = None
+    handler.program_has_subspindle = None
+    handler._connect_global_form_signals()
+    handler._connect_global_form_signals()
+    assert handler.program_unit.currentIndexChanged.calls == [handler._on_unit_changed]
+
+    calls = []
+    handler._apply_unit_suffix = lambda: calls.append("suffix")
+    handler._apply_chuck_safety_preset = lambda: calls.append("chuck")
+    handler._request_visibility_update = lambda *kinds: calls.append(kinds)
+    handler._on_unit_changed(1)
+    assert calls == ["suffix", "chuck", ("program", "retract", "subspindle", "face")]
+    assert not hasattr(handler, "_check_unit_change")
+
+
+class _ItemModel:
+    pass
+
+
+class _ItemCombo:
+    def __init__(self, items):
+        self._items = items
+
+    def model(self):
+        return _ItemModel()
+
+    def count(self):
+        return len(self._items)
+
+    def itemText(self, i):
+        return self._items[i]
+
+
+def test_combo_item_texts_falls_back_to_item_text():
+    assert HandlerClass._combo_item_texts(_ItemCombo(["a", "b"])) == ["a", "b"]
+
+
+def test_visibility_updates_are_coalesced_per_tick(monkeypatch, handler):
+    from lathe_easystep import ui_visibility
+
+    scheduled = []
+
+    class _Timer:
+        @staticmethod
+        def singleShot(_ms, fn):
+            scheduled.append(fn)
+
+    monkeypatch.setattr(ui_visibility.QtCore, "QTimer", _Timer)
+    calls = []
+    handler._update_face_visibility = lambda: calls.append("face")
+    handler._update_subspindle_visibility = lambda: calls.append("subspindle")
+    handler._update_program_visibility = lambda: calls.append("program")
+
+    handler._request_face_update(1)
+    handler._request_face_update(2)
+    handler._request_subspindle_update(True)
+    handler._request_visibility_update("program", "face")
+    assert len(scheduled) == 1
+
+    scheduled.pop()()
+    assert calls == ["program", "subspindle", "face"]
+
+    handler._request_face_update(0)
+    assert len(scheduled) == 1
+
+
+class _Button:
+    def __init__(self):
+        self.clicked = _Signal()
+
+
+def test_connect_button_once_relies_on_unique_connection(handler):
+    btn = _Button()
+    stale = object()
+    btn.clicked.calls.append(stale)
+    for _ in range(3):
+        handler._connect_button_once(btn, handler._handle_add_operation)
+    # stale wiring from an earlier init pass is dropped once, ours stays single
+    assert btn.clicked.calls == [handler._handle_add_operation]
+    assert not hasattr(handler, "_connected_flags")
+
+
+def test_handler_methods_carry_no_qt_slot_signature():
+    # HandlerClass is no QObject; PyQt5 refuses connect() to decorated methods.
+    decorated = [
+        name for name, member in vars(HandlerClass).items()
+        if hasattr(member, "__pyqtSignature__")
+    ]
+    assert decorated == []
+
+
+class _SpinBox:
+    def __init__(self):
+        self.valueChanged = _Signal()
+
+
+def test_param_signal_table_lists_each_widget_once(handler):
+    handler._widget_name_cache = {"placeholder": []}
+    shared = _SpinBox()
+    handler._get_widget_by_name = lambda name: shared if name == "face_finish_allow_x" else None
+
+    handler._connect_param_change_signals()
+    handler._connect_param_change_signals()
+
+    assert [w for w, _sig in handler._param_signal_table] == [shared]
+    assert handler._all_param_widgets == (shared,)
+    assert shared.valueChanged.calls == [handler._handle_param_change]
+    # nach dem Aufbau schreibgeschützt
+    try:
+        handler.param_widgets["face"] = {}
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("param_widgets should be read-only")
+
+
+def test_language_change_without_new_language_is_skipped(handler):
+    lang = ["en"]
+    handler._current_language_code = lambda: lang[0]
+    passes = []
+    handler._apply_combo_translations = lambda code: passes.append(code)
+    handler._get_widget_by_name = lambda name: None
+    for name in ("_handle_global_change", "_setup_thread_helpers"):
+        setattr(handler, name, lambda: None)
+    for name in ("_apply_tab_titles", "_apply_button_translations", "_apply_thread_tooltips",
+                 "_apply_parting_tooltips", "_apply_groove_tooltips"):
+        setattr(handler, name, lambda code: None)
+
+    handler._handle_language_change(1)
+    handler._handle_language_change(1)
+    assert passes == ["en"]
+
+    lang[0] = "de"
+    handler._handle_language_change(0)
+    assert handler._apply_language_texts(force=True) is True
+    assert passes == ["en", "de", "de"]
+
+
+def test_set_widget_text_skips_missing_setters():
+    from lathe_easystep_handler import _set_widget_text
+
+    class _Label:
+        def __init__(self):
+            self.tip = None
+
+        def setToolTip(self, text):
+            self.tip = text
+
+    label = _Label()
+    _set_widget_text(label, "Steigung", "setToolTip", "setWhatsThis")
+    assert label.tip == "Steigung"
+    _set_widget_text(label, None, "setToolTip")
+    assert label.tip == "Steigung"
+
+
+def test_flattened_translations_skip_generic_labels_and_fall_back(handler):
+    from lathe_easystep_handler import (
+        _GENERIC_LABEL_RE,
+        _flatten_translations,
+        _TEXT_BY_LANG,
+    )
+
+    flat = _flatten_translations(
+        {"thread_pitch": {"de": "Steigung", "en": ""}, "label_7": {"de": "X", "en": "X"}},
+        fallback="de",
+        skip=_GENERIC_LABEL_RE,
+    )
+    assert flat["en"] == (("thread_pitch", "Steigung"),)
+    assert not any(_GENERIC_LABEL_RE.match(name) for name, _text in _TEXT_BY_LANG["de"])
+
+    class _Label:
+        def __init__(self):
+            self.tip = None
+
+        def setToolTip(self, text):
+            self.tip = text
+
+    widgets = {"thread_pitch": _Label()}
+    handler._get_widget_by_name = widgets.get
+    handler._apply_flat_translations(flat, "en", "setToolTip")
+    assert widgets["thread_pitch"].tip == "Steigung"
+
+
+class _DataCombo:
+    def __init__(self, count):
+        self._count = count
+        self.set_calls = 0
+
+    def count(self):
+        return self._count
+
+    def setItemData(self, *_args):
+        self.set_calls += 1
+
+
+def test_parting_slice_item_data_is_set_once_per_combo(handler):
+    handler.parting_slice_strategy = _DataCombo(2)
+    handler._setup_parting_slice_strategy_items()
+    handler._setup_parting_slice_strategy_items()
+    assert handler.parting_slice_strategy.set_calls == 2
+
+    handler.parting_slice_strategy = _DataCombo(2)
+    handler._setup_parting_slice_strategy_items()
+    assert handler.parting_slice_strategy.set_calls == 2
+
+
+def test_combo_translations_skip_combos_already_in_language(handler, qapp):
+    from qtpy import QtWidgets
+
+    combo = QtWidgets.QComboBox()
+    combo.addItems(["Deutsch", "English"])
+    handler._get_widget_by_name = lambda name: combo if name == "program_language" else None
+    handler._setup_parting_slice_strategy_items = lambda: None
+    cleared = []
+    combo.clear = lambda orig=combo.clear: (cleared.append(1), orig())
+
+    handler._apply_combo_translations("en")
+    handler._apply_combo_translations("en")
+    assert [combo.itemText(i) for i in range(combo.count())] == ["German", "English"]
+    assert len(cleared) == 1
+
+    handler._apply_combo_translations("de")
+    assert combo.itemText(0) == "Deutsch"
+
+
+def test_tab_titles_fall_back_to_text_index(handler, qapp):
+    from qtpy import QtWidgets
+    from lathe_easystep_handler import TAB_ORDER
+
+    tabs = QtWidgets.QTabWidget()
+    for _name in TAB_ORDER:
+        tabs.addTab(QtWidgets.QWidget(), "?")
+    # beyond TAB_ORDER only the current tab text identifies the page
+    tabs.addTab(QtWidgets.QWidget(), "Kontur")
+    tabs.addTab(QtWidgets.QWidget(), "Unbekannt")
+    handler._find_panel_tab_widget = lambda: tabs
+    handler._apply_tab_titles("en")
+    assert tabs.tabText(0) == "Program"
+    assert tabs.tabText(len(TAB_ORDER)) == "Contour"
+    assert tabs.tabText(len(TAB_ORDER) + 1) == "Unbekannt"
+
+
+def test_param_changes_are_debounced(monkeypatch, handler):
+    import lathe_easystep_handler
+
+    timers = []
+
+    class _Signal:
+        def __init__(self):
+            self.slots = []
+
+        def connect(self, fn):
+            self.slots.append(fn)
+
+    class _Timer:
+        def __init__(self):
+            self.timeout = _Signal()
+            self.starts = 0
+            self.interval = None
+            timers.append(self)
+
+        def setSingleShot(self, _flag):
+            pass
+
+        def setInterval(self, ms):
+            self.interval = ms
+
+        def start(self):
+            self.starts += 1
+
+        def stop(self):
+            pass
+
+    monkeypatch.setattr(lathe_easystep_handler.QtCore, "QTimer", _Timer)
+    syncs = []
+    handler._update_selected_operation = lambda **kw: syncs.append(kw)
+
+    handler._handle_param_change(1.5)
+    handler._handle_param_change()
+    handler._handle_param_change("text")
+    assert len(timers) == 1
+    timer = timers[0]
+    assert timer.starts == 3
+    assert timer.interval == lathe_easystep_handler._PARAM_DEBOUNCE_MS
+    assert syncs == []
+    timer.timeout.slots[0]()
+    assert syncs == [{}]
+
+    handler._ui_loading = True
+    handler._handle_param_change(2.0)
+    assert timer.starts == 3
+
+
+def test_edit_driven_preview_refreshes_are_debounced(monkeypatch, handler):
+    import lathe_easystep_handler
+    from lathe_easystep.model import Operation, OpType, ProgramModel
+
+    scheduled = []
+
+    class _Timer:
+        @staticmethod
+        def singleShot(_ms, fn):
+            scheduled.append(fn)
+
+    class _List:
+        def currentRow(self):
+            return 0
+
+    monkeypatch.setattr(lathe_easystep_handler.QtCore, "QTimer", _Timer)
+    handler.model = ProgramModel()
+    handler.model.add_operation(Operation(OpType.FACE, {}))
+    handler.list_ops = _List()
+    handler._op_row_user_selected = True
+    handler._preview_refresh_scheduled = False
+    synced = []
+    refreshes = []
+    handler._sync_form_to_operation = synced.append
+    handler._refresh_preview = lambda: refreshes.append(True)
+
+    handler._update_selected_operation()
+    handler._update_selected_operation()
+    assert synced == [0, 0]
+    assert refreshes == []
+    assert len(scheduled) == 1
+    scheduled.pop()()
+    assert refreshes == [True]
+
+    handler._update_selected_operation(force=True)
+    assert refreshes == [True, True]
+    assert scheduled == []
+
+
+def test_param_signal_table_is_reused_until_widgets_change(handler):
+    handler._widget_name_cache = {"placeholder": []}
+    widgets = {"face_feed": _SpinBox(), "face_tool": _SpinBox()}
+    handler._get_widget_by_name = lambda name: widgets.get(name)
+
+    handler._connect_param_change_signals()
+    table = handler._param_signal_table
+    handler._connect_param_change_signals()
+    assert handler._param_signal_table is table
+
+    replacement = widgets["face_tool"] = _SpinBox()
+    handler._connect_param_change_signals()
+    assert handler._param_signal_table is not table
+    assert replacement.valueChanged.calls == [handler._handle_param_change]
+    assert widgets["face_feed"].valueChanged.calls == [handler._handle_param_change]
+
+
+def test_global_form_signals_are_table_driven(handler):
+    handler.program_unit = _ComboBox()
+    handler.program_shape = _ComboBox()
+    handler.program_retract_mode = None
+    handler.program_has_subspindle = None
+    handler.program_chuck_x_min = _SpinBox()
+    for _ in range(2):
+        handler._connect_global_form_signals()
+    assert handler.program_shape.currentIndexChanged.calls == [handler._request_global_change]
+    assert handler.program_chuck_x_min.valueChanged.calls == [handler._handle_global_change]
+
+
+def test_collect_params_uses_prebuilt_readers(handler, qapp):
+    from qtpy import QtWidgets
+
+    handler._widget_name_cache = {"placeholder": []}
+    feed = QtWidgets.QDoubleSpinBox()
+    feed.setValue(0.25)
+    strategy = QtWidgets.QComboBox()
+    strategy.addItems(["Parallel X", "Parallel Z"])
+    strategy.setItemData(1, 2)
+    strategy.setCurrentIndex(1)
+    undercut = QtWidgets.QCheckBox()
+    undercut.setChecked(True)
+    widgets = {
+        "face_feed": feed,
+        "parting_slice_strategy": strategy,
+        "parting_allow_undercut": undercut,
+    }
+    handler._get_widget_by_name = lambda name: widgets.get(name)
+
+    assert handler._collect_params("face")["feed"] == 0.25
+    params = handler._collect_params("abspanen")
+    assert params["slice_strategy"] == 2
+    assert params["allow_undercut"] == 1.0
+
+    collectors = handler._param_collectors
+    handler._collect_params("face")
+    assert handler._param_collectors is collectors
@@ -103,6 +103,11 @@ class _ListWidget:
         self._current_row = -1
     def addItem(self, text):
         self._items.append(_ListItem(text))
+    def addItems(self, texts):
+        for text in texts:
+            self.addItem(text)
+    def setUpdatesEnabled(self, _):
+        pass
     def count(self):
         return len(self._items)
     def currentRow(self):
@@ -125,6 +130,12 @@ class _ListWidget:
     def clear(self):
         self._items.clear()
         self._current_row = -1
+    def takeItem(self, i):
+        if 0 <= i < len(self._items):
+            if self._current_row >= len(self._items) - 1:
+                self._current_row = len(self._items) - 2
+            return self._items.pop(i)
+        return None
     def objectName(self):
         return "listOperations"
     def scrollToItem(self, item):
@@ -618,6 +629,32 @@ def test_delete_no_selection_does_nothing():
     assert len(h.model.operations) == 1
 
 
+def test_refresh_operation_list_reuses_items():
+    """Refresh only rewrites changed rows and trims/extends the tail."""
+    h = _make_handler()
+    for op_type in (OpType.PROGRAM_HEADER, OpType.FACE, OpType.DRILL):
+        h.model.add_operation(Operation(op_type, {}, []))
+    h._refresh_operation_list(select_index=1)
+    first, second = h.list_ops.item(0), h.list_ops.item(1)
+
+    h.model.remove_operation(2)
+    h._refresh_operation_list()
+    assert h.list_ops.count() == 2
+    assert h.list_ops.item(0) is first and h.list_ops.item(1) is second
+    assert h.list_ops.currentRow() == 1
+
+    h.model.add_operation(Operation(OpType.THREAD, {}, []))
+    h._refresh_operation_list(select_index=2)
+    assert [h.list_ops.item(i).text() for i in range(3)] == [
+        f"{i + 1}: {op.op_type}" for i, op in enumerate(h.model.operations)
+    ]
+    assert h.list_ops.item(0) is first
+
+    h.model.clear_operations()
+    h._refresh_operation_list(select_index=-1)
+    assert h.list_ops.count() == 0
+
+
 # ---------------------------------------------------------------------------
 # _ui_loading leak fix
 # ---------------------------------------------------------------------------
@@ -0,0 +1,77 @@
+"""Tests für lathe_easystep.storage (Step-Dateien, atomares Schreiben)."""
+import json
+import math
+import os
+import stat
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from lathe_easystep import storage
+from lathe_easystep.model import Operation, OpType
+from lathe_easystep.persistence import operation_to_step_data, step_data_to_operation
+
+
+def test_step_file_roundtrip_with_and_without_orjson(tmp_path, monkeypatch):
+    """write_step_file/read_step_file work with orjson and the json fallback."""
+    op = Operation(OpType.FACE, {"tool": 1, "feed": 0.15}, path=[(50.0, 2.0), (0.0, 0.0)])
+    data = operation_to_step_data(op)
+    for module in (storage.orjson, None):
+        monkeypatch.setattr(storage, "orjson", module)
+        fpath = str(tmp_path / "face.step.json")
+        storage.write_step_file(fpath, data)
+        with open(fpath, encoding="utf-8") as f:
+            assert json.load(f) == data
+        loaded = step_data_to_operation(storage.read_step_file(fpath))
+        assert loaded.params == op.params
+        assert loaded.path == op.path
+
+
+def test_step_file_keeps_non_finite_floats(tmp_path, monkeypatch):
+    """NaN/Infinity survive write_step_file and load with or without orjson."""
+    data = {"params": {"depth": float("nan"), "limit": float("inf")}, "path": [[1.0, 2.0]]}
+    fpath = str(tmp_path / "nan.step.json")
+    storage.write_step_file(fpath, data)
+    with open(fpath, encoding="utf-8") as f:
+        text = f.read()
+    assert "NaN" in text and "Infinity" in text
+    for module in (storage.orjson, None):
+        monkeypatch.setattr(storage, "orjson", module)
+        loaded = storage.read_step_file(fpath)
+        assert math.isnan(loaded["params"]["depth"])
+        assert loaded["params"]["limit"] == float("inf")
+        assert loaded["path"] == [[1.0, 2.0]]
+
+
+def test_atomic_open_keeps_previous_file_on_error(tmp_path):
+    target = tmp_path / "prog.ngc"
+    storage.write_gcode_lines(str(target), ["%", "M30", "%"])
+    assert target.read_text(encoding="utf-8") == "%\nM30\n%"
+    try:
+        with storage.atomic_open(str(target), "w", encoding="utf-8") as handle:
+            handle.write("halb")
+            raise RuntimeError("abgebrochen")
+    except RuntimeError:
+        pass
+    assert target.read_text(encoding="utf-8") == "%\nM30\n%"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["prog.ngc"]
+
+
+def test_atomic_open_uses_unique_temp_files(tmp_path):
+    target = tmp_path / "prog.ngc"
+    with storage.atomic_open(str(target), "w", encoding="utf-8") as first:
+        with storage.atomic_open(str(target), "w", encoding="utf-8") as second:
+            assert len([p for p in tmp_path.iterdir() if p.name.endswith(".tmp")]) == 2
+            first.write("erster")
+            second.write("zweiter")
+        assert target.read_text(encoding="utf-8") == "zweiter"
+    assert target.read_text(encoding="utf-8") == "erster"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["prog.ngc"]
+
+
+def test_atomic_open_keeps_mode_of_replaced_file(tmp_path):
+    target = tmp_path / "prog.ngc"
+    storage.write_gcode_lines(str(target), ["%"])
+    assert stat.S_IMODE(os.stat(target).st_mode) == 0o666 & ~storage._UMASK
+    os.chmod(target, 0o640)
+    storage.write_gcode_lines(str(target), ["%", "M30", "%"])
+    assert stat.S_IMODE(os.stat(target).st_mode) == 0o640
@@ -115,6 +115,12 @@ class TestInternalThreadGCode:
         lines = gcode_for_thread(op)
         assert any("Innen" in l for l in lines)
 
+    def test_orientation_out_of_range_is_clamped(self):
+        lines = gcode_for_thread(_make_thread_op(orientation=5))
+        assert "(Gewindetyp: Innen)" in lines
+        lines = gcode_for_thread(_make_thread_op(orientation=-2.0))
+        assert "(Gewindetyp: Aussen)" in lines
+
     def test_K_is_always_positive(self):
         """K (thread depth) is always positive for both internal and external.
         The direction is controlled by the sign of I, not K."""
@@ -0,0 +1,105 @@
+"""Tests for applying thread standard presets to the thread form."""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+
+class _Spin:
+    def __init__(self, val=0.0):
+        self._val = val
+
+    def value(self):
+        return self._val
+
+    def setValue(self, v):
+        self._val = v
+
+
+class _Combo:
+    def __init__(self, data):
+        self._data = data
+
+    def currentData(self):
+        return self._data
+
+
+_THREAD_FIELDS = (
+    "thread_major_diameter", "thread_pitch", "thread_depth", "thread_first_depth",
+    "thread_peak_offset", "thread_retract_r", "thread_infeed_q", "thread_spring_passes",
+    "thread_e", "thread_l",
+)
+
+
+@pytest.fixture
+def handler(bare_handler):
+    h = bare_handler()
+    h._log = lambda *a, **kw: None
+    h._verbose_widget_logs = False
+    h._thread_applying_standard = False
+    h.thread_standard = _Combo(None)
+    for name in _THREAD_FIELDS:
+        setattr(h, name, _Spin())
+    return h
+
+
+def test_soft_fill_only_sets_zero_fields(handler):
+    handler.thread_standard = _Combo({"major": 10.0, "pitch": 1.5, "profile": "metric"})
+    handler.thread_spring_passes.setValue(3)
+    handler._apply_thread_preset()
+    assert handler.thread_major_diameter.value() == 10.0
+    assert handler.thread_pitch.value() == 1.5
+    assert abs(handler.thread_depth.value() - 1.5 * 0.6134) < 1e-9
+    assert handler.thread_infeed_q.value() == 29.5
+    assert handler.thread_spring_passes.value() == 3
+
+
+def test_soft_fill_sets_spring_passes_when_zero_and_tolerates_missing_widgets(handler):
+    handler.thread_standard = _Combo({"major": 20.0, "pitch": 4.0, "profile": "tr"})
+    handler.thread_l = None
+    handler.thread_e = None
+    handler._apply_thread_preset()
+    assert handler.thread_spring_passes.value() == 1
+    assert handler.thread_infeed_q.value() == 15.0
+    assert abs(handler.thread_depth.value() - 2.0) < 1e-9
+
+
+def test_force_overwrites_existing_values(handler):
+    handler.thread_standard = _Combo({"major": 12.0, "pitch": 1.75, "profile": "metric"})
+    handler.thread_major_diameter.setValue(99.0)
+    handler.thread_spring_passes.setValue(5)
+    handler._apply_thread_preset(force=True)
+    assert handler.thread_major_diameter.value() == 12.0
+    assert handler.thread_spring_passes.value() == 1
+
+
+class _ItemCombo:
+    def __init__(self):
+        self.items = []
+
+    def blockSignals(self, _flag):
+        pass
+
+    def clear(self):
+        self.items.clear()
+
+    def addItem(self, label, data):
+        self.items.append((label, data))
+
+    def setCurrentIndex(self, _idx):
+        pass
+
+
+def test_standard_options_list_custom_metric_and_tr_presets(handler):
+    handler.thread_standard = _ItemCombo()
+    handler._thread_standard_populated = False
+    handler._current_language_code = lambda: "en"
+    handler._populate_thread_standard_options()
+    labels = [label for label, _data in handler.thread_standard.items]
+    assert labels[0] == "Custom"
+    assert "M10 x 1.5" in labels and "Tr 60 x 10" in labels
+    data = dict(handler.thread_standard.items)["M8 x 1.25"]
+    assert data == {"label": "M8 x 1.25", "major": 8.0, "pitch": 1.25, "profile": "metric"}
+    assert dict(handler.thread_standard.items)["Tr 20 x 4"]["profile"] == "tr"
@@ -0,0 +1,78 @@
+"""Tests für lathe_easystep.ui_flow (G-Code-Job, Listentexte)."""
+import os
+import sys
+from types import SimpleNamespace
+
+from qtpy import QtCore, QtWidgets
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from lathe_easystep import ui_flow
+from lathe_easystep.model import Operation, OpType, ProgramModel
+from lathe_easystep.ui_flow import GcodeJob
+
+
+def test_gcode_job_writes_model_snapshot_in_thread_pool(tmp_path, qapp):
+    model = ProgramModel(gcode_generator=lambda ops, settings: ["%", f"({ops[0].params['x']})", "%"])
+    model.add_operation(Operation(OpType.FACE, {"x": 1}))
+    target = tmp_path / "out.ngc"
+    job = GcodeJob(model.snapshot(), str(target))
+    model.operations[0].params["x"] = 2  # nach dem Snapshot: darf nicht durchschlagen
+    done = []
+    job.signals.finished.connect(done.append)
+    QtCore.QThreadPool.globalInstance().start(job)
+    QtCore.QThreadPool.globalInstance().waitForDone(5000)
+    qapp.processEvents()
+    assert done == [str(target)]
+    assert target.read_text(encoding="utf-8") == "%\n(1)\n%"
+
+
+def test_describe_operation_caches_by_printed_params():
+    ui_flow._describe_cached.cache_clear()
+    cache_info = ui_flow._describe_cached.cache_info
+    op = Operation(OpType.DRILL, {"mode": "normal", "z0": 1.0, "depth": -5.0, "tool": "T02", "feed": 0.1})
+    text = ui_flow.describe_operation(None, op, 2)
+    assert text == "2. Bohren normal (Z 1.0→-5.0) (T02)"
+    op.params["feed"] = 0.2  # nicht Teil des Listentexts -> Cache-Treffer
+    assert ui_flow.describe_operation(None, op, 2) == text
+    assert cache_info().misses == 1
+    op.params["depth"] = -6.0
+    assert ui_flow.describe_operation(None, op, 2) == "2. Bohren normal (Z 1.0→-6.0) (T02)"
+    assert ui_flow.describe_operation(None, op, 3).startswith("3. ")
+    assert cache_info().misses == 3
+    op.params["z0"] = 0.0
+    assert ui_flow.describe_operation(None, op, 2) == "2. Bohren normal (Z 0.0→-6.0) (T02)"
+    op.params["z0"] = -0.0  # 0.0 == -0.0, aber anderer Text
+    assert ui_flow.describe_operation(None, op, 2) == "2. Bohren normal (Z -0.0→-6.0) (T02)"
+    other = Operation("unknown", {"a": 1})
+    before = cache_info()
+    assert ui_flow.describe_operation(None, other, 1) == "1. unknown: {'a': 1}"
+    assert cache_info() == before  # unbekannte Typen werden nicht gecacht
+
+
+def test_generate_gcode_start_failure_leaves_no_wait_cursor(tmp_path, monkeypatch, qapp):
+    class _Pool:
+        def start(self, job):
+            raise RuntimeError("kein Thread frei")
+
+    errors = []
+    monkeypatch.setattr(QtCore.QThreadPool, "globalInstance", staticmethod(lambda: _Pool()))
+    monkeypatch.setattr(QtWidgets.QFileDialog, "getSaveFileName", staticmethod(lambda *a: (str(tmp_path / "p.ngc"), "")))
+    monkeypatch.setattr(QtWidgets.QMessageBox, "critical", staticmethod(lambda *a: errors.append(a[2])))
+    handler = SimpleNamespace(
+        _generating_gcode=False,
+        _gcode_job=None,
+        root_widget=None,
+        model=ProgramModel(),
+        _collect_program_header=lambda: {},
+        _build_program_filepath=lambda name: str(tmp_path / "p.ngc"),
+        _dialog_start_dir=lambda settings, *keys: str(tmp_path),
+        _update_selected_operation=lambda force=False: None,
+        _remember_dialog_path=lambda *a: None,
+        _normalized_file_path=lambda path: path,
+    )
+    monkeypatch.setattr(ui_flow, "prepare_gcode_settings", lambda h: None)
+
+    ui_flow.handle_generate_gcode(handler)
+    assert errors and "kein Thread frei" in errors[0]
+    assert QtWidgets.QApplication.overrideCursor() is None
+    assert handler._generating_gcode is False and handler._gcode_job is None
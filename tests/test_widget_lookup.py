@@ -0,0 +1,299 @@
+"""Tests for the batched widget lookup helpers of HandlerClass."""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+
+class _Widget:
+    def __init__(self, name, idx=None):
+        self._name = name
+        self._idx = idx
+
+    def objectName(self):
+        return self._name
+
+    def property(self, key):
+        return self._idx if key == "idx" else None
+
+
+class _Root(_Widget):
+    def __init__(self, children):
+        super().__init__("easystep")
+        self.children = children
+        self.walks = 0
+
+    def findChildren(self, *_args):
+        self.walks += 1
+        return list(self.children)
+
+
+@pytest.fixture
+def handler(bare_handler):
+    h = bare_handler()
+    h.root_widget = None
+    h._widget_name_cache = {}
+    h._log = lambda *a, **kw: None
+    return h
+
+
+def test_index_named_widgets_resolves_names_and_ids_in_one_walk(handler):
+    add_btn = _Widget("btnAdd", idx=34721)
+    gen_btn = _Widget("btnGenerate", idx="34722")
+    lst = _Widget("listOperations")
+    root = _Root([lst, _Widget("other"), add_btn, gen_btn])
+    handler.root_widget = root
+
+    found = handler._index_named_widgets(names=["listOperations", "btnAdd", "missing"], ids=["34721", "34722"])
+
+    assert root.walks == 1
+    assert found["listOperations"] is lst
+    assert found["btnAdd"] is add_btn
+    assert found["id:34721"] is add_btn
+    assert found["id:34722"] is gen_btn
+    assert "missing" not in found
+
+
+def test_index_named_widgets_uses_name_cache_without_walking(handler):
+    lst = _Widget("listOperations")
+    root = _Root([lst])
+    handler.root_widget = root
+    handler._widget_name_cache = {"listOperations": [lst]}
+
+    found = handler._index_named_widgets(names=["listOperations"])
+
+    assert found == {"listOperations": lst}
+    assert root.walks == 0
+
+
+class _Node:
+    def __init__(self, name, parent=None):
+        self._name = name
+        self._parent = parent
+        self.name_calls = 0
+
+    def objectName(self):
+        self.name_calls += 1
+        return self._name
+
+    def parentWidget(self):
+        return self._parent
+
+
+def test_panel_from_widget_caches_until_reparented(handler):
+    from weakref import WeakKeyDictionary
+
+    panel = _Node("easystep")
+    page = _Node("tabFace", panel)
+    leaf = _Node("face_mode", page)
+    other_panel = _Node("lathe_easystep")
+    handler._in_panel_cache = WeakKeyDictionary()
+
+    assert handler._panel_from_widget(leaf) is panel
+    calls = panel.name_calls
+    assert handler._panel_from_widget(leaf) is panel
+    assert panel.name_calls == calls
+
+    # Reparenting weiter oben in der Kette wird ebenfalls erkannt
+    page._parent = other_panel
+    assert handler._panel_from_widget(leaf) is other_panel
+    leaf._parent = _Node("floating")
+    assert handler._panel_from_widget(leaf) is None
+    assert handler._panel_from_widget(None) is None
+
+    # abgebaute Widgets hält der Cache nicht fest
+    del leaf
+    assert len(handler._in_panel_cache) == 0
+
+
+def test_get_widget_by_name_memoizes_resolved_widgets(handler):
+    from weakref import WeakValueDictionary
+
+    handler._widget_registry = WeakValueDictionary()
+    target = _Widget("thread_pitch")
+    calls = []
+
+    def _resolve(name):
+        calls.append(name)
+        return target if name == "thread_pitch" else None
+
+    handler._resolve_widget_by_name = _resolve
+    assert handler._get_widget_by_name("thread_pitch") is target
+    assert handler._get_widget_by_name("thread_pitch") is target
+    assert handler._get_widget_by_name("missing") is None
+    assert handler._get_widget_by_name("missing") is None
+    assert calls == ["thread_pitch", "missing", "missing"]
+
+    handler.w = None
+    handler._find_root_widget = lambda: None
+    handler._rebuild_widget_name_cache()
+    assert handler._get_widget_by_name("thread_pitch") is target
+    assert calls[-1] == "thread_pitch"
+
+
+def test_rebuild_cache_remembers_first_list_and_tab_widget(handler, qapp):
+    from qtpy import QtWidgets
+
+    root = QtWidgets.QWidget()
+    root.setObjectName("easystep")
+    tabs = QtWidgets.QTabWidget(root)
+    QtWidgets.QTabWidget(root)
+    ops = QtWidgets.QListWidget(root)
+    ops.setObjectName("listOperations")
+
+    handler.root_widget = root
+    handler._rebuild_widget_name_cache()
+
+    assert handler._first_widget_of_type[QtWidgets.QTabWidget] is tabs
+    assert handler._first_widget_of_type[QtWidgets.QListWidget] is ops
+    assert handler._widget_name_cache["listOperations"] == [ops]
+
+
+def test_header_widgets_are_resolved_once_per_panel(handler):
+    from lathe_easystep_handler import _HEADER_WIDGET_NAMES
+
+    root = _Root([])
+    handler.root_widget = root
+    handler.program_unit = _Widget("program_unit")
+    handler.program_shape = _Widget("program_shape")
+    for name in _HEADER_WIDGET_NAMES:
+        setattr(handler, name, None)
+    lookups = []
+
+    def _lookup(name):
+        lookups.append(name)
+        return None if name == "program_chuck_profile" else _Widget(name)
+
+    handler._get_widget_by_name = _lookup
+    handler._startup_complete = False
+    handler._resolve_header_widgets()
+    handler._resolve_header_widgets()
+    # vor dem Start: fehlendes optionales Widget wird erneut gesucht
+    assert lookups.count("program_chuck_profile") == 2
+    assert lookups.count("program_npv") == 1
+
+    handler._startup_complete = True
+    handler._resolve_header_widgets()
+    handler._resolve_header_widgets()
+    assert lookups.count("program_chuck_profile") == 3
+
+
+def test_operation_list_is_styled_once_per_instance(handler, qapp):
+    from qtpy import QtWidgets
+
+    lst = QtWidgets.QListWidget()
+    styled = []
+    lst.setStyleSheet = lambda sheet, orig=lst.setStyleSheet: (styled.append(sheet), orig(sheet))
+
+    for _ in range(3):
+        handler._prepare_list_ops(lst)
+    assert len(styled) == 1
+    assert lst.minimumWidth() == 220
+
+    other = QtWidgets.QListWidget()
+    handler._prepare_list_ops(other)
+    assert handler._list_ops_prepared is other
+
+
+def test_signals_blocked_restores_previous_state_on_error(qapp):
+    from qtpy import QtWidgets
+    from lathe_easystep.ui_widgets import signals_blocked
+
+    table = QtWidgets.QTableWidget()
+    try:
+        with signals_blocked(table, suspend_updates=True):
+            assert table.signalsBlocked() and not table.updatesEnabled()
+            raise ValueError("boom")
+    except ValueError:
+        pass
+    assert not table.signalsBlocked() and table.updatesEnabled()
+
+    table.blockSignals(True)
+    with signals_blocked(table):
+        pass
+    assert table.signalsBlocked()
+
+
+def test_visibility_lookup_remembers_misses_until_cache_rebuild(handler):
+    from lathe_easystep.ui_visibility import _lookup_widget
+
+    hint = _Widget("label_retract_hint")
+    handler.root_widget = _Root([])
+    lookups = []
+    found = {}
+
+    def _get(name):
+        lookups.append(name)
+        return found.get(name)
+
+    handler._get_widget_by_name = _get
+    assert _lookup_widget(handler, "label_retract_hint") is None
+    assert _lookup_widget(handler, "label_retract_hint") is None
+    assert lookups == ["label_retract_hint"]
+
+    found["label_retract_hint"] = hint
+    handler._widget_name_cache = {"label_retract_hint": [hint]}
+    assert _lookup_widget(handler, "label_retract_hint") is hint
+    assert len(lookups) == 2
+
+
+def test_retract_visibility_sets_each_widget_once_per_mode(handler):
+    from lathe_easystep import ui_visibility
+
+    calls = []
+
+    class _Toggle(_Widget):
+        def setVisible(self, visible):
+            calls.append((self._name, visible))
+
+    class _Combo:
+        def __init__(self, idx):
+            self.idx = idx
+
+        def currentIndex(self):
+            return self.idx
+
+    widgets = {name: _Toggle(name) for name in ui_visibility._RETRACT_WIDGET_NAMES}
+    handler.root_widget = _Root([])
+    handler._get_widget_by_name = widgets.get
+    handler.program_retract_mode = _Combo(0)
+
+    ui_visibility.update_retract_visibility(handler)
+    assert len(calls) == len(widgets)
+    assert ("program_xri", False) in calls
+    assert ("program_xra", True) in calls
+
+    calls.clear()
+    ui_visibility.update_retract_visibility(handler)
+    assert calls == []
+
+    ui_visibility.update_retract_visibility(handler, mode_in=2)
+    assert len(calls) == len(widgets)
+    assert all(visible for _name, visible in calls)
+
+
+def test_unit_suffix_classifies_spinboxes_once_per_panel(handler, qapp):
+    from qtpy import QtWidgets
+    from lathe_easystep import ui_visibility
+
+    root = QtWidgets.QWidget()
+    for name in ("face_depth", "face_feed", "program_s1", "thread_infeed_q"):
+        QtWidgets.QDoubleSpinBox(root).setObjectName(name)
+    unit = QtWidgets.QComboBox(root)
+    unit.addItems(["mm", "inch"])
+    handler.root_widget = root
+    handler.program_unit = unit
+    handler._labels_cleaned = True
+
+    walks = []
+    orig = root.findChildren
+    root.findChildren = lambda *a: walks.append(a) or orig(*a)
+    ui_visibility.apply_unit_suffix(handler)
+    unit.setCurrentIndex(1)
+    ui_visibility.apply_unit_suffix(handler)
+
+    suffix = {sb.objectName(): sb.suffix() for sb in orig(QtWidgets.QDoubleSpinBox)}
+    assert suffix == {"face_depth": " inch", "face_feed": " inch/U", "program_s1": "", "thread_infeed_q": " °"}
+    assert len(walks) == 1